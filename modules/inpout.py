@@ -10,9 +10,20 @@ InpOut()
 import os
 import sys
 import re
+import copy
 import argparse
+from functools import lru_cache
 import yaml
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (Environment, FileSystemLoader, TemplateNotFound,
+                    select_autoescape)
+
+# Dispatch YAML parsing and dumping to libyaml, a C backend typically
+# 5-10x faster than the pure-Python loader, whenever it is linked.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+_YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
 
 __author__ = 'Jaewoong Jang'
 __copyright__ = 'Copyright (c) 2024 Jaewoong Jang'
@@ -20,6 +31,47 @@ __license__ = 'MIT License'
 __version__ = '1.0.0'
 __date__ = '2024-05-16'
 
+# A cache of Jinja Environment objects keyed by template directories.
+# Environment construction and template compilation are performed only
+# once per template directory; subsequent save_jinja() calls reuse the
+# cached Environment, whose get_template() in turn memoizes compiled
+# templates (auto_reload=False, cache_size>0).
+_ENV_CACHE = {}
+
+# A cache of parsed YAML dictionaries keyed by the absolute file name,
+# mtime, and size of a YAML file. A file edited between two reads
+# changes its key and thereby invalidates the stale cache entry.
+_YAML_CACHE = {}
+
+
+@lru_cache(maxsize=64)
+def _locate_exe_cached(v, re_exe):
+    """Locate an executable from the path environment variable.
+
+    The PATH walk is idempotent for a given pair of regexes within a
+    process, hence the lru_cache. See InpOut.locate_exe() for the
+    parameter details.
+    """
+    the_located_exe = ''
+    path_re = re.compile(v)
+    exe_re = re.compile(re_exe)
+    path_vals = os.environ.get('PATH', '').split(os.pathsep)
+    for path_val in path_vals:
+        if not path_re.search(path_val):
+            continue
+        # os.scandir() yields directory entries without materializing
+        # the whole file name list as os.listdir() does.
+        try:
+            entries = os.scandir(path_val)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if exe_re.search(entry.name):
+                    the_located_exe = entry.name
+                    return the_located_exe
+    return the_located_exe
+
 
 class InpOut():
     """A file I/O interface class.
@@ -53,9 +105,14 @@ class InpOut():
         Locate an executable from the path environment variable.
     save_df(df, pname, bname, fmts='xlsx')
         Save a pandas DataFrame to multiple file formats.
+    load_template(tpl_fname_full)
+        Load a Jinja template via the per-directory Environment cache.
     save_jinja(context, tpl_fname_full, out_pname, out_bname,
                out_encoding='utf-8')
         Render a Jinja template to an output file.
+    save_jinja_many(contexts, tpl_fname_full, out_pname, out_bnames,
+                    out_encoding='utf-8')
+        Render a Jinja template to multiple output files.
     """
 
     def __init__(self,
@@ -121,7 +178,7 @@ class InpOut():
         -------
         None.
         """
-        fname = re.sub(r'\\', '/', fname)  # Show a consistent path separator.
+        fname = fname.replace('\\', '/')  # Show a consistent path separator.
         msg = f'[{fname}]{verb}'
         mt.show_msg(msg)
 
@@ -152,8 +209,12 @@ class InpOut():
             with open(txt_fname_full, 'w', encoding=yml_encoding) as out_fh:
                 if msg:
                     out_fh.write(msg)
-                out_fh.write(yaml.dump(yml_d,
-                                       sort_keys=False))
+                # Serialize directly to the file handle; this spares the
+                # intermediate string the dump of a large dictionary,
+                # such as a lineage tree, would otherwise be built into.
+                yaml.dump(yml_d, out_fh,
+                          Dumper=_YamlDumper,
+                          sort_keys=False)
             self.show_file_gen(txt_fname_full)
         else:
             if msg:
@@ -162,6 +223,7 @@ class InpOut():
                             is_bordered=True,
                             is_centered=True)
             print(yaml.dump(yml_d,
+                            Dumper=_YamlDumper,
                             sort_keys=False))
 
     def read_yaml(self, yml,
@@ -185,14 +247,31 @@ class InpOut():
         yml_d : dict
             A dictionary containing the content of the YAML file
         """
-        if not os.path.exists(yml):
+        # EAFP: Stat the file right away and handle a missing file in the
+        # exception handler; the stat result doubles as the cache key.
+        try:
+            st = os.stat(yml)
+        except FileNotFoundError:
             msg = f'The designated YAML file [{yml}] could not be located.'
             mt.show_warn(msg)
             if is_yml_required:
                 print(' Terminating.')
                 sys.exit()
-        with open(yml, 'r', encoding=yml_encoding) as fh:
-            yml_d = yaml.load(fh, Loader=yaml.FullLoader)
+            return None
+        # Reuse a previously parsed dictionary if the file is unchanged.
+        # Deep copies isolate both the cache entries and the returned
+        # dictionaries from caller-side mutations.
+        cache_key = (os.path.abspath(yml), st.st_mtime_ns, st.st_size)
+        cached = _YAML_CACHE.get(cache_key)
+        if cached is not None:
+            yml_d = copy.deepcopy(cached)
+        else:
+            # Hand the binary stream to the parser; libyaml reads it in
+            # chunks and detects UTF encodings internally, bypassing the
+            # Python-level TextIOWrapper decoding on the hot path.
+            with open(yml, 'rb') as fh:
+                yml_d = yaml.load(fh, Loader=_YamlLoader)
+            _YAML_CACHE[cache_key] = copy.deepcopy(yml_d)
         if is_echo:
             msg = f'Content of [{yml}]'
             self.dump_yaml(yml_d,
@@ -233,16 +312,25 @@ class InpOut():
         -------
         None.
         """
-        dname = re.sub(r'\\', '/', dname)  # Use a consistent path separator.
-        if not os.path.exists(dname):
-            is_mk_dir = True  # Forcible directory creation for is_yn == False
-            if is_yn:
-                q = (f'The designated directory [{dname}] not found.'
-                     + ' Create (y/n)? ')
-                is_mk_dir = mt.invoke_yn_prompt(q)
-            if is_mk_dir:
-                os.mkdir(dname)
-                self.show_file_gen(dname)
+        dname = dname.replace('\\', '/')  # Use a consistent path separator.
+        if is_yn:
+            # The existence probe is retained here as the y/n prompt must
+            # be invoked only for a nonexistent directory.
+            if os.path.exists(dname):
+                return
+            q = (f'The designated directory [{dname}] not found.'
+                 + ' Create (y/n)? ')
+            is_mk_dir = mt.invoke_yn_prompt(q)
+            if not is_mk_dir:
+                return
+        # EAFP: Attempt the directory creation right away and treat an
+        # already existing directory as the no-op case, saving a stat()
+        # syscall per call and avoiding a TOCTOU race.
+        try:
+            os.mkdir(dname)
+        except FileExistsError:
+            return
+        self.show_file_gen(dname)
 
     def locate_exe(self, v, re_exe):
         """Locate an executable from the path environment variable.
@@ -260,19 +348,10 @@ class InpOut():
         the_located_exe : str
             The file name of the located executable.
         """
-        the_located_exe = ''
-        path_vals = re.split(';', os.environ['path'])
-        for path_val in path_vals:
-            if re.search(v, path_val):
-                fnames_in_the_found_path = os.listdir(path_val)
-                for fname in fnames_in_the_found_path:
-                    if re.search(re_exe, fname):
-                        the_located_exe = fname
-                        break
-        return the_located_exe
+        return _locate_exe_cached(v, re_exe)
 
     def save_df(self, df, pname, bname,
-                is_noheader=False, is_noindex=False,
+                is_noheader=False, is_noindex=False, is_styled=True,
                 fmt='xlsx', xl_sheet_name='library', xml_parser='etree'):
         """Save a pandas DataFrame to multiple file formats.
 
@@ -288,6 +367,11 @@ class InpOut():
             Suppress the DF header in output files. The default is False.
         is_noindex : bool, optional
             Suppress the DF index in output files. The default is False.
+        is_styled : bool, optional
+            Apply a background color gradient to an output Excel file.
+            Consider toggling this off for a large DF, as the gradient
+            Styler materializes a style per cell in pure Python.
+            The default is True.
         fmt : str, optional
             The file format to be saved. The default is 'xlsx'.
         xl_sheet_name : str, optional
@@ -299,55 +383,93 @@ class InpOut():
         -------
         None.
         """
-        cmds = {
-            'csv': {
-                'method': getattr(df, 'to_csv'),
-            },
-            'html': {
-                'method': getattr(df, 'to_html'),
-            },
-            'xml': {
-                'method': getattr(df, 'to_xml'),
-                'kwargs': dict(index=False, parser=xml_parser),
-            },
-            'tex': {
-                'method': getattr(df, 'to_latex'),
-            },
-            'xlsx': {
-                'method': getattr(df.style.background_gradient(), 'to_excel'),
-                'kwargs': dict(sheet_name=xl_sheet_name),
-            },
-        }
-        if is_noheader or is_noindex:
-            for cmd in cmds:
-                if 'kwargs' not in cmds[cmd]:
-                    cmds[cmd]['kwargs'] = {}
-                if is_noheader:
-                    cmds[cmd]['kwargs']['header'] = False
-                if is_noindex:
-                    cmds[cmd]['kwargs']['index'] = False
-        kwargs_common = dict(encoding='utf8')
-        if fmt not in cmds.keys():
+        # Materialize only the writer method of the requested format;
+        # in particular, the per-cell gradient Styler of the xlsx writer
+        # is built exclusively when the xlsx format is requested.
+        if fmt == 'csv':
+            method = df.to_csv
+            kwargs = {}
+        elif fmt == 'html':
+            method = df.to_html
+            kwargs = {}
+        elif fmt == 'xml':
+            method = df.to_xml
+            kwargs = dict(index=False, parser=xml_parser)
+        elif fmt == 'tex':
+            method = df.to_latex
+            kwargs = {}
+        elif fmt == 'xlsx':
+            if is_styled:
+                method = df.style.background_gradient().to_excel
+            else:
+                method = df.to_excel
+            kwargs = dict(sheet_name=xl_sheet_name)
+        else:
             msg = f'The format [{fmt}] is not supported; skipping.'
             mt.show_warn(msg)
             return
-        try:
-            cmds[fmt]['kwargs'].update(kwargs_common)
-        except KeyError:
-            cmds[fmt]['kwargs'] = kwargs_common
+        if is_noheader:
+            kwargs['header'] = False
+        if is_noindex:
+            kwargs['index'] = False
+        # to_excel and to_latex do not accept an encoding keyword in
+        # current pandas; inject it only for the writers that do.
+        if fmt in ('csv', 'html', 'xml'):
+            kwargs.setdefault('encoding', 'utf8')
         out_fname_full = f'{pname}/{bname}.{fmt}'
-        if re.search('(?i)xlsx', fmt):
+        if fmt == 'xlsx':
             try:
-                cmds[fmt]['method'](out_fname_full,
-                                    **cmds[fmt]['kwargs'])
+                method(out_fname_full,
+                       **kwargs)
             except ModuleNotFoundError as e:
                 print('Excel writing failed: {}'.format(e))
                 return
         else:
-            cmds[fmt]['method'](out_fname_full,
-                                **cmds[fmt]['kwargs'])
+            method(out_fname_full,
+                   **kwargs)
         self.show_file_gen(out_fname_full)
 
+    def load_template(self, tpl_fname_full):
+        """Load a Jinja template via the per-directory Environment cache.
+
+        Parameters
+        ----------
+        tpl_fname_full : str
+            A full-path file name for a Jinja template.
+
+        Returns
+        -------
+        template : jinja2.Template or None
+            A compiled Jinja template, or None for a template file that
+            could not be located.
+        """
+        tpl_dname, tpl_fname = os.path.split(tpl_fname_full)
+        # The Environment object is cached per template directory so that
+        # batch rendering does not recompile the same template repeatedly.
+        env = _ENV_CACHE.get(tpl_dname)
+        if env is None:
+            # Autoescaping is confined to markup templates; plain-text
+            # templates render on Jinja's fast non-escaping path without
+            # a per-substitution Markup wrapper.
+            env = _ENV_CACHE.setdefault(
+                tpl_dname,
+                Environment(loader=FileSystemLoader(tpl_dname),
+                            autoescape=select_autoescape(
+                                enabled_extensions=('html', 'htm', 'xml'),
+                                default=False),
+                            auto_reload=False,
+                            cache_size=400))
+        # EAFP template validation: A missing template file surfaces as
+        # TemplateNotFound, sparing a pre-flight stat() per rendering.
+        try:
+            template = env.get_template(tpl_fname)
+        except TemplateNotFound:
+            msg = (f'The designated Jinja template file [{tpl_fname_full}]'
+                   + ' could not be located; rendering will be skipped.')
+            mt.show_warn(msg)
+            return None
+        return template
+
     def save_jinja(self, context, tpl_fname_full, out_pname, out_bname,
                    out_encoding='utf-8'):
         """Render a Jinja template to an output file.
@@ -369,27 +491,60 @@ class InpOut():
         -------
         None.
         """
-        # Template validation
-        if not os.path.exists(tpl_fname_full):
-            msg = (f'The designated Jinja template file [{tpl_fname_full}]'
-                   + ' could not be located; rendering will be skipped.')
-            mt.show_warn(msg)
+        # Load the user-designated Jinja template.
+        template = self.load_template(tpl_fname_full)
+        if template is None:
             return
 
         # I/O preprocessing
-        tpl_dname, tpl_fname = os.path.split(tpl_fname_full)
+        tpl_fname = os.path.basename(tpl_fname_full)
         out_fname = f'{out_bname}_{tpl_fname}'
         out_fname_full = f'{out_pname}/{out_fname}'
-
-        # Load the user-designated Jinja template.
-        env = Environment(loader=FileSystemLoader(tpl_dname),
-                          autoescape=select_autoescape())
-        template = env.get_template(tpl_fname)
         with open(out_fname_full, mode='w',
                   encoding=out_encoding) as out_fh:
             out_fh.write(template.render(context))
             self.show_file_gen(out_fname_full)
 
+    def save_jinja_many(self, contexts, tpl_fname_full, out_pname, out_bnames,
+                        out_encoding='utf-8'):
+        """Render a Jinja template to multiple output files.
+
+        Parameters
+        ----------
+        contexts : list
+            Context dictionaries for Jinja rendering, parallel with
+            out_bnames.
+        tpl_fname_full : str
+            A full-path file name for a Jinja template.
+        out_pname : str
+            The path to which the rendered files will be saved.
+        out_bnames : list
+            The base names of the rendered files.
+        out_encoding : str, optional
+            The encoding of the rendered files. The default is 'utf-8'.
+
+        Returns
+        -------
+        None.
+        """
+        # Load the user-designated Jinja template; the template lookup
+        # and compilation costs are amortized over the whole batch.
+        template = self.load_template(tpl_fname_full)
+        if template is None:
+            return
+
+        tpl_fname = os.path.basename(tpl_fname_full)
+        for context, out_bname in zip(contexts, out_bnames):
+            out_fname = f'{out_bname}_{tpl_fname}'
+            out_fname_full = f'{out_pname}/{out_fname}'
+            with open(out_fname_full, mode='w',
+                      encoding=out_encoding) as out_fh:
+                # Stream the rendered output in chunks rather than
+                # materializing the whole string, keeping the memory
+                # footprint constant even for large outputs.
+                template.stream(context).dump(out_fh)
+                self.show_file_gen(out_fname_full)
+
 
 if __name__ == '__main__':
     import mytoolkit as mt
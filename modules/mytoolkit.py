@@ -6,8 +6,10 @@ the author in his Python programs.
 
 Functions
 ---------
-get_borders(border_len=70)
-    Create a list of display borders.
+get_border(symb, border_len=70)
+    Return a display border memoized per symbol and length.
+get_border_dashed(symb, border_len=70)
+    Return a dashed display border memoized per symbol and length.
 get_now(ymd_directive='%B %d, %Y', hms_directive='%H:%M:%S',
         ymd_preposition='', hms_preposition='',
         is_ymd_wo_leading_zeros=True, is_append_utc=True)
@@ -35,7 +37,10 @@ show_front_matter(prog_info, is_prog=True, is_auth=True)
 import sys
 import re
 import time
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from itertools import combinations
+import numpy as np
 
 __author__ = 'Jaewoong Jang'
 __copyright__ = 'Copyright (c) 2024 Jaewoong Jang'
@@ -43,25 +48,57 @@ __license__ = 'MIT License'
 __version__ = '1.0.0'
 __date__ = '2024-05-22'
 
-BORDERS = {}
+# Regexes precompiled at module load for frequently invoked utilities
+_YN_RE = re.compile(r'\b\s*[yn]\s*\b', re.I)
+_Y_RE = re.compile(r'y', re.I)
+_PYVER_RE = re.compile(r'^([0-9.]+).*')
 
+# The Python version is constant throughout the process; extract it once
+# at module load rather than per front-matter print.
+_PY_VER = _PYVER_RE.sub(r'\1', sys.version)
 
-def get_borders(border_len=70):
-    """Create a list of display borders.
+# The platform-specific strftime flag suppressing leading zeros
+_NO_PAD = '#' if sys.platform == 'win32' else '-'
+
+
+@lru_cache(maxsize=None)
+def get_border(symb,
+               border_len=70):
+    """Return a display border memoized per symbol and length.
 
     Parameters
     ----------
+    symb : str
+        The symbol of a display border.
     border_len : int, optional
         The length of display borders. The default is 70.
 
     Returns
     -------
-    None.
+    str
+        A display border.
     """
-    border_symbs = ['+', '-', '*', '#']
-    for symb in border_symbs:
-        BORDERS[symb] = symb * border_len
-        BORDERS['{symb}-'] = symb + '-' * (border_len - 1)
+    return symb * border_len
+
+
+@lru_cache(maxsize=None)
+def get_border_dashed(symb,
+                      border_len=70):
+    """Return a dashed display border memoized per symbol and length.
+
+    Parameters
+    ----------
+    symb : str
+        The leading symbol of a dashed display border.
+    border_len : int, optional
+        The length of display borders. The default is 70.
+
+    Returns
+    -------
+    str
+        A dashed display border.
+    """
+    return symb + '-' * (border_len - 1)
 
 
 def get_now(ymd_directive='%B %d, %Y', hms_directive='%H:%M:%S',
@@ -91,22 +128,28 @@ def get_now(ymd_directive='%B %d, %Y', hms_directive='%H:%M:%S',
         The current time in a formated string.
     """
     now = time.localtime()
-    ymd = time.strftime(ymd_directive, now)
     if is_ymd_wo_leading_zeros:
-        ymd_wo_leading_zeros = [s.lstrip('0') for s in ymd.split(' ')]
-        ymd = ' '.join(ymd_wo_leading_zeros)
+        # Let strftime suppress the leading zeros of month and day in
+        # one C call instead of post-processing the formatted string.
+        ymd_directive = (ymd_directive
+                         .replace('%d', f'%{_NO_PAD}d')
+                         .replace('%m', f'%{_NO_PAD}m'))
+    ymd = time.strftime(ymd_directive, now)
     hms = time.strftime(hms_directive, now)
     now_is = '{}{} {}{}'.format(ymd_preposition, ymd, hms_preposition, hms)
     if is_append_utc:
-        utc = re.sub('([0-9]{2})([0-9]{2})', r'\1:\2',
-                     time.strftime('%z', now))
+        # e.g. '+0900' -> '+09:00'; the offset is a fixed-width field,
+        # so slicing replaces the former regex substitution.
+        utc = time.strftime('%z', now)
+        if utc:
+            utc = '{}:{}'.format(utc[:3], utc[3:])
         now_is += ' (UTC{})'.format(utc)
     return now_is
 
 
 def get_target_sum(tgt_sum, objs, r,
                    unc=0):
-    """Find a target sum from a pool of candidates using brute-force search.
+    """Find a target sum from a pool of candidates using binary search.
 
     Parameters
     ----------
@@ -117,7 +160,7 @@ def get_target_sum(tgt_sum, objs, r,
     r : int
         The number of choosing objects.
     unc : float, optional
-        Uncertainty of the brute-force search. The default is 0.
+        Uncertainty of the target sum search. The default is 0.
 
     Returns
     -------
@@ -125,8 +168,72 @@ def get_target_sum(tgt_sum, objs, r,
         Combinations of objects leading to the target sum within
         the limit of uncertainty.
     """
-    combos = [combo for combo in combinations(objs, r)
-              if abs(sum(combo) - tgt_sum) <= unc]
+    #
+    # Meet-in-the-middle search
+    # - Split the candidate pool into two halves and enumerate partial
+    #   combinations of each half.
+    # - Sort the partial sums of the first half, and locate, for each
+    #   partial combination of the second half, the complementary sums
+    #   of the first half by binary search.
+    # - This reduces the search space from C(n, r) full combinations to
+    #   partial combinations of roughly the square root of that size.
+    #
+    half = len(objs) // 2
+    objs_a = objs[:half]
+    objs_b = objs[half:]
+    is_numeric = all(isinstance(obj, (int, float)) for obj in objs)
+    combos = []
+    for r_a in range(r + 1):  # The number of objects taken from objs_a
+        r_b = r - r_a  # The number of objects taken from objs_b
+        if r_a > len(objs_a) or r_b > len(objs_b):
+            continue
+        # Pairs of a partial sum and its combination, sorted by the sums
+        pairs_a = sorted((sum(combo_a), combo_a)
+                         for combo_a in combinations(objs_a, r_a))
+        sums_a = [pair_a[0] for pair_a in pairs_a]
+        combos_b = list(combinations(objs_b, r_b))
+        #
+        # (i) Numeric candidates
+        # Compute the partial sums of the second half and locate their
+        # complementary windows in the first half with a single pair of
+        # vectorized searchsorted calls, moving the per-combination sum
+        # and binary search from Python bytecode to C loops.
+        #
+        if is_numeric:
+            # Widen the complementary windows by a small epsilon;
+            # sum_a + sum_b can round differently from sum(combo), which
+            # would otherwise drop combinations lying exactly at the
+            # tolerance boundary. Each candidate is re-validated with
+            # the exact predicate before being collected.
+            eps = 1e-9 * max(1.0, abs(tgt_sum))
+            sums_a_arr = np.asarray(sums_a, dtype=np.float64)
+            sums_b = np.fromiter(map(sum, combos_b),
+                                 dtype=np.float64,
+                                 count=len(combos_b))
+            ord_llims = np.searchsorted(sums_a_arr,
+                                        tgt_sum - sums_b - unc - eps,
+                                        side='left')
+            ord_ulims = np.searchsorted(sums_a_arr,
+                                        tgt_sum - sums_b + unc + eps,
+                                        side='right')
+            for combo_b, ord_llim, ord_ulim in zip(combos_b,
+                                                   ord_llims, ord_ulims):
+                for _, combo_a in pairs_a[ord_llim:ord_ulim]:
+                    combo = combo_a + combo_b
+                    if abs(sum(combo) - tgt_sum) <= unc:
+                        combos.append(combo)
+        #
+        # (ii) Nonnumeric candidates (any summable objects)
+        #
+        else:
+            for combo_b in combos_b:
+                # The window of first-half sums complementing the sum of
+                # the second-half combination in question
+                complement = tgt_sum - sum(combo_b)
+                ord_llim = bisect_left(sums_a, complement - unc)
+                ord_ulim = bisect_right(sums_a, complement + unc)
+                for _, combo_a in pairs_a[ord_llim:ord_ulim]:
+                    combos.append(combo_a + combo_b)
     return combos
 
 
@@ -166,33 +273,47 @@ def merge(destination, source):
     This function was inspired by the one posted at:
     https://stackoverflow.com/a/20666342
     """
-    for k, v in source.items():
-        if isinstance(v, dict):
-            node = destination.setdefault(k, {})
-            merge(node, v)
-        else:
-            destination[k] = v
+    # An explicit stack of (destination, source) pairs in place of
+    # recursion; this removes the per-level frame creation cost and
+    # lifts the recursion cap for deeply nested dictionaries.
+    stack = [(destination, source)]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            if isinstance(v, dict):
+                stack.append((dst.setdefault(k, {}), v))
+            else:
+                dst[k] = v
     return destination
 
 
-def pause_shell(second):
+def pause_shell(second,
+                is_verbose=True):
     """Pause the shell during the designated time expressed in second.
 
     Parameters
     ----------
     sec : int
         The waiting time expressed in second.
+    is_verbose : bool, optional
+        If True, a per-second countdown will be displayed. If False,
+        the wait is served by a single sleep call without any shell
+        output, which suits scripted runs. The default is True.
 
     Returns
     -------
     None.
     """
     second = int(second)
+    if not is_verbose:
+        time.sleep(second)
+        return
     for remaining in range(second, 0, -1):
         sys.stdout.write('\r')
         sys.stdout.write(f'Waiting for [{remaining} s]...')
         sys.stdout.flush()
         time.sleep(1)
+    sys.stdout.write('\n')
 
 
 def invoke_yn_prompt(msg='Run (y/n)? '):
@@ -212,9 +333,9 @@ def invoke_yn_prompt(msg='Run (y/n)? '):
     is_y = False
     while True:
         yn = input(msg)
-        if not re.search(r'(?i)\b\s*[yn]\s*\b', yn):
+        if not _YN_RE.search(yn):
             continue
-        if re.search(r'(?i)y', yn):
+        if _Y_RE.search(yn):
             is_y = True
         break
     return is_y
@@ -237,7 +358,10 @@ def centering(s,
     s_centered : str
         A centered string.
     """
-    s_centered = ' ' * int((ref_len - len(s)) / 2) + s
+    # str.rjust pads in a single C-level allocation and, unlike manual
+    # space multiplication, degrades gracefully to the input string when
+    # the string is longer than the reference length.
+    s_centered = s.rjust((ref_len + len(s)) // 2)
     return s_centered
 
 
@@ -263,10 +387,10 @@ def show_msg(msg,
     """
     the_msg = centering(msg) if is_centered else msg
     if is_bordered:
-        print(BORDERS[border_symb])
+        print(get_border(border_symb))
     print(the_msg)
     if is_bordered:
-        print(BORDERS[border_symb])
+        print(get_border(border_symb))
 
 
 def show_warn(msg):
@@ -304,7 +428,7 @@ def show_front_matter(prog_info,
     """
     msg = ''
     if is_prog:
-        py_ver = re.sub('^([0-9.]+).*', r'\1', sys.version)
+        py_ver = _PY_VER
         prog_info_msg = [
             '{}: {}'.format(prog_info['name'], prog_info['desc']),
             '{} v{} ({})'.format(prog_info['name'], prog_info['vers'],
@@ -323,6 +447,5 @@ def show_front_matter(prog_info,
              border_symb='+', is_bordered=True)
 
 
-get_borders()
 if __name__ == '__main__':
     show_warn('You are running me directly.')
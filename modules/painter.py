@@ -9,11 +9,20 @@ Painter()
 
 import os
 import re
+import atexit
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import rcParams, patches
 from matplotlib.ticker import AutoMinorLocator
 from matplotlib.lines import Line2D
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None
 
 __author__ = 'Jaewoong Jang'
 __copyright__ = 'Copyright (c) 2024 Jaewoong Jang'
@@ -21,6 +30,293 @@ __license__ = 'MIT License'
 __version__ = '1.0.0'
 __date__ = '2024-05-22'
 
+# Regexes precompiled at module load for per-figure and per-row hot paths
+_RE_EFF = re.compile(r'efficiency', re.I)
+_RE_EFF_FIT = re.compile(r'efficiency_fit', re.I)
+_RE_EFF_DATA_CALC = re.compile(r'efficiency_data|calc', re.I)
+_RE_DATA = re.compile(r'data', re.I)
+_RE_EFF_ANNOT_CALC = re.compile(r'efficiency_annot|calc', re.I)
+_RE_SPECTRUM = re.compile(r'spectrum|line', re.I)
+_RE_RN = re.compile(r'rn|marker', re.I)
+_RE_EVERY = re.compile(r'every|both', re.I)
+_RE_GROUPED = re.compile(r'grouped|both', re.I)
+_RE_TCS_PAIR = re.compile(r'[0-9.]+\s*[+]\s*[0-9.]+')
+_RE_TCS_SPLIT = re.compile(r'\s*[+]\s*')
+_RE_TCS_FLAG = re.compile(r't(rue\s+)?c(oincidence\s+)?s(umming)?', re.I)
+_RE_DIGITS = re.compile('([0-9]+)')
+_RE_REG_SKIP = re.compile(r'^\s*#|^$')
+_RE_REG_SEP = re.compile(r'\s*;\s*')
+# Decay mode to upright greek letter mappings
+_DM_ALPHA_TRANS = str.maketrans({'A': 'α'})
+_RE_DM_BETA = re.compile('B([+-]?)')
+_RE_NONE = re.compile(r'none', re.I)
+_RE_EMF = re.compile(r'emf', re.I)
+_RE_EXE_EXT = re.compile(r'[.]exe"?$', re.I)
+
+
+@lru_cache(maxsize=None)
+def _get_sep_re(sep):
+    """Compile and memoize the splitting regex of a separator."""
+    return re.compile(r'\s*[{}]\s*'.format(sep))
+
+
+# All marker symbols known to MPL, in their registration order
+_ALL_MPL_MARKERS = tuple(Line2D.markers.keys())
+# PDF versions accepted by the Ghostscript -dCompatibilityLevel switch
+_VALID_GS_PDF_VERS = frozenset(v / 10 for v in range(13, 18))
+_VALID_GS_PDF_VERS_STR = ', '.join(map(str, sorted(_VALID_GS_PDF_VERS)))
+# Persistent Ghostscript processes keyed by the executable and the PDF
+# version, shared across Painter instances and shut down at exit
+_GS_PROCS = {}
+_GS_JOB_DONE = '__GS_JOB_DONE__'
+# Serializes the jobs fed to the persistent Ghostscript processes.
+_GS_LOCK = threading.Lock()
+# Shared thread pool for PDF postprocessing; the work is subprocess-bound,
+# hence threads rather than processes
+_POSTPROC_POOL = None
+
+
+def _get_postproc_pool():
+    """Return the shared postprocessing thread pool, creating it lazily."""
+    global _POSTPROC_POOL
+    if _POSTPROC_POOL is None:
+        _POSTPROC_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+        # atexit runs its callbacks in LIFO order; as the pool is created
+        # after the module-import registration of _close_gs_procs, pending
+        # jobs are drained before the Ghostscript processes are shut down.
+        atexit.register(_POSTPROC_POOL.shutdown)
+    return _POSTPROC_POOL
+
+
+def _ps_fname(fname):
+    """Escape a file name for use as a PostScript string literal."""
+    return (fname.replace('\\', '/')
+            .replace('(', r'\(').replace(')', r'\)'))
+
+
+def _get_gs_proc(gs_exe, gs_pdf_ver):
+    """Return a persistent Ghostscript process, spawning one if needed.
+
+    Parameters
+    ----------
+    gs_exe : str
+        A full-path Ghostscript executable.
+    gs_pdf_ver : float
+        The version the postprocessed PDF files will have.
+
+    Returns
+    -------
+    proc : subprocess.Popen or None
+        A running Ghostscript process reading PostScript jobs from its
+        stdin, or None if the process could not be spawned.
+    """
+    key = (gs_exe, gs_pdf_ver)
+    proc = _GS_PROCS.get(key)
+    if proc is not None and proc.poll() is None:
+        return proc
+    gs_cmd = [
+        gs_exe,
+        '-dNOSAFER',  # Allow writing the per-job output files.
+        '-dNOPAUSE',
+        '-q',
+        '-sDEVICE=pdfwrite',
+        '-dCompatibilityLevel={}'.format(gs_pdf_ver),
+        '-dSubsetFonts=true',
+        '-dEmbedAllFonts=true',
+        # Do not rotate the PDF file even if the height is greater
+        # than the width, which can happen in figures where the
+        # legends are placed outside the Axes.
+        # https://ghostscript.com/docs/9.54.0/VectorDevices.htm
+        '-dAutoRotatePages=/None',
+        '-sOutputFile={}'.format(os.devnull),
+        '-',  # Read PostScript jobs from stdin.
+    ]
+    try:
+        proc = subprocess.Popen(gs_cmd,
+                                stdin=subprocess.PIPE,
+                                stdout=subprocess.PIPE)
+    except OSError:
+        return None
+    _GS_PROCS[key] = proc
+    return proc
+
+
+def _close_gs_procs():
+    """Shut down, if any, the persistent Ghostscript processes."""
+    for proc in _GS_PROCS.values():
+        if proc.poll() is None:
+            try:
+                proc.stdin.write(b'quit\n')
+                proc.stdin.close()
+            except OSError:
+                pass
+            proc.wait()
+    _GS_PROCS.clear()
+
+
+atexit.register(_close_gs_procs)
+
+# Persistent Inkscape shell processes keyed by the executable
+_INKSCAPE_PROCS = {}
+
+
+def _wait_inkscape_prompt(proc):
+    """Consume the output of an Inkscape shell up to its next prompt.
+
+    Parameters
+    ----------
+    proc : subprocess.Popen
+        A running Inkscape process in shell mode.
+
+    Returns
+    -------
+    bool
+        True once the prompt has been reached, and False if the process
+        died before printing one.
+    """
+    buf = b''
+    while True:
+        byte = proc.stdout.read(1)
+        if not byte:
+            return False
+        buf += byte
+        if buf.endswith(b'> '):
+            return True
+
+
+def _get_inkscape_proc(inkscape_exe):
+    """Return a persistent Inkscape shell process, spawning one if needed.
+
+    Parameters
+    ----------
+    inkscape_exe : str
+        A full-path Inkscape executable.
+
+    Returns
+    -------
+    proc : subprocess.Popen or None
+        A running Inkscape process reading action lines from its stdin,
+        or None if shell mode could not be brought up.
+    """
+    proc = _INKSCAPE_PROCS.get(inkscape_exe)
+    if proc is not None and proc.poll() is None:
+        return proc
+    try:
+        proc = subprocess.Popen([inkscape_exe, '--shell'],
+                                stdin=subprocess.PIPE,
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL)
+    except OSError:
+        return None
+    # Consume the banner and the first prompt so that each job can wait
+    # for exactly one prompt of its own.
+    if not _wait_inkscape_prompt(proc):
+        return None
+    _INKSCAPE_PROCS[inkscape_exe] = proc
+    return proc
+
+
+def _close_inkscape_procs():
+    """Shut down, if any, the persistent Inkscape processes."""
+    for proc in _INKSCAPE_PROCS.values():
+        if proc.poll() is None:
+            try:
+                proc.stdin.write(b'quit\n')
+                proc.stdin.close()
+            except OSError:
+                pass
+            proc.wait()
+    _INKSCAPE_PROCS.clear()
+
+
+atexit.register(_close_inkscape_procs)
+
+# Resolved external executables keyed by the designated path and the
+# search patterns; the paths do not change during a run, so the
+# filesystem walks are paid once rather than once per figure.
+_RESOLVED_EXES = {}
+
+
+def _resolve_exe(designated, dir_pat, fname_pat, tool):
+    """Resolve an external executable, memoizing the result.
+
+    Parameters
+    ----------
+    designated : str
+        A user-designated executable path tried first.
+    dir_pat : str
+        A regex for candidate directories on the path environment
+        variable.
+    fname_pat : str
+        A regex for candidate executable file names.
+    tool : str
+        The tool name used in the fallback warning message.
+
+    Returns
+    -------
+    exe : str or None
+        A resolved executable path, or None if none could be located.
+    """
+    key = (designated, dir_pat, fname_pat)
+    if key in _RESOLVED_EXES:
+        return _RESOLVED_EXES[key]
+    exe = None
+    if os.path.exists(designated):
+        exe = designated
+    else:
+        exe_on_environ_var = io.locate_exe(dir_pat, fname_pat)
+        if exe_on_environ_var:
+            msg = (f'The designated {tool} executable [{designated}]'
+                   + ' could not be located,\nbut its alternative'
+                   + f' [{exe_on_environ_var}] was found'
+                   + ' in the path environment variable.'
+                   + ' We fall back to this executable.')
+            mt.show_warn(msg)
+            exe = exe_on_environ_var
+    _RESOLVED_EXES[key] = exe
+    return exe
+
+
+@lru_cache(maxsize=None)
+def _compile_fmt(fmt):
+    """Compile and memoize an annotation label format expression."""
+    return compile(fmt, '<fmt>', 'eval')
+
+
+def _cutoff_mask(nrg_sums, eps,
+                 nrg_los, nrg_his, ep_los, ep_his):
+    """Mask the data points lying inside any cutoff window.
+
+    Parameters
+    ----------
+    nrg_sums : numpy.ndarray
+        An array of radiation energies, with TCS energies summed.
+    eps : numpy.ndarray
+        An array of emission probabilities with NaN mapped to zero.
+    nrg_los, nrg_his : numpy.ndarray
+        Arrays of the lower and upper energy bounds of cutoff windows.
+    ep_los, ep_his : numpy.ndarray
+        Arrays of the lower and upper emission probability bounds of
+        cutoff windows.
+
+    Returns
+    -------
+    numpy.ndarray
+        A boolean array flagging the data points falling in at least
+        one cutoff window.
+    """
+    return ((nrg_sums[:, None] >= nrg_los)
+            & (nrg_sums[:, None] <= nrg_his)
+            & (eps[:, None] >= ep_los)
+            & (eps[:, None] <= ep_his)).any(axis=1)
+
+
+@lru_cache(maxsize=None)
+def _sortkey_nat_cached(s):
+    """Decompose and memoize a string for natural sorting."""
+    return tuple(int(t) if t.isdigit() else t.lower()
+                 for t in _RE_DIGITS.split(s))
+
 
 class Painter():
     """A figure interface class.
@@ -48,6 +344,10 @@ class Painter():
     set_markers(self, mrks_def, mrks_dflt, sep1=',', sep2='+',
                 is_verbose=False)
         Create a dictionary of marker attributes using one-line strings.
+    _load_marker_registry(registry_fname_full, mrks_dflt)
+        Load a marker registry file with mtime-based caching.
+    _mk_dir_once(path)
+        Generate a directory, skipping paths already generated.
     plot_radiat_spectr(fig, ax, p, df, cols,
                        x='energy', y='emission_probability',
                        plot_type='spectrum',
@@ -76,8 +376,14 @@ class Painter():
         None.
         """
         plt.style.use(dflt_style_sheet)
-        _artists = ['title']
+        _artists = ['title', 'xaxis', 'yaxis']
         self.is_drawn = {a: False for a in _artists}
+        # Parsed marker registries keyed by the file name and mtime
+        self._marker_registry_cache = {}
+        # Nuclide notation labels keyed by radionuclide names
+        self._lab_rn_cache = {}
+        # Output directories already generated via _mk_dir_once()
+        self._dirs_ensured = set()
 
     def sortkey_nat(self, s,
                     tup_ordinal=0):
@@ -92,8 +398,8 @@ class Painter():
 
         Returns
         -------
-        naturalized : list
-            A list containing the subcomponents of the input string.
+        naturalized : tuple
+            A tuple containing the subcomponents of the input string.
 
         Notes
         -----
@@ -103,9 +409,9 @@ class Painter():
         # For a tuple, use one of its elements.
         if isinstance(s, tuple):
             s = s[tup_ordinal]
-        naturalized = [int(t) if t.isdigit() else t.lower()
-                       for t in re.split('([0-9]+)', s)]
-        return naturalized
+        # The decomposition is memoized so that recurring labels, as in
+        # legend re-sorts across plots, are split only once.
+        return _sortkey_nat_cached(s)
 
     def sort_legend(self, handles, labels,
                     is_reverse=False):
@@ -162,6 +468,10 @@ class Painter():
         #
         if 'style_sheet' in d:
             plt.style.use(d['style_sheet'])
+        # Let the Agg renderer split long line paths into chunks, which
+        # speeds up rasterization of many-channel spectra. User-designated
+        # rc_params take precedence.
+        rcParams['agg.path.chunksize'] = 10000
         if 'rc_params' in d and d['rc_params'] is not None:
             self.set_rc_params(d['rc_params'])
 
@@ -173,7 +483,7 @@ class Painter():
             facecolors = []
             if 'hatches' in d['bar']:
                 for hatch in d['bar']['hatches']:
-                    hatch = None if re.search('(?i)none', hatch) else hatch
+                    hatch = None if _RE_NONE.search(hatch) else hatch
                     hatches.append(hatch)
             if 'facecolors' in d['bar']:
                 facecolors += d['bar']['facecolors']
@@ -221,23 +531,20 @@ class Painter():
             # Split a one-line marker specification string into
             # marker attribute specifications.
             #
-            mlist = re.split(r'\s*[{}]\s*'.format(sep1), m)
+            mlist = _get_sep_re(sep1).split(m)
             #
             # Attribute 1: marker symbol
             #
-            try:
-                # Integer markers; e.g. 4 (CARETLEFT), 5 (CARETRIGHT), ...
-                # Exception: "8" for octagon
-                if not re.search('8', mlist[0]):
-                    mlist[0] = int(mlist[0])
-            except ValueError:
-                pass
+            # Integer markers; e.g. 4 (CARETLEFT), 5 (CARETRIGHT), ...
+            # Exception: "8" for octagon
+            if mlist[0].isdigit() and mlist[0] != '8':
+                mlist[0] = int(mlist[0])
             mrks['msymb'].append(mlist[0])
             #
             # Attribute 2: markerfacecolor, markeredgecolor, markeredgewidth
             #
             if len(mlist) >= 2:
-                msublist = re.split(r'\s*[{}]\s*'.format(sep2), mlist[1])
+                msublist = _get_sep_re(sep2).split(mlist[1])
                 mrks['mfc'].append(msublist[0])
                 if len(msublist) >= 2:
                     mrks['mec'].append(msublist[1])
@@ -270,6 +577,67 @@ class Painter():
                       f' mrks[attr]: {mrks[attr]}')
         return mrks
 
+    def _load_marker_registry(self, registry_fname_full, mrks_dflt):
+        """Load a marker registry file with mtime-based caching.
+
+        Parameters
+        ----------
+        registry_fname_full : str
+            A full-path file name of a marker registry.
+        mrks_dflt : dict
+            A dictionary of default marker specifications to fill in
+            unspecified marker attributes.
+
+        Returns
+        -------
+        mrks_reg : dict or None
+            A dictionary of marker attributes keyed by radionuclide
+            names, or None if the registry file does not exist.
+        """
+        try:
+            mtime = os.stat(registry_fname_full).st_mtime_ns
+        except OSError:
+            return None
+        cache_key = (registry_fname_full, mtime)
+        if cache_key in self._marker_registry_cache:
+            return self._marker_registry_cache[cache_key]
+        mrk_attrs = ['msymb', 'mfc', 'mec', 'mew', 'msz', 'alpha']
+        rns = []
+        mrks_def = []
+        with open(registry_fname_full, 'r',
+                  encoding='utf8') as fh_inp:
+            for line in fh_inp:
+                if _RE_REG_SKIP.search(line):
+                    continue
+                rn, mrk_def = [s.strip().strip('"') for s
+                               in _RE_REG_SEP.split(line)]
+                rns.append(rn)
+                mrks_def.append(mrk_def)
+        mrks_expanded = self.set_markers(mrks_def, mrks_dflt)
+        mrks_reg = {}
+        for i, rn in enumerate(rns):
+            mrks_reg[rn] = {}
+            for attr in mrk_attrs:
+                mrks_reg[rn][attr] = mrks_expanded[attr][i]
+        self._marker_registry_cache[cache_key] = mrks_reg
+        return mrks_reg
+
+    def _mk_dir_once(self, path):
+        """Generate a directory, skipping paths already generated.
+
+        Parameters
+        ----------
+        path : str
+            A directory name to be generated if nonexistent.
+
+        Returns
+        -------
+        None.
+        """
+        if path not in self._dirs_ensured:
+            io.mk_dir(path)
+            self._dirs_ensured.add(path)
+
     def plot_radiat_spectr(self, fig, ax, p, df, cols,
                            x='energy', y='emission_probability',
                            plot_type='spectrum',
@@ -321,27 +689,47 @@ class Painter():
         if is_spotting:
             data_col_type = 'spectrum'
 
+        #
+        # Aliasing for the nested dictionary lookups recurring throughout
+        # this function
+        #
+        plot_d = p['plot']
+        xticks = plot_d['xticks']
+        yticks = plot_d['yticks']
+        xlabel = plot_d['xlabel']
+        ylabel = plot_d['ylabel']
+        title = plot_d['title']
+        legend = plot_d['legend']
+
         #
         # x-axis
+        # - The styling commands are run only once per Axes; this function
+        #   can be called multiple times per figure (see is_finalize), and
+        #   the styling state persists on ax across the calls.
+        # - xlim, on the other hand, is computed unconditionally as the
+        #   annotation command blocks below reference it on every call.
         #
-        if not p['plot']['xticks']['is_auto']:
-            xlim = [float(n) for n in p['plot']['xticks']['lim']]
-            ax.set_xlim(xlim)
-        if 'minor_ndivs' in p['plot']['xticks']:
-            mxticks = p['plot']['xticks']['minor_ndivs']
-            ax.xaxis.set_minor_locator(AutoMinorLocator(mxticks))
-        ax.tick_params(axis='x', which='major',
-                       **p['plot']['xticks']['kwargs'])
-        if not p['plot']['xticks']['is_ticklabels']:
-            ax.xaxis.set_ticklabels([])
-        if p['plot']['xticks']['is_remove_end_ticklabels']:
-            _xticklabels = ax.get_xticklabels()
-            _xticklabels[0].set_text('')
-            _xticklabels[-1].set_text('')
-            ax.xaxis.set_ticklabels(_xticklabels)
-        if p['plot']['xlabel']['toggle']:
-            ax.set_xlabel(p['plot']['xlabel']['label'],
-                          **p['plot']['xlabel']['kwargs'])
+        if not xticks['is_auto']:
+            xlim = [float(n) for n in xticks['lim']]
+        if not self.is_drawn['xaxis']:
+            if not xticks['is_auto']:
+                ax.set_xlim(xlim)
+            if 'minor_ndivs' in xticks:
+                mxticks = xticks['minor_ndivs']
+                ax.xaxis.set_minor_locator(AutoMinorLocator(mxticks))
+            ax.tick_params(axis='x', which='major',
+                           **xticks['kwargs'])
+            if not xticks['is_ticklabels']:
+                ax.xaxis.set_ticklabels([])
+            if xticks['is_remove_end_ticklabels']:
+                _xticklabels = ax.get_xticklabels()
+                _xticklabels[0].set_text('')
+                _xticklabels[-1].set_text('')
+                ax.xaxis.set_ticklabels(_xticklabels)
+            if xlabel['toggle']:
+                ax.set_xlabel(xlabel['label'],
+                              **xlabel['kwargs'])
+            self.is_drawn['xaxis'] = True
 
         #
         # Figure base name modification (1/4)
@@ -358,127 +746,143 @@ class Painter():
         #
         if is_finalize:
             # Efficiency plotting (extended use)
-            if re.search('(?i)efficiency', plot_type):
+            if _RE_EFF.search(plot_type):
                 out_fig_bname += p['io']['out']['flag']
-                if p['plot']['legend']['toggle']:
-                    ax.legend(**p['plot']['legend']['kwargs'])
+                if legend['toggle']:
+                    ax.legend(**legend['kwargs'])
             # Radiation spectrum plotting (original use)
             else:
-                out_fig_bname += '_nrg{}-{}'.format(int(ax.get_xlim()[0]),
-                                                    int(ax.get_xlim()[1]))
+                _xlim = ax.get_xlim()
+                out_fig_bname += '_nrg{}-{}'.format(int(_xlim[0]),
+                                                    int(_xlim[1]))
 
         #
         # Figure base name modification (3/4)
         # - Append the plot type to the figure base name.
         #
-        if not re.search('(?i)efficiency', plot_type):
+        if not _RE_EFF.search(plot_type):
             out_fig_bname += '_{}'.format(plot_type)
 
         #
         # y-axis
+        # - Styled only once per Axes; see the x-axis block above.
         #
-        if p['plot']['yticks']['is_log']:
-            ax.set_yscale('log')
-            ax.yaxis.get_major_locator().set_params(
-                **p['plot']['yticks']['log_locators']['major'])
-            ax.yaxis.get_minor_locator().set_params(
-                **p['plot']['yticks']['log_locators']['minor'])
-        if not p['plot']['yticks']['is_auto']:
-            ylim = [float(n) for n in p['plot']['yticks']['lim']]
-            ax.set_ylim(ylim)
-        ax.tick_params(axis='y', which='major',
-                       **p['plot']['yticks']['kwargs'])
-        if not p['plot']['yticks']['is_ticklabels']:
-            ax.yaxis.set_ticklabels([])
-        if p['plot']['ylabel']['toggle']:
-            ax.set_ylabel(p['plot']['ylabel']['label'],
-                          **p['plot']['ylabel']['kwargs'])
+        if not self.is_drawn['yaxis']:
+            if yticks['is_log']:
+                ax.set_yscale('log')
+                ax.yaxis.get_major_locator().set_params(
+                    **yticks['log_locators']['major'])
+                ax.yaxis.get_minor_locator().set_params(
+                    **yticks['log_locators']['minor'])
+            if not yticks['is_auto']:
+                ylim = [float(n) for n in yticks['lim']]
+                ax.set_ylim(ylim)
+            ax.tick_params(axis='y', which='major',
+                           **yticks['kwargs'])
+            if not yticks['is_ticklabels']:
+                ax.yaxis.set_ticklabels([])
+            if ylabel['toggle']:
+                ax.set_ylabel(ylabel['label'],
+                              **ylabel['kwargs'])
+            self.is_drawn['yaxis'] = True
 
         #
         # Plotting: Efficiency fit function and data points
         # (extended use of plot_radiat_spectr())
         #
-        if re.search('(?i)efficiency', plot_type):
+        if _RE_EFF.search(plot_type):
             # Efficiency fit function
-            if re.search('(?i)efficiency_fit', plot_type):
-                xdata_eff_fit = df[cols[x][data_col_type]].copy()
-                ydata_eff_fit = df[cols[y][data_col_type]].copy()
+            if _RE_EFF_FIT.search(plot_type):
+                # Raw NumPy views; ax.plot() stores its own copy of the
+                # data, and handing it a Series would only add a pandas
+                # conversion round trip.
+                xdata_eff_fit = df[cols[x][data_col_type]].to_numpy(
+                    copy=False)
+                ydata_eff_fit = df[cols[y][data_col_type]].to_numpy(
+                    copy=False)
                 ax.plot(xdata_eff_fit, ydata_eff_fit,
                         label='Fitted ({})'.format(
                             p['efficiency']['fit']['function']),
-                        **p['plot']['line2d']['kwargs'])
+                        **plot_d['line2d']['kwargs'])
             # Efficiency data points
-            if re.search('(?i)efficiency_data|calc', plot_type):
-                xdata_eff_data = df[cols[x][data_col_type]].copy()
-                ydata_eff_data = df[cols[y][data_col_type]].copy()
-                k = 'data' if re.search('(?i)data', plot_type) else 'calc'
+            if _RE_EFF_DATA_CALC.search(plot_type):
+                xdata_eff_data = df[cols[x][data_col_type]].to_numpy(
+                    copy=False)
+                ydata_eff_data = df[cols[y][data_col_type]].to_numpy(
+                    copy=False)
+                k = 'data' if _RE_DATA.search(plot_type) else 'calc'
                 ax.plot(xdata_eff_data, ydata_eff_data,
-                        label=p['plot']['marker'][k]['label'],
-                        **p['plot']['marker'][k]['kwargs'])
-            if re.search('(?i)efficiency_annot|calc', plot_type):
+                        label=plot_d['marker'][k]['label'],
+                        **plot_d['marker'][k]['kwargs'])
+            if _RE_EFF_ANNOT_CALC.search(plot_type):
                 # Horizontal line
                 h_y = df[cols[y][data_col_type]][0]
                 h_xmin = int(ax.get_xlim()[0])
                 h_xmax = df[cols[x][data_col_type]][0]
                 ax.hlines(y=h_y, xmin=h_xmin, xmax=h_xmax,
-                          **p['plot']['annot']['line2d']['kwargs'])
+                          **plot_d['annot']['line2d']['kwargs'])
                 # Vertical line
                 v_x = h_xmax
                 v_ymin = int(ax.get_ylim()[0])
                 v_ymax = h_y
                 ax.vlines(x=v_x, ymin=v_ymin, ymax=v_ymax,
-                          **p['plot']['annot']['line2d']['kwargs'])
+                          **plot_d['annot']['line2d']['kwargs'])
                 # Label
                 eff_pair = '({:g}, {:g})'.format(h_xmax, v_ymax)
                 ax.text(x=h_xmax, y=v_ymax, s=eff_pair,
-                        **p['plot']['annot']['text']['kwargs'])
-            if is_finalize and p['plot']['legend']['toggle']:
-                ax.legend(**p['plot']['legend']['kwargs'])
+                        **plot_d['annot']['text']['kwargs'])
+            if is_finalize and legend['toggle']:
+                ax.legend(**legend['kwargs'])
 
         #
         # Plotting: A radiation spectrum
         #
-        if re.search('(?i)spectrum|line', plot_type):
-            xdata_spectr = df[cols[x][data_col_type]].copy()
-            ydata_spectr = df[cols[y][data_col_type]].copy()
+        if _RE_SPECTRUM.search(plot_type):
+            # Raw NumPy views; ax.plot() stores its own copy of the data,
+            # and an extra one here would only double the transient memory
+            # for spectra with a large number of channels.
+            xdata_spectr = df[cols[x][data_col_type]].to_numpy(copy=False)
+            ydata_spectr = df[cols[y][data_col_type]].to_numpy(copy=False)
             ax.plot(xdata_spectr, ydata_spectr,
                     # A radiation spectrum will be placed above, if any,
                     # annotation markers for spotted radionuclides.
                     zorder=10,
-                    **p['plot']['line2d']['kwargs'])
+                    **plot_d['line2d']['kwargs'])
 
         #
         # Title
         #
-        if (p['plot']['title']['toggle']
+        if (title['toggle']
                 and not self.is_drawn['title']):
-            if ('label' in p['plot']['title']
-                    and p['plot']['title']['label']):
-                the_title = p['plot']['title']['label']
+            if ('label' in title
+                    and title['label']):
+                the_title = title['label']
             else:
                 the_title = out_fig_bname
             # crd takes precedence over loc.
-            if 'crd' in p['plot']['title']:
-                if 'pad' in p['plot']['title']['kwargs']:
+            if 'crd' in title:
+                if 'pad' in title['kwargs']:
                     # The pad property is available only in the set_title()
                     # method.
-                    del p['plot']['title']['kwargs']['pad']
-                ax.text(*p['plot']['title']['crd'],
+                    del title['kwargs']['pad']
+                ax.text(*title['crd'],
                         the_title,
                         transform=ax.transAxes,
-                        **p['plot']['title']['kwargs'])
-            elif 'loc' in p['plot']['title']:
+                        **title['kwargs'])
+            elif 'loc' in title:
                 ax.set_title(the_title,
-                             loc=p['plot']['title']['loc'],
-                             **p['plot']['title']['kwargs'])
+                             loc=title['loc'],
+                             **title['kwargs'])
             self.is_drawn['title'] = True
 
         #
         # Plotting: Annotation markers for spotted radionuclides
         #
-        if re.search('(?i)rn|marker', plot_type):
+        if _RE_RN.search(plot_type):
             # Aliasing
-            annots = p['plot']['annots']
+            annots = plot_d['annots']
+            every = annots['every']
+            grouped = annots['grouped']
             col_rn = cols['radionuclide']['nucl_data_new']
             col_nrg = cols['energy']['nucl_data_new']
             if is_spotting:
@@ -487,12 +891,20 @@ class Painter():
             col_hl = cols['half_life']['nucl_data_new']
             col_dm = cols['decay_mode']['nucl_data_new']
             col_flag = cols['flag']['nucl_data_new']
-            nrg_lims = []
-            ep_lims = []
-            for win in annots['every']['cutoffs'].values():
-                nrg_lims.append([float(nrg) for nrg in win['energy']])
-                ep_lims.append([float(ep) for ep
-                               in win['emission_probability']])
+            # Cutoff windows as (K, 2) NumPy arrays for the vectorized
+            # cutoff filtering in the 'every' annotation block
+            # - .reshape(-1, 2) keeps the column slicing valid even for an
+            #   empty cutoffs mapping.
+            wins = list(every['cutoffs'].values())
+            nrg_lims = np.array([[float(nrg) for nrg in w['energy']]
+                                 for w in wins],
+                                dtype='float64').reshape(-1, 2)
+            ep_lims = np.array([[float(ep) for ep
+                                 in w['emission_probability']]
+                                for w in wins],
+                               dtype='float64').reshape(-1, 2)
+            nrg_los, nrg_his = nrg_lims[:, 0], nrg_lims[:, 1]
+            ep_los, ep_his = ep_lims[:, 0], ep_lims[:, 1]
 
             #
             # Figure base name modification (4/4)
@@ -507,34 +919,39 @@ class Painter():
             #
             # Shade for energy-cutoff regions
             #
-            if annots['every']['shade']['toggle']:
+            if every['shade']['toggle']:
                 cutoff_nrgs = [float(nrg) for nrg
                                in p['scout']['radionuclides']['cutoffs'][
                                    'energy']]
+                # Fetch the axis limits once; they are fixed by this point.
+                xlim_hi = ax.get_xlim()[1]
+                ylim_hi = ax.get_ylim()[1]
+                # One style dict shared by both shade rectangles
+                shade_kwargs = every['shade']['kwargs']
                 # Lower cutoff energy region
                 # Draw a shade from (x0=0, y0=0) only if the lower cutoff
                 # energy is greater than zero.
                 if cutoff_nrgs[0] > 0:
                     shade_llim_org = (0, 0)  # (x0, y0)
                     shade_llim_wth = cutoff_nrgs[0]
-                    shade_llim_hgt = ax.get_ylim()[1]
+                    shade_llim_hgt = ylim_hi
                     rect_llim = patches.Rectangle(
                         shade_llim_org,
                         shade_llim_wth, shade_llim_hgt,
-                        **annots['every']['shade']['kwargs'])
+                        **shade_kwargs)
                     ax.add_patch(rect_llim)
                 # Upper cutoff energy region
                 # Draw a shade from (x0=cutoff_nrgs[1], y0=0) only if the upper
                 # cutoff energy (cutoff_nrgs[1]) is smaller than the upper
                 # x-axis limit.
-                if cutoff_nrgs[1] < ax.get_xlim()[1]:
+                if cutoff_nrgs[1] < xlim_hi:
                     shade_ulim_org = (cutoff_nrgs[1], 0)
-                    shade_ulim_wth = ax.get_xlim()[1]
-                    shade_ulim_hgt = ax.get_ylim()[1]
+                    shade_ulim_wth = xlim_hi
+                    shade_ulim_hgt = ylim_hi
                     rect_ulim = patches.Rectangle(
                         shade_ulim_org,
                         shade_ulim_wth, shade_ulim_hgt,
-                        **annots['every']['shade']['kwargs'])
+                        **shade_kwargs)
                     ax.add_patch(rect_ulim)
 
             #
@@ -544,14 +961,14 @@ class Painter():
             mrks_yml = {g: {} for g in mrk_groups}
             mrk_attrs = ['msymb', 'mfc', 'mec', 'mew', 'msz', 'alpha']
             for attr in mrk_attrs[1:]:
-                mrks_yml['dflt'][attr] = annots['grouped']['defaults'][attr]
+                mrks_yml['dflt'][attr] = grouped['defaults'][attr]
             # g1: User-specified markers
-            mrks_yml['g1'] = self.set_markers(annots['grouped']['markers'],
+            mrks_yml['g1'] = self.set_markers(grouped['markers'],
                                               mrks_yml['dflt'])
             # g2: Spare markers
-            _markers_g2 = list(Line2D.markers.keys())
-            mrks_yml['g2']['msymb'] = [m2 for m2 in _markers_g2
-                                       if m2 not in mrks_yml['g1']['msymb']]
+            _msymbs_g1 = set(mrks_yml['g1']['msymb'])
+            mrks_yml['g2']['msymb'] = [m2 for m2 in _ALL_MPL_MARKERS
+                                       if m2 not in _msymbs_g1]
             mrks_yml['combined']['msymb'] = (mrks_yml['g1']['msymb']
                                              + mrks_yml['g2']['msymb'])
             shortfall = (len(mrks_yml['combined']['msymb'])
@@ -570,35 +987,31 @@ class Painter():
             # - The purpose of a marker registry is to use consistent markers
             #   across plots of the same dataset with different energy ranges.
             #
-            is_marker_registry = bool(
-                os.path.exists(p['io']['lib']['marker_registry_fname_full']))
-            if is_marker_registry:
-                mrks_reg = {}
-                rns = []
-                mrks_def = []
-                with open(p['io']['lib']['marker_registry_fname_full'], 'r',
-                          encoding='utf8') as fh_inp:
-                    for line in fh_inp.readlines():
-                        if re.search(r'^\s*#', line) or re.search('^$', line):
-                            continue
-                        rn, mrk_def = [s.strip().strip('"') for s
-                                       in re.split(r'\s*;\s*', line)]
-                        rns.append(rn)
-                        mrks_def.append(mrk_def)
-                mrks_expanded = self.set_markers(mrks_def, mrks_yml['dflt'])
-                for i, rn in enumerate(rns):
-                    mrks_reg[rn] = {}
-                    for attr in mrk_attrs:
-                        mrks_reg[rn][attr] = mrks_expanded[attr][i]
+            mrks_reg = self._load_marker_registry(
+                p['io']['lib']['marker_registry_fname_full'],
+                mrks_yml['dflt'])
+            is_marker_registry = mrks_reg is not None
 
+            # Deferred 'every' annotation labels; see the batch ax.text()
+            # block after the radionuclide loop.
+            texts_every = []
+            # 'grouped' annotation markers bucketed by style; see the
+            # batch ax.scatter() block after the radionuclide loop.
+            scatter_gr = {}
+            # (handle, label) pairs for the grouped legend, collected
+            # while plotting so that the legend block below does not
+            # need to walk every Axes artist.
+            legend_entries = []
             # Iterate over radionuclides.
-            rns_uniq = list(df[col_rn].unique())
-            for i, rn in enumerate(rns_uniq):
+            # - groupby() splits the DF into radionuclide-wise subframes
+            #   in a single pass, as opposed to one full boolean scan per
+            #   unique radionuclide.
+            # - sort=False preserves the order of first appearance, as did
+            #   the superseded .unique() call.
+            for i, (rn, df_rn) in enumerate(df.groupby(col_rn, sort=False)):
                 #
                 # !!! df_rn: Suspect (radionuclide)-wise DF
                 #
-                bool_idx_rn = df[col_rn] == rn
-                df_rn = df[bool_idx_rn].copy()
                 # TypeError prevention measure
                 # - Below is to avoid the following error thrown at the
                 #   commands "df_rn.loc[idx, col_nrg]" and the likes:
@@ -642,19 +1055,23 @@ class Painter():
                 #   local maxima will be labeled with the actual spectrum
                 #   energies.
                 if is_spotting:
-                    bool_idx_na = df_rn[col_nrg].isna()
-                    if True in bool_idx_na.to_list():
-                        # A single-row DF can be associated with the object
-                        # dtype, which, with the use of .fillna(), produces
-                        # the following warning. Cast the dtype to float64
-                        # in advance to silent this warning.
-                        #   FutureWarning: Downcasting object dtype arrays on
-                        #   .fillna, .ffill, .bfill is deprecated and will
-                        #   change in a future version.
-                        #   Call result.infer_objects(copy=False) instead.
-                        df_rn[col_nrg] = df_rn[col_nrg].astype('float64')
-                        nrgs_fallback = df_rn[col_nrg_spectr]
-                        df_rn[col_nrg] = df_rn[col_nrg].fillna(nrgs_fallback)
+                    bool_idx_na = df_rn[col_nrg].isna().to_numpy()
+                    # The float64 conversion must stay behind the NaN guard;
+                    # radionuclide groups without unspotted local maxima may
+                    # hold nonnumeric TCS energy strings.
+                    if bool_idx_na.any():
+                        # The substitution runs through np.where on plain
+                        # float64 arrays, which sidesteps both the .fillna()
+                        # dispatch and the FutureWarning that .fillna()
+                        # emits for the object dtype of single-row DFs.
+                        # .assign() is used in place of direct column
+                        # assignment as df_rn is a groupby() subframe.
+                        nrgs_new = df_rn[col_nrg].to_numpy(dtype='float64',
+                                                           na_value=np.nan)
+                        nrgs_fallback = df_rn[col_nrg_spectr].to_numpy(
+                            dtype='float64')
+                        df_rn = df_rn.assign(**{col_nrg: np.where(
+                            bool_idx_na, nrgs_fallback, nrgs_new)})
                 # ydata (cols[y]) can either be:
                 # - an emission probability dataset for nuclear data plotting
                 # - a count dataset for radiation spectrum plotting
@@ -663,10 +1080,13 @@ class Painter():
                 # - an emission probability dataset, in combination with xdata,
                 #   for selective annotations in nuclear data or radiation
                 #   spectrum plotting
+                # xdata keeps its .copy() as the TCS summing below writes
+                # into it; ydata and ydata_eps are read-only and can be
+                # plain views.
                 xdata = df_rn[cols[x][data_col_type]].copy()
-                ydata = df_rn[cols[y][data_col_type]].copy()
+                ydata = df_rn[cols[y][data_col_type]]
                 ydata_eps = df_rn[cols['emission_probability'][
-                    'nucl_data_new']].copy()
+                    'nucl_data_new']]
                 #
                 # Sum up, if any, true coincidence summing energies
                 # (TCS implies that the summing energies belong to
@@ -678,48 +1098,77 @@ class Painter():
                 # - ...
                 #
                 if is_spotting:
-                    for idx, nrg in zip(xdata.index, xdata):
-                        if re.search(r'([0-9.]+)\s*[+]\s*([0-9.]+)', str(nrg)):
-                            nrgs_tcs = [float(n) for n
-                                        in re.split(r'\s*[+]\s*', str(nrg))]
-                            xdata[idx] = sum(nrgs_tcs)
-                # Spotted radionuclides
-                if re.search('[a-zA-Z]+-[0-9]+', rn):
-                    # Convert the radionuclide string to the nuclide notation.
-                    # - The \mathrm{} command makes, when encounters, the "m"
-                    #   symbol of a nuclear isomer an upright character.
-                    elem, mass_num = rn.split('-')
-                    lab_rn = r'$^{\mathrm{%s}}$%s' % (mass_num, elem)
-                # Local maxima without spotted radionuclides
-                else:
-                    lab_rn = str(rn)
+                    # TCS-flagged rows, computed once per radionuclide for
+                    # the annotation command blocks below
+                    bool_idx_tcs = df_rn[col_flag].astype(str).str.contains(
+                        _RE_TCS_FLAG, na=False)
+                    # Only a small fraction of rows hold TCS energy strings;
+                    # spot them with one vectorized string op and sum only
+                    # those, instead of running a regex per element.
+                    x_str = xdata.astype(str)
+                    bool_idx_tcs_nrg = x_str.str.contains(_RE_TCS_PAIR,
+                                                          na=False)
+                    if bool_idx_tcs_nrg.any():
+                        xdata[bool_idx_tcs_nrg] = x_str[bool_idx_tcs_nrg].map(
+                            lambda nrg: sum(float(n) for n
+                                            in _RE_TCS_SPLIT.split(nrg)))
+                # The labels are cached per radionuclide so that replots of
+                # the same dataset with different energy ranges skip even
+                # the string decomposition below.
+                lab_rn = self._lab_rn_cache.get(rn)
+                if lab_rn is None:
+                    parts = str(rn).split('-')
+                    # Spotted radionuclides
+                    if (len(parts) == 2 and parts[0].isalpha()
+                            and parts[1][:1].isdigit()):
+                        # Convert the radionuclide string to the nuclide
+                        # notation.
+                        # - The \mathrm{} command makes, when encounters,
+                        #   the "m" symbol of a nuclear isomer an upright
+                        #   character.
+                        elem, mass_num = parts
+                        lab_rn = r'$^{\mathrm{%s}}$%s' % (mass_num, elem)
+                    # Local maxima without spotted radionuclides
+                    else:
+                        lab_rn = str(rn)
+                    self._lab_rn_cache[rn] = lab_rn
+                # NumPy views of the per-radionuclide data and the
+                # in-x-axis-range mask, computed once and shared by the
+                # annotation command blocks below
+                nrg_sums = xdata.to_numpy(dtype='float64')
+                itns = ydata.to_numpy(dtype='float64')
+                if not xticks['is_auto']:
+                    bool_idx_xrange = ((nrg_sums >= xlim[0])
+                                       & (nrg_sums <= xlim[1]))
                 #
                 # Annotation type: every
                 # - Every local maximum is directly annotated with a label.
                 #
-                if re.search('(?i)every|both', annots['type']):
+                if _RE_EVERY.search(annots['type']):
+                    # Selectively annotate using the user-specified cutoff
+                    # values of energy and emission probability.
+                    # - The x-axis range test and the cutoff window search
+                    #   are computed over NumPy arrays at once, leaving only
+                    #   the surviving rows to the Python-level annotation
+                    #   loop below.
+                    # TCS having NaN emission probability
+                    eps = np.nan_to_num(ydata_eps.to_numpy(dtype='float64'),
+                                        nan=0.0)
+                    in_window = _cutoff_mask(nrg_sums, eps,
+                                             nrg_los, nrg_his,
+                                             ep_los, ep_his)
+                    # Skip the radiation energies exceeding the x-axis
+                    # plotting range.
+                    if not xticks['is_auto']:
+                        in_window &= bool_idx_xrange
+                    idxes = xdata.index
                     # !!! itn is used to set the y-coordinates of markers.
                     # !!! itn can either be ep or cnt. See the explanation
                     # "ydata (cols[y]) can either be:" above for details.
-                    for idx, nrg_sum, itn, ep in zip(xdata.index, xdata,
-                                                     ydata, ydata_eps):
-                        # Skip if the radiation energy of interest exceeds
-                        # the x-axis plotting range.
-                        if (not p['plot']['xticks']['is_auto']
-                                and not (xlim[0] <= nrg_sum <= xlim[1])):
-                            continue
-                        # Selectively annotate using the user-specified cutoff
-                        # values of energy and emission probability.
-                        is_cutoff = True
-                        if ep != ep:  # TCS having NaN emission probability
-                            ep = 0.0
-                        for nrg_lim, ep_lim in zip(nrg_lims, ep_lims):
-                            if ((nrg_lim[0] <= nrg_sum <= nrg_lim[1])
-                                    and (ep_lim[0] <= ep <= ep_lim[1])):
-                                is_cutoff = False
-                                break
-                        if is_cutoff:
-                            continue
+                    for pos in np.nonzero(in_window)[0]:
+                        idx = idxes[pos]
+                        nrg_sum = nrg_sums[pos]
+                        itn = itns[pos]
                         # >> Can be referenced from within the user input file
                         # - "nrg" differs from "nrg_sum" in that for TCS
                         #   energies, "nrg" contains an intact string of TCS
@@ -739,50 +1188,61 @@ class Painter():
                         if isinstance(dm, str):
                             # Upright greek letters for decay mode
                             # (alpha, beta plus, and beta minus)
-                            dm = re.sub('A', '\u03B1', dm)
-                            dm = re.sub('B([+-]?)', '\u03B2$^{\\1}$', dm)
+                            dm = dm.translate(_DM_ALPHA_TRANS)
+                            if 'B' in dm:
+                                dm = _RE_DM_BETA.sub('\u03B2$^{\\1}$', dm)
                         every_type = 'single'
                         # Make the energies of true coincidence summing whole
                         # numbers with rounding performed.
-                        if is_spotting:
-                            flag = df_rn.loc[idx, col_flag]
-                            re_tcs = re.compile(
-                                r'(?i)t(rue\s+)?c(oincidence\s+)?s(umming)?')
-                            if re.search(re_tcs, str(flag)):
-                                every_type = 'tcs'
-                                _sep = re.sub(r'[0-9.]+(\s*[+]\s*)[0-9.]+',
-                                              r'\1',
-                                              nrg)
-                                _nrgs = ['{:.0f}'.format(float(n)) for n
-                                         in re.split(r'\s*[+]\s*', nrg)]
-                                nrg = _sep.join(_nrgs)
-                            else:
-                                every_type = 'single'
+                        if is_spotting and bool_idx_tcs.at[idx]:
+                            every_type = 'tcs'
+                            # The TCS separator is a fixed '+'; plain string
+                            # ops suffice. The separator is reconstructed
+                            # from the first energy pair to preserve the
+                            # spacing style of the original string.
+                            _nrgs = nrg.split('+')
+                            _sep_beg = len(_nrgs[0].rstrip())
+                            _sep_end = (len(_nrgs[0]) + 1
+                                        + len(_nrgs[1])
+                                        - len(_nrgs[1].lstrip()))
+                            _sep = nrg[_sep_beg:_sep_end]
+                            nrg = _sep.join('{:.0f}'.format(float(n))
+                                            for n in _nrgs)
                         # Iterate over each line under the 'every' key.
-                        for line in annots['every'][every_type].values():
+                        for line in every[every_type].values():
                             try:
-                                lab_rn_nrgwise = eval(line['fmt'])
+                                # The format expression is compiled once per
+                                # unique string and evaluated against an
+                                # explicit dictionary of the names it can
+                                # reference.
+                                lab_rn_nrgwise = eval(
+                                    _compile_fmt(line['fmt']), {},
+                                    {'nrg': nrg, 'ep': ep, 'hl': hl,
+                                     'dm': dm, 'lab_rn': lab_rn,
+                                     'nrg_sum': nrg_sum})
                             # Fallback for
                             # - Annihilation peak
                             # - Unspotted local maxima
                             except ValueError:  # As a result of eval()
-                                _fback = annots['every'][every_type].values()
+                                _fback = every[every_type].values()
                                 if len(_fback) == 1:
                                     lab_rn_nrgwise = '{:.0f}'.format(nrg_sum)
                                 else:
                                     lab_rn_nrgwise = ''
                             # To reiterate, itn can either be ep or cnt.
                             crd_y = itn * line['offy'] if line['offy'] else itn
-                            # Annotate each data point.
-                            ax.text(nrg_sum, crd_y, lab_rn_nrgwise,
-                                    **line['kwargs'])
+                            # Defer the annotation to the batch ax.text()
+                            # block after the radionuclide loop.
+                            texts_every.append((nrg_sum, crd_y,
+                                                lab_rn_nrgwise,
+                                                line['kwargs']))
                 #
                 # Annotation type: grouped
                 # - Groups of local maxima beloning to specific radionuclides
                 #   are labeled with respective markers, and the group
                 #   information is displayed in the legend.
                 #
-                if re.search('(?i)grouped|both', annots['type']):
+                if _RE_GROUPED.search(annots['type']):
                     the_msymb = mrks_yml['combined']['msymb'][i]
                     the_mfc = mrks_yml['combined']['mfc'][i]
                     the_mec = mrks_yml['combined']['mec'][i]
@@ -797,47 +1257,81 @@ class Painter():
                         the_mew = mrks_reg[rn]['mew']
                         the_msz = mrks_reg[rn]['msz']
                         the_alpha = mrks_reg[rn]['alpha']
-                    if not p['plot']['xticks']['is_auto']:
-                        bool_idx = ((xdata >= xlim[0])
-                                    & (xdata <= xlim[1]))
-                        nrgs_in_range = xdata[bool_idx]
-                        if not nrgs_in_range.empty:
-                            xdata_gr = nrgs_in_range
-                            ydata_gr = ydata[bool_idx]
-                            ax.plot(xdata_gr, ydata_gr,
-                                    linestyle='',
-                                    marker=the_msymb,
-                                    markerfacecolor=the_mfc,
-                                    markeredgecolor=the_mec,
-                                    markeredgewidth=the_mew,
-                                    markersize=the_msz,
-                                    alpha=the_alpha,
-                                    label=lab_rn,
-                                    # Allow markers to go beyond axes.
-                                    clip_on=False)
+                    # Reuse the per-radionuclide arrays and the x-range
+                    # mask computed ahead of the annotation blocks.
+                    if not xticks['is_auto']:
+                        xdata_gr = nrg_sums[bool_idx_xrange]
+                        ydata_gr = itns[bool_idx_xrange]
                     else:
-                        ax.plot(xdata_gr, ydata_gr,
-                                linestyle='',
-                                marker=the_msymb,
-                                markerfacecolor=the_mfc,
-                                markeredgecolor=the_mec,
-                                markeredgewidth=the_mew,
-                                markersize=the_msz,
-                                alpha=the_alpha,
-                                label=lab_rn,
-                                clip_on=False)
-            if (re.search('(?i)grouped|both', annots['type'])
-                    and annots['grouped']['legend']['toggle']):
-                handles, labels = ax.get_legend_handles_labels()
+                        xdata_gr = nrg_sums
+                        ydata_gr = itns
+                    if xdata_gr.size:
+                        # Bucket the coordinates by marker style; the
+                        # markers of all radionuclides sharing a style
+                        # are drawn as one PathCollection after the loop,
+                        # sparing one Line2D artist per radionuclide at
+                        # render time. An empty Line2D per radionuclide
+                        # preserves the one-entry-per-radionuclide legend.
+                        the_style = (the_msymb, the_mfc, the_mec,
+                                     the_mew, the_msz, the_alpha)
+                        if the_style not in scatter_gr:
+                            scatter_gr[the_style] = ([], [])
+                        scatter_gr[the_style][0].append(xdata_gr)
+                        scatter_gr[the_style][1].append(ydata_gr)
+                        proxy, = ax.plot([], [],
+                                         linestyle='',
+                                         marker=the_msymb,
+                                         markerfacecolor=the_mfc,
+                                         markeredgecolor=the_mec,
+                                         markeredgewidth=the_mew,
+                                         markersize=the_msz,
+                                         alpha=the_alpha,
+                                         label=lab_rn)
+                        legend_entries.append((proxy, lab_rn))
+            # Draw the bucketed 'grouped' markers: one ax.scatter() call,
+            # hence one PathCollection artist, per marker style. The
+            # legend entries come from the per-radionuclide empty Line2Ds
+            # added in the loop.
+            for the_style, (xs_gr, ys_gr) in scatter_gr.items():
+                (the_msymb, the_mfc, the_mec,
+                 the_mew, the_msz, the_alpha) = the_style
+                ax.scatter(np.concatenate(xs_gr), np.concatenate(ys_gr),
+                           marker=the_msymb,
+                           c=the_mfc,
+                           edgecolors=the_mec,
+                           linewidths=the_mew,
+                           s=the_msz**2,
+                           alpha=the_alpha,
+                           label='_nolegend_',
+                           # Allow markers to go beyond axes.
+                           clip_on=False)
+            # Emit the deferred 'every' annotation labels in one batch with
+            # autoscaling suspended, sparing one axis limit recomputation
+            # per added Text artist.
+            if texts_every:
+                is_autoscale = ax.get_autoscale_on()
+                ax.set_autoscale_on(False)
+                for crd_x, crd_y, lab_rn_nrgwise, text_kwargs in texts_every:
+                    ax.text(crd_x, crd_y, lab_rn_nrgwise, **text_kwargs)
+                ax.set_autoscale_on(is_autoscale)
+            if (_RE_GROUPED.search(annots['type'])
+                    and grouped['legend']['toggle']):
+                # The (handle, label) pairs collected while plotting;
+                # ax.get_legend_handles_labels() would recover the same
+                # entries by walking every artist on the Axes.
+                if legend_entries:
+                    handles, labels = map(list, zip(*legend_entries))
+                else:
+                    handles, labels = ax.get_legend_handles_labels()
                 if (len(handles) != 0
-                        and annots['grouped']['legend']['order'] != 'as_is'):
+                        and grouped['legend']['order'] != 'as_is'):
                     is_reverse = bool(
-                        annots['grouped']['legend']['order'] == 'descending')
+                        grouped['legend']['order'] == 'descending')
                     handles, labels = self.sort_legend(
                         handles, labels,
                         is_reverse=is_reverse)
                 ax.legend(handles, labels,
-                          **annots['grouped']['legend']['kwargs'])
+                          **grouped['legend']['kwargs'])
 
         #
         # Save the figure to files.
@@ -848,13 +1342,24 @@ class Painter():
         is_pdfcrop = p['io']['ctrls']['pdf_postproc']['pdfcrop']['toggle']
         if p['io']['ctrls']['is_plot_test']:
             mt.show_warn('Running in a plot testing mode...')
-            p['io']['ctrls']['is_plot'] = True
-            p['io']['ctrls']['is_save_fig'] = True
-            p['io']['ctrls']['fig_fmts'] = ['png']
-            is_gs = False
-            is_pdfcrop = False
+            # Short-circuit to one direct .png write: the full save_fig()
+            # and PDF postprocessing machinery (Ghostscript, pdfcrop,
+            # Inkscape) adds nothing to an iterative styling check.
+            # ctrls is left unmutated so that subsequent nontest saves
+            # are unaffected.
+            fig_path = p['io']['out']['fig_path']
+            self._mk_dir_once(fig_path)
+            png_fname_full = os.path.join(fig_path,
+                                          f'{out_fig_bname}.png')
+            # A styling check does not need the production DPI; capping
+            # it quarters or better the rasterization time per iteration.
+            fig.savefig(png_fname_full,
+                        dpi=min(p['io']['ctrls']['raster_dpi'], 100),
+                        bbox_inches='tight')
+            io.show_file_gen(png_fname_full)
+            return
         if p['io']['ctrls']['is_plot']:
-            io.mk_dir(p['io']['out']['fig_path'])
+            self._mk_dir_once(p['io']['out']['fig_path'])
             inkscape_exe = os.path.expandvars(
                 p['io']['ctrls']['inkscape']['exe'])
             self.save_fig(fig,
@@ -864,20 +1369,43 @@ class Painter():
                           dpi=p['io']['ctrls']['raster_dpi'],
                           inkscape_exe=inkscape_exe)
         if is_gs or is_pdfcrop:
-            pdf_fname_full = '{}/{}.pdf'.format(p['io']['out']['fig_path'],
-                                                out_fig_bname)
+            pdf_fname_full = os.path.join(p['io']['out']['fig_path'],
+                                          f'{out_fig_bname}.pdf')
             gs_exe = os.path.expandvars(
                 p['io']['ctrls']['pdf_postproc']['ghostscript']['exe'])
             gs_pdf_ver = p['io']['ctrls']['pdf_postproc']['ghostscript'][
                 'pdf_ver']
             pdfcrop_exe = os.path.expandvars(
                 p['io']['ctrls']['pdf_postproc']['pdfcrop']['exe'])
-            self.run_pdf_postproc(pdf_fname_full,
-                                  is_gs=is_gs,
-                                  gs_exe=gs_exe,
-                                  gs_pdf_ver=gs_pdf_ver,
-                                  is_pdfcrop=is_pdfcrop,
-                                  pdfcrop_exe=pdfcrop_exe)
+            # The postprocessing is external-process work; farm it out to
+            # the shared thread pool so successive datasets overlap their
+            # Ghostscript and pdfcrop runs.
+            _get_postproc_pool().submit(self._run_pdf_postproc_task,
+                                        pdf_fname_full,
+                                        is_gs=is_gs,
+                                        gs_exe=gs_exe,
+                                        gs_pdf_ver=gs_pdf_ver,
+                                        is_pdfcrop=is_pdfcrop,
+                                        pdfcrop_exe=pdfcrop_exe)
+
+    def _run_pdf_postproc_task(self, *args, **kwargs):
+        """Run run_pdf_postproc in a worker, reporting failures as warnings.
+
+        Parameters
+        ----------
+        *args, **kwargs
+            Arguments forwarded to run_pdf_postproc().
+
+        Returns
+        -------
+        None.
+        """
+        try:
+            self.run_pdf_postproc(*args, **kwargs)
+        except Exception as e:
+            # Exceptions raised in pool workers would otherwise be
+            # swallowed by their Future objects.
+            mt.show_warn('PDF postprocessing failed: {}'.format(e))
 
     def save_fig(self, fig, out_path, out_bname, fmts,
                  dpi=300, inkscape_exe='inkscape.exe'):
@@ -903,56 +1431,147 @@ class Painter():
         None.
         """
         # Generate the output directory if not exists.
-        io.mk_dir(out_path)
+        self._mk_dir_once(out_path)
 
         # Save figure files in user-designated file formats.
-        out_bname_full = '{}/{}'.format(out_path, out_bname)
+        out_bname_full = os.path.join(out_path, out_bname)
         is_svg = True if 'svg' in (fmt.lower() for fmt in fmts) else False
+        # Process .emf last so that its conversion can reuse the .svg file
+        # written in the same call regardless of the user-designated format
+        # order; otherwise an .emf preceding 'svg' in fmts would be
+        # converted from a not-yet-written file.
+        fmts = sorted(fmts, key=lambda fmt: _RE_EMF.search(fmt) is not None)
+        # Compute the tight bounding box once and pass it explicitly to the
+        # .savefig() calls below; bbox_inches='tight' would rerun the
+        # expensive layout pass for every output format.
+        try:
+            fig.canvas.draw()
+            bbox_inches = fig.get_tightbbox(
+                fig.canvas.get_renderer()).padded(0.01)
+        except AttributeError:  # Canvases without get_renderer()
+            bbox_inches = 'tight'
         for fmt in fmts:
-            out_fname_full = '{}.{}'.format(out_bname_full, fmt)
+            out_fname_full = f'{out_bname_full}.{fmt}'
             # All but .emf
-            if not re.search('(?i)emf', fmt):
-                fig.savefig(out_fname_full, dpi=dpi, bbox_inches='tight')
+            if not _RE_EMF.search(fmt):
+                fig.savefig(out_fname_full, dpi=dpi,
+                            bbox_inches=bbox_inches)
                 io.show_file_gen(out_fname_full)
             # .emf via from .svg
             else:
-                is_inkscape_exe_found = bool(os.path.exists(inkscape_exe))
-                if not is_inkscape_exe_found:
-                    inkscape_exe_on_environ_var = io.locate_exe(
-                        '(?i)inkscape.*bin',
-                        '(?i)inkscape[.]exe$')
-                    if inkscape_exe_on_environ_var:
-                        msg = ('The designated inkscape executable'
-                               + f' [{inkscape_exe}] could not be located,\n'
-                               + 'but its alternative'
-                               + f' [{inkscape_exe_on_environ_var}] was found'
-                               + ' in the path environment variable.'
-                               + ' We fall back to this executable.')
-                        mt.show_warn(msg)
-                        inkscape_exe = inkscape_exe_on_environ_var
-                        is_inkscape_exe_found = True
-                if not is_inkscape_exe_found:
+                inkscape_exe_resolved = _resolve_exe(inkscape_exe,
+                                                     '(?i)inkscape.*bin',
+                                                     '(?i)inkscape[.]exe$',
+                                                     'Inkscape')
+                if inkscape_exe_resolved is None:
                     msg = ('The designated Inkscape executable '
                            + f' [{inkscape_exe}] could not be located;\n'
                            + '.emf rendering will be skipped.')
                     mt.show_warn(msg)
                     continue
-                _svg = '{}.svg'.format(out_bname_full)
+                inkscape_exe = inkscape_exe_resolved
+                _svg = f'{out_bname_full}.svg'
                 if not is_svg:
-                    fig.savefig(_svg, dpi=dpi, bbox_inches='tight')
-                inkscape_exe = '"{}"'.format(inkscape_exe)
-                _inkscape_cmd = [
-                    inkscape_exe,
-                    _svg,
-                    '--export-filename={}'.format(out_fname_full),
-                ]
-                inkscape_cmd = ' '.join(_inkscape_cmd)
-                subprocess.run(inkscape_cmd, shell=True, check=True)
+                    fig.savefig(_svg, dpi=dpi, bbox_inches=bbox_inches)
+                # Convert through a persistent Inkscape shell process,
+                # which spares one multi-second Inkscape cold start per
+                # figure; fall back to a one-shot invocation for Inkscape
+                # versions without shell mode.
+                if not self._run_inkscape_job(inkscape_exe, _svg,
+                                              out_fname_full):
+                    inkscape_cmd = [
+                        inkscape_exe,
+                        _svg,
+                        '--export-filename={}'.format(out_fname_full),
+                    ]
+                    subprocess.run(inkscape_cmd, check=True)
                 if not is_svg:
                     os.unlink(_svg)
                 io.show_file_gen(out_fname_full,
                                  verb=f' generated using [{inkscape_exe}].')
 
+    def _run_inkscape_job(self, inkscape_exe, svg_fname_full,
+                          out_fname_full):
+        """Convert a .svg file through a persistent Inkscape process.
+
+        Parameters
+        ----------
+        inkscape_exe : str
+            A full-path Inkscape executable.
+        svg_fname_full : str
+            The name of a .svg file to be converted.
+        out_fname_full : str
+            The name of the conversion output file.
+
+        Returns
+        -------
+        bool
+            True if the job has been completed through the persistent
+            process, and False if the process could not be used.
+        """
+        proc = _get_inkscape_proc(inkscape_exe)
+        if proc is None:
+            return False
+        job = ('file-open:{svg}; export-filename:{out}; export-do;'
+               ' file-close\n').format(svg=svg_fname_full,
+                                       out=out_fname_full)
+        try:
+            proc.stdin.write(job.encode('utf8'))
+            proc.stdin.flush()
+        except OSError:
+            return False
+        return _wait_inkscape_prompt(proc)
+
+    def _run_gs_job(self, gs_exe, gs_pdf_ver,
+                    pdf_fname_full, _pdf_fname_full):
+        """Reduce a PDF file size through a persistent Ghostscript process.
+
+        Parameters
+        ----------
+        gs_exe : str
+            A full-path Ghostscript executable.
+        gs_pdf_ver : float
+            The version the postprocessed PDF file will have.
+        pdf_fname_full : str
+            The name of a PDF file to be postprocessed.
+        _pdf_fname_full : str
+            The name of a temporary PDF output file.
+
+        Returns
+        -------
+        bool
+            True if the job has been completed through the persistent
+            process, and False if the process could not be used.
+        """
+        job = ('<< /OutputFile ({out}) >> setpagedevice\n'
+               '({inp}) run\n'
+               # Reverting OutputFile forces the job output to be
+               # finalized before the done marker is printed.
+               '<< /OutputFile ({null}) >> setpagedevice\n'
+               '({done}\\n) print flush\n').format(
+                   out=_ps_fname(_pdf_fname_full),
+                   inp=_ps_fname(pdf_fname_full),
+                   null=_ps_fname(os.devnull),
+                   done=_GS_JOB_DONE)
+        # The lock serializes concurrent postprocessing jobs over the
+        # shared process.
+        with _GS_LOCK:
+            proc = _get_gs_proc(gs_exe, gs_pdf_ver)
+            if proc is None:
+                return False
+            try:
+                proc.stdin.write(job.encode('utf8'))
+                proc.stdin.flush()
+            except OSError:
+                return False
+            done_marker = _GS_JOB_DONE.encode('utf8')
+            while True:
+                line = proc.stdout.readline()
+                if not line:  # The process has died.
+                    return False
+                if done_marker in line:
+                    return True
+
     def run_pdf_postproc(self, pdf_fname_full,
                          is_gs=True, gs_exe='gswin64.exe', gs_pdf_ver=1.5,
                          is_pdfcrop=True, pdfcrop_exe='pdfcrop.exe'):
@@ -974,9 +1593,11 @@ class Painter():
             The default is 1.5 (pdfTeX requirement).
         is_pdfcrop : bool, optional
             If True, the empty margins of the designated PDF file are cropped
-            using pdfcrop. The default is True.
+            using pikepdf if installed, or pdfcrop otherwise.
+            The default is True.
         pdfcrop_exe : str, optional
-            A full-path pdfcrop executable. The default is 'pdfcrop.exe'.
+            A full-path pdfcrop executable. Used only as a fallback for
+            unavailable pikepdf. The default is 'pdfcrop.exe'.
 
         Returns
         -------
@@ -990,17 +1611,21 @@ class Painter():
                    + ' run_pdf_postproc() will be skipped.')
             mt.show_warn(msg)
             return
-        valid_gs_pdf_ver = [v / 10 for v in list(range(13, 18))]
-        valid_gs_pdf_ver_str = ', '.join(map(str, valid_gs_pdf_ver))
-        if gs_pdf_ver not in valid_gs_pdf_ver:
-            msg = (f'gs_pdf_ver must be one of [{valid_gs_pdf_ver_str}].')
+        if gs_pdf_ver not in _VALID_GS_PDF_VERS:
+            msg = (f'gs_pdf_ver must be one of [{_VALID_GS_PDF_VERS_STR}].')
             raise ValueError(msg)
+        # The Ghostscript pass exists to shrink PDF files bloated by the
+        # unsubsetted Type 42 fonts of pdf.fonttype = 42. Type 3 fonts are
+        # already subsetted by the MPL PDF backend, and MPL writes PDF 1.4,
+        # which satisfies the pdfTeX requirement; skip the pass for them.
+        if is_gs and rcParams['pdf.fonttype'] == 3:
+            is_gs = False
 
         #
         # File name construction
         #
         bname, ext = os.path.splitext(pdf_fname_full)
-        _pdf_fname_full = '{}0{}'.format(bname, ext)  # Temporary .pdf storage
+        _pdf_fname_full = f'{bname}0{ext}'  # Temporary .pdf storage
 
         #
         # PDF postprocessing (1/2)
@@ -1010,77 +1635,88 @@ class Painter():
         # If this is not found, search on the path environment variable.
         # If still not found, skip running Ghostscript.
         #
-        is_gs_exe_found = bool(os.path.exists(gs_exe))
-        if not is_gs_exe_found:
-            gs_exe_on_environ_var = io.locate_exe('(?i)gs.*bin',
-                                                  '(?i)gswin[0-9]+c[.]exe$')
-            if gs_exe_on_environ_var:
-                msg = (f'The designated pdfcrop executable [{gs_exe}]'
-                       + ' could not be located,\nbut its alternative'
-                       + f' [{gs_exe_on_environ_var}] was found'
-                       + ' in the path environment variable.'
-                       + ' We fall back to this executable.')
-                mt.show_warn(msg)
-                gs_exe = gs_exe_on_environ_var
-                is_gs_exe_found = True
+        gs_exe_resolved = _resolve_exe(gs_exe,
+                                       '(?i)gs.*bin',
+                                       '(?i)gswin[0-9]+c[.]exe$',
+                                       'Ghostscript')
+        is_gs_exe_found = gs_exe_resolved is not None
+        if is_gs_exe_found:
+            gs_exe = gs_exe_resolved
         if is_gs and not is_gs_exe_found:
             msg = (f'The designated Ghostscript executable [{gs_exe}]'
                    + ' could not be located;\n'
                    + '.pdf file size reduction will be skipped.')
             mt.show_warn(msg)
         elif is_gs and is_gs_exe_found:
-            gs_exe = '"{}"'.format(gs_exe)  # A measure for blank spaces
-            _gs_cmd = [
-                gs_exe,
-                '-dSAFER',
-                '-dBATCH',
-                '-dNOPAUSE',
-                '-sDEVICE=pdfwrite',
-                '-dCompatibilityLevel={}'.format(gs_pdf_ver),
-                '-dSubsetFonts=true',
-                '-dEmbedAllFonts=true',
-                # Do not rotate the PDF file even if the height is greater
-                # than the width, which can happen in figures where the
-                # legends are placed outside the Axes.
-                # https://ghostscript.com/docs/9.54.0/VectorDevices.htm
-                '-dAutoRotatePages=/None',
-                '-sOutputFile={}'.format(_pdf_fname_full),
-                '-f {}'.format(pdf_fname_full),
-            ]
-            gs_cmd = ' '.join(_gs_cmd)
-            subprocess.run(gs_cmd, shell=True, check=True)
-            os.unlink(pdf_fname_full)
-            os.rename(_pdf_fname_full, pdf_fname_full)
+            # Feed the job to a persistent Ghostscript process first, which
+            # spares one interpreter cold start per figure, and fall back
+            # to a one-shot invocation if the process cannot be used.
+            if not self._run_gs_job(gs_exe, gs_pdf_ver,
+                                    pdf_fname_full, _pdf_fname_full):
+                gs_cmd = [
+                    gs_exe,
+                    '-dSAFER',
+                    '-dBATCH',
+                    '-dNOPAUSE',
+                    '-q',  # Keep stdout to the produced PDF bytes only.
+                    '-sDEVICE=pdfwrite',
+                    '-dCompatibilityLevel={}'.format(gs_pdf_ver),
+                    '-dSubsetFonts=true',
+                    '-dEmbedAllFonts=true',
+                    # Do not rotate the PDF file even if the height is
+                    # greater than the width, which can happen in figures
+                    # where the legends are placed outside the Axes.
+                    # https://ghostscript.com/docs/9.54.0/VectorDevices.htm
+                    '-dAutoRotatePages=/None',
+                    '-sOutputFile=%stdout%',
+                    '-f', '-',
+                ]
+                # Stream the PDF through the Ghostscript pipes rather
+                # than having Ghostscript reopen and rewrite it on disk.
+                with open(pdf_fname_full, 'rb') as fh_pdf:
+                    pdf_bytes = fh_pdf.read()
+                completed = subprocess.run(gs_cmd, input=pdf_bytes,
+                                           stdout=subprocess.PIPE,
+                                           check=True)
+                with open(_pdf_fname_full, 'wb') as fh_pdf:
+                    fh_pdf.write(completed.stdout)
+            os.replace(_pdf_fname_full, pdf_fname_full)
             io.show_file_gen(pdf_fname_full,
                              verb=f' file size reduced using [{gs_exe}].')
 
         #
         # PDF postprocessing (2/2)
-        # Crop the empty margins of .pdf using pdfcrop. The executable locating
-        # process is the same as that for Ghostscript.
+        # Crop the empty margins of .pdf by rewriting the page crop boxes
+        # in process using pikepdf, which spares one pdfcrop (a Perl script)
+        # launch per figure. Fall back to pdfcrop if pikepdf is unavailable;
+        # the executable locating process is the same as that for
+        # Ghostscript.
         #
-        is_pdfcrop_exe_found = bool(os.path.exists(pdfcrop_exe))
-        if not is_pdfcrop_exe_found:
-            pdfcrop_exe_on_environ_var = io.locate_exe('(?i)texlive',
-                                                       '(?i)pdfcrop[.]exe$')
-            if pdfcrop_exe_on_environ_var:
-                msg = (f'The designated pdfcrop executable [{pdfcrop_exe}]'
-                       + ' could not be located,\nbut its alternative'
-                       + f' [{pdfcrop_exe_on_environ_var}] was found'
-                       + ' in the path environment variable.'
-                       + ' We fall back to this executable.')
-                mt.show_warn(msg)
-                pdfcrop_exe = pdfcrop_exe_on_environ_var
-                is_pdfcrop_exe_found = True
+        if is_pdfcrop and pikepdf is not None:
+            with pikepdf.open(pdf_fname_full) as pdf:
+                for page in pdf.pages:
+                    page.cropbox = page.trimbox
+                pdf.save(_pdf_fname_full)
+            os.replace(_pdf_fname_full, pdf_fname_full)
+            io.show_file_gen(pdf_fname_full,
+                             verb=' margin cropped using [pikepdf].')
+            return
+        pdfcrop_exe_resolved = _resolve_exe(pdfcrop_exe,
+                                            '(?i)texlive',
+                                            '(?i)pdfcrop[.]exe$',
+                                            'pdfcrop')
+        is_pdfcrop_exe_found = pdfcrop_exe_resolved is not None
+        if is_pdfcrop_exe_found:
+            pdfcrop_exe = pdfcrop_exe_resolved
         if is_pdfcrop and not is_pdfcrop_exe_found:
             msg = (f'The designated pdfcrop executable [{pdfcrop_exe}]'
                    + ' could not be located;\n'
                    + '.pdf margin cropping will be skipped.')
             mt.show_warn(msg)
         elif is_pdfcrop and is_pdfcrop_exe_found:
+            pdfcrop_cmd = [pdfcrop_exe]
             # Fallback for a pdfcrop Perl script
-            pdfcrop_exe = '"{}"'.format(pdfcrop_exe)
-            if not re.search('(?i)[.]exe"?$', pdfcrop_exe):
+            if not _RE_EXE_EXT.search(pdfcrop_exe):
                 perl_exe_on_environ_var = io.locate_exe('(?i)perl',
                                                         '(?i)perl[.]exe$')
                 if not perl_exe_on_environ_var:
@@ -1091,16 +1727,13 @@ class Painter():
                            + '.pdf margin cropping will be skipped.')
                     mt.show_warn(msg)
                     return
-                pdfcrop_exe = 'perl {}'.format(pdfcrop_exe)
-            _pdfcrop_cmd = [
-                pdfcrop_exe,
-                '-margins "0 0 0 0"',
-                '{} {}'.format(pdf_fname_full, _pdf_fname_full),
+                pdfcrop_cmd = [perl_exe_on_environ_var, pdfcrop_exe]
+            pdfcrop_cmd += [
+                '-margins', '0 0 0 0',
+                pdf_fname_full, _pdf_fname_full,
             ]
-            pdfcrop_cmd = ' '.join(_pdfcrop_cmd)
-            subprocess.run(pdfcrop_cmd, shell=True, check=True)
-            os.unlink(pdf_fname_full)
-            os.rename(_pdf_fname_full, pdf_fname_full)
+            subprocess.run(pdfcrop_cmd, check=True)
+            os.replace(_pdf_fname_full, pdf_fname_full)
             io.show_file_gen(pdf_fname_full,
                              verb=f' margin cropped using [{pdfcrop_exe}].')
 
@@ -11,10 +11,19 @@ import os
 import sys
 import time
 import re
-import copy
+import atexit
+import threading
+from functools import lru_cache
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 from urllib import request, error
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+try:
+    import pyarrow
+except ImportError:  # Optional; enables the Parquet nuclear data cache
+    pyarrow = None
 
 __author__ = 'Jaewoong Jang'
 __copyright__ = 'Copyright (c) 2024 Jaewoong Jang'
@@ -22,6 +31,87 @@ __license__ = 'MIT License'
 __version__ = '1.0.1'
 __date__ = '2024-11-27'
 
+# Radionuclide name aliasing patterns; see Recurlib.get_rn_alias()
+_RE_RN_PLAIN2LC = re.compile(r'([a-z-A-Z]+)\-([0-9]+)m?')
+_RE_RN_PLAIN2CODE = re.compile('[-]')
+# Energy level bookkeeping; see Recurlib.set_gams() and
+# Recurlib.set_levs_energy_flattening()
+_RE_FROM = re.compile('(?i)^from_')
+_RE_NRG_PLUS_X = re.compile('(?i)[+]X')
+# Progenitor notation parsing; see Recurlib.set_progenitor()
+_RE_PROG_SEP = re.compile(r'(?i)\s*;\s*')
+_RE_PROG_ISOMER = re.compile('(?i)m$')
+# Nuclear isomer labeling; see Recurlib.get_rnlib()
+_RE_ISOMER_TAG = re.compile('([0-9])$')
+# Ground-state decay modes of the Live Chart ground_states dataset and
+# the rad_types values of the primary radiations they emit;
+# see Recurlib._get_allowed_radiat_types()
+_GS_DECAY_TO_RADIAT = {
+    'A': 'a',
+    'B-': 'bm',
+    'B+': 'bp',
+    'EC': 'bp',
+    'EC+B+': 'bp',
+}
+_RE_GS_DECAY_COL = re.compile(r'^decay_[0-9]+$')
+# Spectrum radiation validation; see Recurlib.set_radiat()
+_SPECTR_RADIATS_STR = '|'.join(['alpha', 'gamma', 'beta minus'])
+_RE_SPECTR_RADIAT = re.compile(r'(?i)\b({})\b'.format(_SPECTR_RADIATS_STR))
+_RE_WS = re.compile(r'\s+')
+# Live Chart web API error responses; see Recurlib.get_livechart_df()
+_RE_LC_ERROR = re.compile(rb'^([0-6])\n$')  # e.g. b'6\n'
+_LC_ERROR_CODES = {
+    # Rephrased those retrieved from:
+    # www-nds.iaea.org/relnsd/vcharthtml/api_v0_guide.html#error
+    '0': 'Valid request, but no corresponding dataset is available.',
+    '1': '"fields" unspecified.',
+    '2': '"nuclides" required for use with "fields", but unspecified.',
+    '3': '"fields" misspelled.',
+    '4': '"parents" or "products" unspecified for fission yields.',
+    '5': '"rad_types" invalid.',
+    '6': 'Unknown error.',
+}
+# A thread pool overlapping the independent per-parent Live Chart queries;
+# one worker per Live Chart rad_types value
+_FETCH_POOL = None
+# Serializes updates of the registry for nonexistent nuclear data, which
+# the fetch pool workers may write concurrently
+_NONEXIST_LOCK = threading.Lock()
+
+
+def _clone_tree(node):
+    """Clone a nested structure of dicts, lists, and scalars.
+
+    A purpose-built substitute for copy.deepcopy() on YAML-shaped data:
+    the generic deepcopy routes every node through the pickle machinery,
+    whereas the structures cloned here only ever nest dicts and lists
+    around immutable scalars.
+
+    Parameters
+    ----------
+    node : dict, list, or scalar
+        A node of the structure to be cloned.
+
+    Returns
+    -------
+    dict, list, or scalar
+        A clone sharing no mutable containers with the original.
+    """
+    if isinstance(node, dict):
+        return {k: _clone_tree(v) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_clone_tree(v) for v in node]
+    return node
+
+
+def _get_fetch_pool():
+    """Return the shared Live Chart fetch pool, creating it on first use."""
+    global _FETCH_POOL
+    if _FETCH_POOL is None:
+        _FETCH_POOL = ThreadPoolExecutor(max_workers=6)
+        atexit.register(_FETCH_POOL.shutdown)
+    return _FETCH_POOL
+
 
 class Recurlib():
     """A class for recursion-based radionuclide library generation.
@@ -72,6 +162,13 @@ class Recurlib():
     update_lineage(lineage, parent, daughter,
                    is_verbose=False)
         Update the lineage of a parent radionuclide.
+    _get_allowed_radiat_types(parent, parent_lc, nucl_data_path,
+                              nucl_data_nonexist_fname_full,
+                              is_verbose=False)
+        Return the radiation types the decay modes of a parent allow.
+    _get_daughters_single(parent, nucl_data_path,
+                          nucl_data_nonexist_fname_full, is_verbose=False)
+        Expand a parent radionuclide into its immediate daughters.
     get_daughters(parent, nucl_data_path, nucl_data_nonexist_fname_full,
                   is_verbose=False)
         Return a list of all possible progeny of a parent radionuclide.
@@ -91,6 +188,8 @@ class Recurlib():
         Flatten all possible energy levels of a radionuclide.
     set_levs_feasibility()
         Set the feasibilities of the decay modes of a radionuclide series.
+    _reorder_levs_keys()
+        Place the relation keys of levs entries at their beginnings.
     get_prio_idx_and_nums(df, sort_by, priority_num_max)
         Construct DataFrame indices and values for priority numbers.
     get_rnlib(p)
@@ -102,6 +201,27 @@ class Recurlib():
         Run recursive generation of a radionuclide library.
     """
 
+    # Slot-based attribute storage; instance attribute reads in the
+    # recursion hot paths become C-level array accesses instead of
+    # instance dictionary probes.
+    __slots__ = (
+        'prog_info',
+        'radiat',
+        'cols',
+        'lineage',
+        'levs',
+        'rn_subset_uniq',
+        'df_rnlib',
+        'df_rnlib_xml',
+        '_livechart_df_cache',
+        '_is_gs_offline',
+        '_lineage_index',
+        '_nonexist_pairs',
+        '_levs_pairs',
+        '_expansion_memo',
+        '_levs_flat_sets',
+    )
+
     def __init__(self):
         """Initialize an object of the Recurlib class."""
         self.prog_info = {
@@ -121,6 +241,26 @@ class Recurlib():
         self.cols = {}
         self.df_rnlib = None
         self.df_rnlib_xml = None
+        # Nuclear data DFs keyed by their data file names; see
+        # run_get_livechart_df()
+        self._livechart_df_cache = {}
+        # Whether a ground-states query has found the Live Chart server
+        # unreachable; see _get_allowed_radiat_types()
+        self._is_gs_offline = False
+        # Lineage nodes keyed by radionuclide names; see update_lineage()
+        self._lineage_index = {}
+        # Registered dataless radionuclide-radiation pairs; see
+        # _get_nonexist_pairs()
+        self._nonexist_pairs = None
+        # Registered parent-daughter relations of the levs dictionary;
+        # see _get_daughters_single()
+        self._levs_pairs = set()
+        # Memoized expansion outcomes keyed by parent radionuclides;
+        # see get_daughters()
+        self._expansion_memo = {}
+        # Sidecar sets of the flattened energy levels of the levs
+        # dictionary; see set_levs_energy_flattening()
+        self._levs_flat_sets = {}
 
     def set_radiat(self, spectr_radiat):
         """Populate the radiat attribute.
@@ -135,12 +275,10 @@ class Recurlib():
         None.
         """
         # Radiation type validation
-        allowed = ['alpha', 'gamma', 'beta minus']
-        re_allowed = '|'.join(allowed)
-        if not re.search(r'(?i)\b({})\b'.format(re_allowed), spectr_radiat):
+        if not _RE_SPECTR_RADIAT.search(spectr_radiat):
             msg = ('The spectrum radiation has been set to be'
                    + f' [{spectr_radiat}];\nIt must be one of'
-                   + f' [{re_allowed}]. Terminating the program.')
+                   + f' [{_SPECTR_RADIATS_STR}]. Terminating the program.')
             mt.show_warn(msg)
             sys.exit()
         # Shorten the radiation type with respect to the IAEA-NDS Live Chart
@@ -152,7 +290,7 @@ class Recurlib():
         # - shortened = 'g'
         # - spl = 'alpha' -> ['alpha']
         # - shortened = 'a'
-        spl = re.split(r'\s+', spectr_radiat)
+        spl = _RE_WS.split(spectr_radiat)
         shortened = ''.join([s[0] for s in spl])
         self.radiat.update({'long': spectr_radiat.lower(),
                             'short': shortened})
@@ -241,10 +379,16 @@ class Recurlib():
                 self.cols['rpt_to_xml'].update(
                     {col_group['nucl_data_new']: col_group['xml']})
 
-    def get_rn_alias(self, rn,
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_rn_alias(rn,
                      how='plain2lc'):
         """Return an alias of a radionuclide name.
 
+        The set of radionuclide names met in a run is small and
+        immutable, so the aliases are memoized; repeat calls in the
+        recursion become dict lookups.
+
         Parameters
         ----------
         rn : str
@@ -261,15 +405,38 @@ class Recurlib():
         # (i) Plain to the Live Chart of Nuclides notation
         # e.g. Ac-225 -> 225ac, Tc-99m -> 99tc
         if how == 'plain2lc':
-            rn_alias = re.sub(r'([a-z-A-Z]+)\-([0-9]+)m?',
-                              r'\2\1',
-                              rn_alias.lower())
+            rn_alias = _RE_RN_PLAIN2LC.sub(r'\2\1',
+                                           rn_alias.lower())
         # (ii) Plain to code notation (Jinja templating)
         if how == 'plain2code':
             # e.g. Ac-225 -> AC225, Lu-177m -> LU177M
-            rn_alias = re.sub('[-]', '', rn).upper()
+            rn_alias = _RE_RN_PLAIN2CODE.sub('', rn).upper()
         return rn_alias
 
+    def _get_nonexist_pairs(self, nucl_data_nonexist_fname_full):
+        """Return the registered dataless pairs, loading the file once.
+
+        Parameters
+        ----------
+        nucl_data_nonexist_fname_full : str
+            The name of a file containing pairs of a radionuclide and decay
+            radiation, where the radiation emission from the radionuclide
+            does not have associated nuclear data in the ENSDF database.
+
+        Returns
+        -------
+        set
+            The registered radionuclide-radiation pairs. Membership tests
+            against the returned set replace line-by-line rescans of the
+            registry file.
+        """
+        if self._nonexist_pairs is None:
+            with open(nucl_data_nonexist_fname_full,
+                      encoding='utf8') as fh_inp:
+                self._nonexist_pairs = {s.strip() for s in fh_inp
+                                        if s.strip()}
+        return self._nonexist_pairs
+
     def check_url(self, url):
         """Check if a URL is accessible.
 
@@ -337,13 +504,10 @@ class Recurlib():
         url = url_service + url_params_stringified
 
         #
-        # Read in and stringify the content of the URL, which is originally
-        # binary data, for the subsequent error checking.
-        #
-        # The "User-Agent" key-val pair is prepared in two versions:
-        # - as a list to be unpacked to two strings, which will then be passed
-        #   to request.Request.add_header() as its positional arguments
-        # - as a dict to be passed to pd.read_csv() as its positional argument
+        # Read in the content of the URL as binary data; the payload is
+        # inspected for an error code below, and on success the very same
+        # payload is parsed into a DF, so each query costs one network
+        # round trip.
         #
         storage_opts = {'User-Agent': ''}
         storage_opts_listed = list(*storage_opts.items())
@@ -351,7 +515,7 @@ class Recurlib():
         req.add_header(*storage_opts_listed)
         try:
             response = request.urlopen(req)
-            content_stringified = str(response.read())
+            payload = response.read()
         except error.URLError:
             url_reliable = 'https://8.8.8.8'  # Google public DNS
             is_url_accessible = self.check_url(url_reliable)
@@ -374,21 +538,9 @@ class Recurlib():
         #
         # Check if the data retrieval has failed.
         #
-        error_codes = {
-            # Rephrased those retrieved from:
-            # www-nds.iaea.org/relnsd/vcharthtml/api_v0_guide.html#error
-            '0': 'Valid request, but no corresponding dataset is available.',
-            '1': '"fields" unspecified.',
-            '2': '"nuclides" required for use with "fields", but unspecified.',
-            '3': '"fields" misspelled.',
-            '4': '"parents" or "products" unspecified for fission yields.',
-            '5': '"rad_types" invalid.',
-            '6': 'Unknown error.',
-        }
-        re_error = re.compile(r'(?i)^b\'([0-6]{1})\\n\'$')  # e.g. b'6\n'
-        is_error = bool(re.search(re_error, content_stringified))
-        if is_error:
-            err = re.sub(re_error, r'\1', content_stringified)  # Error code
+        err_match = _RE_LC_ERROR.match(payload)
+        if err_match:
+            err = err_match.group(1).decode()  # Error code
             # If the error code 0 is returned, add the pair of the
             # radionuclide and the decay radiation to the file listing
             # radionuclide-radiation pairs having no associated nuclear data,
@@ -396,36 +548,27 @@ class Recurlib():
             if (err == '0'
                     and nucl_data_nonexist_fname_full
                     and decay_radiat_type_pair):
-                # Examine the registry if the pair is already listed in it.
-                is_already_listed = False
-                with open(nucl_data_nonexist_fname_full,
-                          encoding='utf8') as fh_inp:
-                    nonexist_pairs = [s.rstrip() for s in fh_inp.readlines()
-                                      if not re.search('^$', s)]
-                    for nonexist_pair in nonexist_pairs:
-                        # If already listed in the registry, the pair needs
-                        # not be added to it.
-                        if re.search(nonexist_pair, decay_radiat_type_pair):
-                            is_already_listed = True
-                            break
-                if not is_already_listed:
-                    # Add the dataless pair to the registry. Remove, if any,
-                    # duplicate pairs, and sort them.
-                    nonexist_pairs.append(decay_radiat_type_pair)
-                    nonexist_pairs_uniq = mt.get_unique(nonexist_pairs)
-                    nonexist_pairs_uniq_sorted = sorted(nonexist_pairs_uniq)
-                    with open(nucl_data_nonexist_fname_full, 'w',
-                              encoding='utf8') as fh_out:
-                        for nonexist_pair in nonexist_pairs_uniq_sorted:
-                            fh_out.write(f'{nonexist_pair}\n')
+                # The lock serializes the registry update against the
+                # other fetch pool workers.
+                with _NONEXIST_LOCK:
+                    nonexist_pairs = self._get_nonexist_pairs(
+                        nucl_data_nonexist_fname_full)
+                    # If already listed in the registry, the pair needs
+                    # not be added to it.
+                    if decay_radiat_type_pair not in nonexist_pairs:
+                        # Add the dataless pair to the registry, and
+                        # append it to the registry file.
+                        nonexist_pairs.add(decay_radiat_type_pair)
+                        with open(nucl_data_nonexist_fname_full, 'a',
+                                  encoding='utf8') as fh_out:
+                            fh_out.write(f'{decay_radiat_type_pair}\n')
                 if is_verbose:
                     msg = f'An error raised for: [{decay_radiat_type_pair}]'
                     mt.show_warn(msg)
             if is_verbose:
-                mt.show_warn(error_codes[err])
+                mt.show_warn(_LC_ERROR_CODES[err])
             return None
-        return pd.read_csv(url,
-                           storage_options=storage_opts)
+        return pd.read_csv(BytesIO(payload))
 
     def run_get_livechart_df(self, dat_fname_full, url_params,
                              nucl_data_nonexist_fname_full='',
@@ -466,12 +609,33 @@ class Recurlib():
         #    fetched data to a file to the user-specified path for any
         #    future use.
         #
-        is_decay_file = bool(os.path.exists(dat_fname_full))
+        # Reuse a DF already loaded in this run; the same data file is
+        # requested repeatedly when branching decay revisits a nuclide.
+        # A copy is handed out so that column additions by one caller do
+        # not leak into another. The single stat call doubles as the
+        # existence check below and keys the cache by the file mtime,
+        # invalidating stale entries if the file is replaced midrun.
+        try:
+            mtime = os.stat(dat_fname_full).st_mtime_ns
+        except OSError:  # The data file does not exist (yet).
+            mtime = None
+        cache_key = (dat_fname_full, mtime)
+        if cache_key in self._livechart_df_cache:
+            df_lc = self._livechart_df_cache[cache_key]
+            return df_lc.copy() if df_lc is not None else None
+        is_decay_file = mtime is not None
+        pq_fname_full = f'{dat_fname_full}.parquet'
         if is_decay_file:
             if is_verbose:
                 print(f'The nuclear data file [{dat_fname_full}] found.')
             try:
-                df_lc = pd.read_csv(dat_fname_full)
+                # Prefer the Parquet companion written at fetch time;
+                # Parquet deserialization is several times faster than
+                # reparsing the CSV text.
+                if pyarrow is not None and os.path.exists(pq_fname_full):
+                    df_lc = pd.read_parquet(pq_fname_full)
+                else:
+                    df_lc = pd.read_csv(dat_fname_full)
             except Exception:
                 msg = (f'The nuclear data file [{dat_fname_full}] could'
                        + ' not be loaded correctly.\nPlease check if the'
@@ -491,6 +655,16 @@ class Recurlib():
                 io.mk_dir(dat_dname, is_yn=False)
                 df_lc.to_csv(dat_fname_full)
                 io.show_file_gen(dat_fname_full)
+                if pyarrow is not None:
+                    df_lc.to_parquet(pq_fname_full)
+                # Rekey on the freshly written file so the next call for
+                # it, now finding the file on disk, hits the cache.
+                cache_key = (dat_fname_full,
+                             os.stat(dat_fname_full).st_mtime_ns)
+        if isinstance(df_lc, pd.DataFrame):
+            self._livechart_df_cache[cache_key] = df_lc.copy()
+        else:  # Data retrieval failure; cached to skip repeat queries
+            self._livechart_df_cache[cache_key] = None
         return df_lc
 
     def update_lineage(self, lineage, parent, daughter,
@@ -527,7 +701,11 @@ class Recurlib():
             print('\n'
                   + mt.centering('update_lineage(lineage, parent, daughter)')
                   + '\n')
-            the_comps = ['lineage', 'parent', 'daughter']
+            the_comps = {
+                'lineage': lineage,
+                'parent': parent,
+                'daughter': daughter,
+            }
             the_comps_lengths = [len(s) for s in the_comps]
             lengthiest = max(the_comps_lengths)
         #
@@ -538,13 +716,19 @@ class Recurlib():
         if len(lineage) == 0:
             if is_verbose:
                 print(mt.centering('*A decay chain progenitor*'))
-                for comp in the_comps:
-                    print(f'    - %-{lengthiest}s: %s' % (comp, eval(comp)))
+                for comp, comp_val in the_comps.items():
+                    print(f'    - %-{lengthiest}s: %s' % (comp, comp_val))
             # At the very first call of this function, initialize the uppermost
             # dictionary with the parent radionuclide being a key and a pair of
             # its daughter, and an anonymous dictionary being the value.
             # e.g. lineage['Ac-225'] = {'Fr-221': {}}
             lineage[parent] = {daughter: {}}
+            # Index the created nodes by radionuclide name; see (ii) below
+            # for the role of the index.
+            self._lineage_index.setdefault(parent, []).append(
+                lineage[parent])
+            self._lineage_index.setdefault(daughter, []).append(
+                lineage[parent][daughter])
         #
         # (ii) Progeny of the lineage
         # e.g. Fr-221, At-217, Bi-213, ...
@@ -558,101 +742,47 @@ class Recurlib():
             # - ...
             if is_verbose:
                 print(mt.centering('**A decay chain progeny**'))
-                for comp in ['lineage', 'parent', 'daughter']:
-                    print(f'    - %-{lengthiest}s: %s' % (comp, eval(comp)))
-            #
-            # Recursively traverse the nested dictionaries until we find a key
-            # that has the same name as the parent radionuclide.
-            #
-            # Base case
-            # - branch == parent, meaning that we have arrived at the
-            #   dictionary to which the pair of the daughter nuclide and
-            #   an anonymous dictionary will be added.
+                for comp, comp_val in the_comps.items():
+                    print(f'    - %-{lengthiest}s: %s' % (comp, comp_val))
             #
-            # Recursive case
-            # - branch != parent, and
-            #   - len(lineage[branch]) >= 1, meaning that there is a nested
-            #     dictionary down to the current level.
+            # Attach the daughter under every node of the parent
+            # radionuclide via the flat node index, which maps each
+            # radionuclide name to the mutable child dictionaries created
+            # for it. The index makes an insertion O(1) in the chain
+            # length; it replaces a recursive traversal of the nested
+            # dictionaries from the root, which rescanned the whole tree
+            # on every insertion.
             #
-            # Example: Ac-225
-            # - Conditions
-            #   - lineage = {'Ac-225': {'Fr-221': {}}}
-            #   - parent = 'Fr-221'
-            #   - daughter = 'At-217'
-            # 1. "branch: 'Ac-225'" is not "parent: 'Fr-221'".
-            #    As the base case has not been met, the program enters into
-            #    the else conditional.
-            # 2. The else conditional would be True, as there is the nested
-            #    dictionary {'Fr-221': {}} under lineage['Ac-225']:
-            #    len(lineage['Ac-225']) == len({'Fr-221': {}}): 1 >= 1
-            # 3. The function is recursively called with
-            #    lineage['Ac-225'] == {'Fr-221': {}}.
-            # 4. Conditions
-            #    - lineage = {'Fr-221': {}}
-            #    - parent = 'Fr-221'
-            #    - daughter = 'At-217'
-            # 5. branch: 'Fr-221' is equal to parent: 'Fr-221'.
-            #    The base case has now been satisfied, executing:
-            #    lineage['Fr-221'].update({'At-217': {}}), which would yield
-            #    'Fr-221': {'At-217': {}}
+            # A radionuclide can own more than one node: the same nuclide
+            # is reached through different branching paths, each path
+            # nesting its own anonymous dictionary.
+            # Example: Bi-213 decays to Pb-209 through either Tl-209 or
+            # Po-213, placing one 'Pb-209' node under each branch. An
+            # insertion for the parent 'Pb-209' must then be mirrored to
+            # both nodes, exactly as the traversal it replaces updated
+            # every matching key in the tree.
             #
-            for branch in lineage.keys():
+            for parent_node in self._lineage_index.get(parent, []):
                 if is_verbose:
-                    branch_expl = f'        - branch (lineage key): {branch}'
-                    print(branch_expl)
-                if branch == parent:  # Base case
-                    if is_verbose:
-                        print(f'{branch_expl} == parent: {parent}')
-                    #
-                    # - Note that we need to use update() rather the equals
-                    #   sign below (e.g. lineage[branch] = {daughter: {}}),
-                    #   otherwise lineage[branch] would be initialized if it
-                    #   has more than two daughter radionuclides.
-                    # - Example: Bi-213 having the daughters Tl-209 and Po-213
-                    #   lineage = {'Bi-213': {'Tl-209': {'Pb-209': ...}}}
-                    #   Assume that the nesting of 'Tl-209' has been completed,
-                    #   and the current daughter is 'Po-213'. When 'Po-213'
-                    #   could locate 'Bi-213' as its parent, the command
-                    #   lineage[branch] = {daughter: {}} would result in
-                    #   lineage['Bi-213'] = {'Po-213: {}}, intializing the
-                    #   anonymous dictionary bound to lineage['Bi-213'] and
-                    #   hence removing the nested anonymous dictionary
-                    #   {'Tl-209': {'Pb-209': ...}}.
-                    #
-                    lineage[branch].update({daughter: {}})
-                    break
-                else:
-                    #
-                    # - Without the conditional len(lineage[branch]) >= 1,
-                    #   an empty nested dictionary {} would also be passed to
-                    #   a recursive call as the "lineage" positional argument.
-                    # - Remember that an empty lineage dictionary is the sign
-                    #   of the progenitor of the lineage; see the beginning
-                    #   part of this function. This would execute the command
-                    #   lineage[parent] = {daughter: {}}, and result in one
-                    #   or more additional and unintended progenitors.
-                    #
-                    if len(lineage[branch]) >= 1:
-                        if is_verbose:
-                            print('Recursively calling update_lineage()'
-                                  + ' with lineage[branch],'
-                                  + ' or {},'.format(lineage[branch])
-                                  + ' as lineage...')
-                        self.update_lineage(lineage[branch],
-                                            parent, daughter,
-                                            is_verbose=is_verbose)
+                    print(f'        - parent node of [{parent}]:'
+                          + f' {parent_node}')
+                parent_node[daughter] = {}
+                self._lineage_index.setdefault(daughter, []).append(
+                    parent_node[daughter])
         if is_verbose:
             print(f'Updated lineage: {lineage}')
 
-    def get_daughters(self, parent,
-                      nucl_data_path, nucl_data_nonexist_fname_full,
-                      is_verbose=False):
-        """Return a list of all possible progeny of a parent radionuclide.
+    def _get_allowed_radiat_types(self, parent, parent_lc, nucl_data_path,
+                                  nucl_data_nonexist_fname_full,
+                                  is_verbose=False):
+        """Return the radiation types the decay modes of a parent allow.
 
         Parameters
         ----------
         parent : str
             A parent radionuclide of interest.
+        parent_lc : str
+            The Live Chart web API alias of the parent radionuclide.
         nucl_data_path : str
             A directory containing nuclear data files.
         nucl_data_nonexist_fname_full : str
@@ -660,46 +790,102 @@ class Recurlib():
             radiation, where the radiation emission from the radionuclide
             does not have associated nuclear data in the ENSDF database.
         is_verbose : bool, optional
-            If True, the unwinding process of recursion will be displayed.
+            If True, the pruned radiation types will be displayed.
             The default is False.
 
         Returns
         -------
-        daughters : list
-            A list of all possible progeny of the parent radionuclide.
-            Duplicate daughter nuclides can be included if:
-            (i) branching decay is involved in any stage of the decay
-                of a parent radionuclide, and incidentally the same nuclides
-                are generated through different branching paths.
-            (ii) multiple parents have been specified in the user input file,
-                 and one or more daughter nuclides of each parent radionuclide
-                 can incidentally appear in the decay stage of other parents.
-            As this function involves recursion, duplicate daughter nuclidess,
-            if any, should and will be removed outside of this function.
+        allowed_radiat_types : set
+            The Live Chart rad_types values worth querying for the parent
+            radionuclide.
         """
         #
-        # Synopsis
-        #
-        # Assume that this function has been called from outside with the
-        # string 'Ac-225' passed as the positional argument (there will be
-        # some cases this function is invoked internally; see the number 3
-        # below).
-        #
-        # 1. The string 'Ac-225' is converted to '225ac' to conform to the
-        #    the web API syntax of the IAEA-NDS Live Chart of Nuclides.
-        # 2. Query all possible types of radiation emission of Ac-225 to
-        #    the Live Chart web API server, and for existing datasets,
-        #    retrieve a list of the resulting daughter nuclides, no matter
-        #    the associated branching fractions.
-        # 3. Call this function with each of the collected daughter nuclides
-        #    passed as the "parent" positional argument, and repeat such
-        #    recursive calls until no daughter nuclide is retrieved; namely,
-        #    the base case for the recursion to terminate is an empty list of
-        #    daughter nuclides. Taking Ac-225 as an example, the recursion will
-        #    end on 'Tl-205' as this nuclide is stable and hence has no
-        #    daughter.
-        #
+        # The primary radiations alpha, beta plus, and beta minus are each
+        # tied to one decay mode, whereas electrons, gamma rays, and X-rays
+        # are emitted in the wake of any decay mode. The decay modes listed
+        # in the ground_states dataset of the Live Chart, one small query
+        # per parent, can therefore rule out up to three of the six
+        # decay_rads queries of get_daughters() in advance.
+        #
+        allowed_radiat_types = {'a', 'bp', 'bm', 'e', 'g', 'x'}
+        # A nuclear isomer can decay through modes its ground state does
+        # not (e.g. the alpha decay of Am-242m), and the ground_states
+        # dataset is then not authoritative; prune nothing.
+        if parent.endswith('m'):
+            return allowed_radiat_types
+        gs_pair = f'{parent}_gs'
+        if gs_pair in self._get_nonexist_pairs(nucl_data_nonexist_fname_full):
+            return allowed_radiat_types
+        gs_fname_full = '{}/{}/{}.csv'.format(nucl_data_path, parent, gs_pair)
+        # The ground-states metadata is purely an optimization; if the
+        # file is not cached and an earlier query already found the Live
+        # Chart server unreachable, prune nothing rather than querying
+        # again.
+        if self._is_gs_offline and not os.path.exists(gs_fname_full):
+            return allowed_radiat_types
+        url_params = {
+            'fields': 'ground_states',
+            'nuclides': parent_lc,
+        }
+        try:
+            df_gs = self.run_get_livechart_df(
+                gs_fname_full, url_params,
+                nucl_data_nonexist_fname_full=nucl_data_nonexist_fname_full,
+                decay_radiat_type_pair=gs_pair,
+                is_verbose=is_verbose)
+        except SystemExit:
+            # The decay data cache may still be complete; a fully
+            # offline run must not be terminated over a metadata query
+            # that only narrows the decay data queries.
+            self._is_gs_offline = True
+            return allowed_radiat_types
+        if not isinstance(df_gs, pd.DataFrame):
+            return allowed_radiat_types  # Metadata unavailable
+        decay_cols = [c for c in df_gs.columns if _RE_GS_DECAY_COL.match(c)]
+        decay_modes = {str(v).strip()
+                       for col in decay_cols
+                       for v in df_gs[col].dropna()}
+        decay_modes.discard('')
+        # Prune only if every listed decay mode is a known one; an
+        # unrecognized mode means the metadata is not fully understood
+        # and all queries are kept.
+        if not decay_modes or not decay_modes <= set(_GS_DECAY_TO_RADIAT):
+            return allowed_radiat_types
+        allowed_radiat_types = ({_GS_DECAY_TO_RADIAT[decay_mode]
+                                 for decay_mode in decay_modes}
+                                | {'e', 'g', 'x'})
+        if is_verbose:
+            msg = (f'The ground-state decay modes of [{parent}] are'
+                   + f' [{decay_modes}]; the radiation types queried are'
+                   + f' narrowed to [{allowed_radiat_types}].')
+            print(msg)
+        return allowed_radiat_types
+
+    def _get_daughters_single(self, parent,
+                              nucl_data_path, nucl_data_nonexist_fname_full,
+                              is_verbose=False):
+        """Expand a parent radionuclide into its immediate daughters.
 
+        Parameters
+        ----------
+        parent : str
+            A parent radionuclide of interest.
+        nucl_data_path : str
+            A directory containing nuclear data files.
+        nucl_data_nonexist_fname_full : str
+            The name of a file containing pairs of a radionuclide and decay
+            radiation, where the radiation emission from the radionuclide
+            does not have associated nuclear data in the ENSDF database.
+        is_verbose : bool, optional
+            If True, the unwinding process of recursion will be displayed.
+            The default is False.
+
+        Returns
+        -------
+        daughters : list
+            The daughter nuclides identified across the decay radiation
+            types of the parent radionuclide, without duplicates.
+        """
         #
         # Convert the nuclide notation with respect to the Live Chart web API
         # syntax. Note that to conform to the syntax, the "m" symbol of
@@ -724,13 +910,14 @@ class Recurlib():
         ]
         # **Identified daughters will be tallied to the "daughters" list.**
         daughters = []
+        daughters_seen = set()  # Shadow of "daughters" for O(1) membership
         if is_verbose:
             func_name_centered = mt.centering(
-                'get_daughters(parent, nucl_data_path,'
+                '_get_daughters_single(parent, nucl_data_path,'
                 + ' nucl_data_nonexist_fname_full)')
             msg = ('\n'
                    + func_name_centered
-                   + '\n\nUnder a new local namespace for this call\n'
+                   + '\n\nExpanding a parent radionuclide\n'
                    + '              "parent": [{}]\n'.format(parent)
                    + '   Initial "daughters": [{}]\n'.format(
                        ', '.join(daughters)))
@@ -738,7 +925,20 @@ class Recurlib():
         # Energy flattening of the parent radionuclide in question:
         # Preprocessing for possible decay mode inspection
         self.set_levs_energy_flattening(parent)
+        # Stage the per-radiation-type queries first; the queries are
+        # independent HTTP requests and are overlapped through the shared
+        # fetch pool, while the stateful daughter bookkeeping further
+        # below remains sequential.
+        # Decay modes of the parent radionuclide rule out some of the
+        # primary radiation queries in advance; e.g. no beta data can
+        # exist for a pure alpha emitter.
+        allowed_radiat_types = self._get_allowed_radiat_types(
+            parent, parent_lc, nucl_data_path,
+            nucl_data_nonexist_fname_full, is_verbose=is_verbose)
+        fetch_jobs = []
         for radiat_type in radiat_types:  # 'a', 'bp', 'bm', ..., 'x'
+            if radiat_type not in allowed_radiat_types:
+                continue
             #
             # Check if the pair of the radionuclide and the decay radiation is
             # included in the registry for nonexistent nuclear data.
@@ -748,12 +948,9 @@ class Recurlib():
             #    as well.
             #
             decay_radiat_type_pair = '{}_{}'.format(parent, radiat_type)
-            is_nonexistent = False
-            with open(nucl_data_nonexist_fname_full) as fh_inp:
-                for pair in fh_inp.readlines():
-                    if re.search(decay_radiat_type_pair, pair):
-                        is_nonexistent = True
-                        break
+            is_nonexistent = (decay_radiat_type_pair
+                              in self._get_nonexist_pairs(
+                                  nucl_data_nonexist_fname_full))
             if is_nonexistent:
                 if is_verbose:
                     msg = (f'The radionuclide [{parent}] does not have nuclear'
@@ -774,11 +971,23 @@ class Recurlib():
                 'nuclides': parent_lc,
                 'rad_types': radiat_type,
             }
-            df_p = self.run_get_livechart_df(  # df_p: parent DF
+            fetch_jobs.append((decay_fname_full, url_params,
+                               decay_radiat_type_pair))
+        # Local alias for the hot bookkeeping loop below; the attribute is
+        # only ever reassigned outside this function.
+        levs = self.levs
+        pool = _get_fetch_pool()
+        futures = [  # One future per staged query, in radiat_types order
+            pool.submit(
+                self.run_get_livechart_df,
                 decay_fname_full, url_params,
                 nucl_data_nonexist_fname_full=nucl_data_nonexist_fname_full,
                 decay_radiat_type_pair=decay_radiat_type_pair,
                 is_verbose=is_verbose)
+            for (decay_fname_full, url_params,
+                 decay_radiat_type_pair) in fetch_jobs]
+        for future in futures:
+            df_p = future.result()  # df_p: parent DF
             # df_p will be "None" on data retrieval failure.
             if isinstance(df_p, pd.DataFrame):
                 # Remember that at this point, we are within the loop of
@@ -801,9 +1010,21 @@ class Recurlib():
                 # the names of daughter nuclides with respect to the notation
                 # of RecurLib;
                 # e.g. 225ac to 'Ac-225'
-                df_p['d_a'] = df_p['d_z'] + df_p['d_n']
-                df_p['d_rn'] = df_p['d_symbol'] + '-' + df_p['d_a'].astype(str)
-                candidates_uniq = df_p['d_rn'].unique().tolist()
+                d_a = df_p['d_z'].to_numpy() + df_p['d_n'].to_numpy()
+                d_rn = (df_p['d_symbol'].to_numpy(dtype=object)
+                        + '-' + d_a.astype(str))
+                df_p['d_a'] = d_a
+                df_p['d_rn'] = d_rn
+                candidates_uniq = pd.unique(d_rn).tolist()
+                # Condition (i) of the level bequest below: Probable
+                # energy levels of the parent. The mask is independent
+                # of the daughters iterated over, hence computed once
+                # per DF; the frozenset hands isin an already hashed
+                # collection.
+                has_d_levs = 'daughter_level_energy' in df_p.columns
+                if has_d_levs:  # p: parent
+                    bool_idx_p_nrg_lev = df_p['p_energy'].isin(
+                        self._levs_flat_sets[parent])
                 for daughter in candidates_uniq:
                     #
                     # Skip if the daughter and parent nuclides are the same
@@ -852,7 +1073,8 @@ class Recurlib():
                     # will specify Fr-221, which is the product of Ac-225
                     # alpha decay, as their resulting daughter nuclide.
                     #
-                    if daughter not in daughters:
+                    if daughter not in daughters_seen:
+                        daughters_seen.add(daughter)
                         daughters.append(daughter)
                         # Update the parent-daughter decay relation.
                         self.update_lineage(self.lineage, parent, daughter,
@@ -864,38 +1086,27 @@ class Recurlib():
                     # (i) parent: Add up its daughter information.
                     p_list_key = 'parents'
                     d_list_key = 'daughters'
-                    if d_list_key not in self.levs[parent]:
-                        self.levs[parent][d_list_key] = []
-                    if daughter not in self.levs[parent][d_list_key]:
-                        self.levs[parent][d_list_key].append(daughter)
-                    # Key reorganization: If the parent radionuclide also has
-                    # its parents key, place it before the daughters key.
-                    if p_list_key in self.levs[parent]:
-                        self.levs[parent] = {
-                            p_list_key: self.levs[parent].pop(p_list_key),
-                            d_list_key: self.levs[parent].pop(d_list_key),
-                            **self.levs[parent],
-                        }
-                    # Key reorganization: Place the daughters key at the
-                    # beginning.
-                    else:
-                        self.levs[parent] = {
-                            d_list_key: self.levs[parent].pop(d_list_key),
-                            **self.levs[parent],
-                        }
+                    # The relation pair set shadows the two relation
+                    # lists below, which share its lifetime: a pair
+                    # registered once has already been appended to both
+                    # lists, so the list scans reduce to one hashed test.
+                    is_new_pair = (parent, daughter) not in self._levs_pairs
+                    if is_new_pair:
+                        self._levs_pairs.add((parent, daughter))
+                    if d_list_key not in levs[parent]:
+                        levs[parent][d_list_key] = []
+                    if is_new_pair:
+                        levs[parent][d_list_key].append(daughter)
                     # (ii) daughter: Add up its parent information.
-                    if daughter not in self.levs:
-                        self.levs[daughter] = {}
-                    if p_list_key not in self.levs[daughter]:
-                        self.levs[daughter][p_list_key] = []
-                    if parent not in self.levs[daughter][p_list_key]:
-                        self.levs[daughter][p_list_key].append(parent)
-                    # Key reorganization: Place the parents key at the
-                    # beginning.
-                    self.levs[daughter] = {
-                        p_list_key: self.levs[daughter].pop(p_list_key),
-                        **self.levs[daughter],
-                    }
+                    if daughter not in levs:
+                        levs[daughter] = {}
+                    if p_list_key not in levs[daughter]:
+                        levs[daughter][p_list_key] = []
+                    if is_new_pair:
+                        levs[daughter][p_list_key].append(parent)
+                    # The relation keys are moved to the beginning of
+                    # the entries once, at report time; see
+                    # _reorder_levs_keys().
                     #
                     # Memorize the energy levels of a daughter resulting from
                     # the decay of its parent, which will be used to
@@ -915,13 +1126,11 @@ class Recurlib():
                     # Step 1
                     # 'daughter_level_energy' is the name of a column in
                     # a Live Chart-fetched nuclear data file.
-                    if 'daughter_level_energy' in df_p.columns:  # p: parent
-                        # Condition (i): Probable energy levels of the parent
-                        bool_idx_p_nrg_lev = df_p['p_energy'].isin(
-                            self.levs[parent]['energy_levels_flattened'])
+                    if has_d_levs:
                         # Condition (ii): Daughter data correspond to the
-                        # current daughter in question
-                        bool_idx_d_rn = df_p['d_rn'] == daughter  # d: daughter
+                        # current daughter in question; the comparison
+                        # runs on the raw name array.
+                        bool_idx_d_rn = d_rn == daughter  # d: daughter
                         # Decay modes of the parent radionuclide producing
                         # the daughter nuclide in question
                         # e.g. Ac-225 --a--> Fr-221
@@ -930,9 +1139,9 @@ class Recurlib():
                         d_levs = df_p.loc[bool_idx_p_nrg_lev & bool_idx_d_rn,
                                           'daughter_level_energy'].to_list()
                         p_bequest_key = f'from_{parent}'
-                        if p_bequest_key not in self.levs[daughter]:
-                            self.levs[daughter][p_bequest_key] = {}
-                        self.levs[daughter][p_bequest_key].update(
+                        if p_bequest_key not in levs[daughter]:
+                            levs[daughter][p_bequest_key] = {}
+                        levs[daughter][p_bequest_key].update(
                             {'decay_modes': p_decays,
                              'energy_levels': d_levs})
                     # Step 2
@@ -940,170 +1149,186 @@ class Recurlib():
                     self.set_levs(daughter, nucl_data_path)
         if is_verbose:
             print('Identified "daughters": [{}]'.format(', '.join(daughters)))
+        return daughters
 
-        #
-        # Recursion
-        #
-        # Base case
-        # - len(daughters) == 0, meaning that there is no daughter nuclide.
-        #
-        # Recursive case
-        # - len(daughters) >= 1, meaning that there is at least one nuclide
-        #   identified as a daughter nuclide.
-        #
-        # Example: Ac-225
-        # - Ac-225 decay chain can be described as:
-        #   (1) Ac-225 --a--> Fr-221 --a--> At-217 --a--> Bi-213
-        #   (2a) Bi-213 --a--> Tl-209 --bm--> Pb-209
-        #   (2b) Bi-213 --bm--> Po-213 --a--> Pb-209
-        #   (3) Pb-209 --bm--> Bi-209 (--a--> Tl-205)
-        # - The decay scheme of Bi-209 is enclosed with a pair of parentheses
-        #   as Bi-209 has a physical half-life of 2.01e19 y, which is long
-        #   enough to make it a practically stable nuclide.
-        # - Note from (2a) and (2b) that Bi-213 decays to its granddaughter
-        #   Pb-209 through either beta minus followed by alpha or the other
-        #   way round, effectively emitting a pair of alpha and beta minus
-        #   particles in one series of Ac-225 decay event.
-        #
-        # The expected scenario is as follows:
-        # 1. This function is invoked from outside, with the string 'Ac-225'
-        #    passed as the positional argument "parent".
-        # 2. An anonymous list ['Fr-221'] will be added to the daughters list:
-        #    daughters = ['Fr-221']
-        # 3. Since the recursive condition "len(daughters) >= 1" is met,
-        #    the element 'Fr-221' will be passed to a recursive call of this
-        #    function as the positional argument "parent".
-        #    Note that at this point, the first invocation of this function
-        #    and therefore its local namespace remains alive and is stacked
-        #    up in the memory.
-        # 4. The recursive call with 'Fr-221' will result in
-        #    daughters = ['At-217'] and invoke a next call with 'At-217'.
-        # 5. The recursive call with 'At-217' will result in
-        #    daughters = ['Bi-213'] and invoke a next call with 'Bi-213'.
-        # 6. The recursive call with 'Bi-213' will result in
-        #    daughters = ['Tl-209', 'Po-213'] and invoke a next call with
-        #    'Tl-209'.
-        #    **Note that 'Po-213' will be explored when we are done with
-        #    'Tl-209' and its progeny.**
-        # 7. The recursive call with 'Tl-209' will result in
-        #    daughters = ['Pb-209'] and invoke a next call with 'Pb-209'.
-        # 8. The recursive call with 'Pb-209' will result in
-        #    daughters = ['Bi-209'] and invoke a next call with 'Bi-209'.
-        # 9. The recursive call with 'Bi-209' will result in
-        #    daughters = ['Tl-205'] and invoke a next call with 'Tl-205'.
-        # 10a. The recursive call with 'Tl-205' will result in
-        #      daughters = [], satisfying the base case
-        #      "len(daughters) == 0".
-        # 10b. This recursive call will be the first one, out of the many of
-        #      its predecessors, to arrive at the statement "return daughters".
-        # 10c. Now is the time for the recursive calls starting from 'Tl-209'
-        #      to be unwinded back out.
-        #      Where were we when we dove into the base case-met recursive
-        #      call?
-        #      We were right after the plus-equals sign which is meant to
-        #      add up all the daughter nuclides into the list "daughters":
-        #          daughters += get_daughters(parent,
-        #                                     nucl_data_path,
-        #                                     nucl_data_nonexist_fname_full)
-        #      The effect of unwinding is illustrated below.
-        #          daughters += []
-        #          daughters += ['Tl-205']
-        #          daughters += ['Bi-209'] + ['Tl-205']
-        #          daughters += ['Pb-209'] + ['Bi-209'] + ['Tl-205']
-        # 11. Remember that 'Tl-209' was where we left off, which is the
-        #     parent of 'Pb-209' and the first daughter of 'Bi-213', and has
-        #     a younger sister 'Po-213'. Since the series of recursive calls
-        #     starting from 'Tl-209' has ended, we now resume the iteration
-        #     from the second element of ['Tl-209', 'Po-213'], namely 'Po-213'.
-        # 12. The recursive call with 'Po-213' will result in
-        #     daughters = ['Pb-209'] and invoke a next call with 'Pb-209'.
-        # 13. The recursive call with 'Pb-209' will result in
-        #     daughters = ['Bi-209'] and invoke a next call with 'Bi-209'.
-        # 14. The recursive call with 'Bi-209' will result in
-        #     daughters = ['Tl-205'] and invoke a next call with 'Tl-205'.
-        # 15a. The recursive call with 'Tl-205' will result in
-        #      daughters = [], satisfying the base case
-        #      "len(daughters) == 0".
-        # 15b. The rest is the same as the end of the recursive calls starting
-        #      from 'Pb-209'; the effect of unwinding is illustrated below.
-        #          daughters += []
-        #          daughters += ['Tl-205']
-        #          daughters += ['Bi-209'] + ['Tl-205']
-        #          daughters += ['Pb-209'] + ['Bi-209'] + ['Tl-205']
-        # 16a. As all of the elements of 'Bi-213', or ['Pb-209', 'Po-213'],
-        #      have been iterated through, the program will arrive at the
-        #      subsequent return statement, returning the daughters list
-        #      to its previous recursive call.
-        #          (from the 'Tl-209' line)
-        #          daughters += ['Pb-209', 'Bi-209', 'Tl-205']
-        #          (from the 'Po-213' line)
-        #          daughters += ['Pb-209', 'Bi-209', 'Tl-205']
-        #          The two lists will then be concatenated into one:
-        #          daughters += ['Pb-209', 'Bi-209', 'Tl-205',
-        #                        'Pb-209', 'Bi-209', 'Tl-205']
-        # 16b. The daughters ['Pb-209', 'Bi-209', 'Tl-205', 'Pb-209', 'Bi-209',
-        #      'Tl-205'] will now be carried back into the previous recursive
-        #      call at the right-hand side of
-        #      "daughters += get_daughters(daughters_as_parent,
-        #                                  nucl_data_path,
-        #                                  nucl_data_nonexist_fname_full,
-        #                                  is_verbose=is_verbose)".
-        # 17. The rest is simply a process of unwinding back up to the first
-        #     recursive call; the effect of unwinding is illustrated below.
-        #         daughters += ['Tl-209', 'Po-213',
-        #                       'Pb-209', 'Bi-209','Tl-205',
-        #                       'Pb-209', 'Bi-209','Tl-205']
-        #         daughters += ['Bi-213', 'Tl-209', 'Po-213',
-        #                       'Pb-209', 'Bi-209', 'Tl-205',
-        #                       'Pb-209', 'Bi-209', 'Tl-205']
-        #         daughters += ['At-217',
-        #                       'Bi-213', 'Tl-209', 'Po-213',
-        #                       'Pb-209', 'Bi-209', 'Tl-205',
-        #                       'Pb-209', 'Bi-209', 'Tl-205']
-        #         Remember that we had daughters = ['Fr-221'] when the
-        #         function was called from outside with 'Ac-225' as the
-        #         "parent" positional argument:
-        #         ['Fr-221'] += ['At-217',
-        #                        'Bi-213', 'Tl-209', 'Po-213',
-        #                        'Pb-209', 'Bi-209', 'Tl-205',
-        #                        'Pb-209', 'Bi-209', 'Tl-205']
-        #         The final daughters list will therefore be:
-        #         daughters = ['Fr-221', 'At-217',
-        #                      'Bi-213', 'Tl-209', 'Po-213',
-        #                      'Pb-209', 'Bi-209', 'Tl-205',
-        #                      'Pb-209', 'Bi-209', 'Tl-205']
-        #     Note that there are two groups of ['Pb-209', 'Bi-209', 'Tl-205']
-        #     in the daughters list. The first group originates from the
-        #     series of recursive calls starting from 'Tl-209', which is the
-        #     product of the alpha decay of 'Bi-213'. The second group, on the
-        #     other hand, has been derived from the the successive recursive
-        #     calls starting from 'Po-213', which is the product of the beta
-        #     minus decay of 'Bi-213'.
-        # 18. Now with the final daughters list, containing some duplicates as
-        #     a result of the branching decay of 'Bi-213', the last alive call
-        #     of this function is finally terminated and returns all possible
-        #     progeny nuclides of 'Ac-225'.
-        #     Note that the duplicate nuclides should and will be removed
-        #     outside this function.
-        #
+    def get_daughters(self, parent,
+                      nucl_data_path, nucl_data_nonexist_fname_full,
+                      is_verbose=False):
+        """Return a list of all possible progeny of a parent radionuclide.
 
+        Parameters
+        ----------
+        parent : str
+            A parent radionuclide of interest.
+        nucl_data_path : str
+            A directory containing nuclear data files.
+        nucl_data_nonexist_fname_full : str
+            The name of a file containing pairs of a radionuclide and decay
+            radiation, where the radiation emission from the radionuclide
+            does not have associated nuclear data in the ENSDF database.
+        is_verbose : bool, optional
+            If True, the unwinding process of the worklist will be displayed.
+            The default is False.
+
+        Returns
+        -------
+        daughters : list
+            A list of all possible progeny of the parent radionuclide.
+            Duplicate daughter nuclides can be included if:
+            (i) branching decay is involved in any stage of the decay
+                of a parent radionuclide, and incidentally the same nuclides
+                are generated through different branching paths.
+            (ii) multiple parents have been specified in the user input file,
+                 and one or more daughter nuclides of each parent radionuclide
+                 can incidentally appear in the decay stage of other parents.
+            Duplicate daughter nuclides, if any, should and will be removed
+            outside of this function.
+        """
         #
-        # **We cannot iterate directly over the "daughters" list in a loop
-        # where the "daughters" list itself will be modified, in which case
-        # we will fall into an infite loop. Instead, create a new list having
-        # exactly the same elements as "daughters" and run the loop with this
-        # new list. Also note that we must not use a simple equals sign to
-        # create a copy of the "daughters" list, as this would assign the
-        # reference, rather than the content, of the "daughters" list to the
-        # new list. A list comprehension has therefore been used here.**
+        # Synopsis
         #
-        daughters_as_parents = [d for d in daughters]
-        if daughters:
-            for daughters_as_parent in daughters_as_parents:
-                daughters += self.get_daughters(daughters_as_parent,
-                                                nucl_data_path,
-                                                nucl_data_nonexist_fname_full,
-                                                is_verbose=is_verbose)
+        # Assume that this function has been called from outside with the
+        # string 'Ac-225' passed as the positional argument.
+        #
+        # 1. 'Ac-225' is expanded through _get_daughters_single(), which
+        #    queries all possible types of radiation emission of Ac-225 to
+        #    the Live Chart web API server and, for existing datasets,
+        #    collects the resulting daughter nuclides, no matter the
+        #    associated branching fractions.
+        # 2. The collected daughter nuclides are placed on a worklist, and
+        #    the expansion is repeated for each nuclide taken off the list
+        #    until the worklist is exhausted; a stable nuclide such as
+        #    'Tl-205' contributes no daughter and hence nothing to expand.
+        #
+        # The worklist is run as a stack, with the daughters of an expansion
+        # pushed in reverse, so the nuclides are visited in exactly the
+        # depth-first order of the recursive formulation this replaces.
+        # Unlike the recursion, however, the loop consumes no interpreter
+        # frame per decay generation: a long chain (e.g. the about 15 hops
+        # from Np-237 down to Tl-205) stays clear of the interpreter
+        # recursion limit and its per-frame overhead.
+        #
+        # Duplicate visits are preserved on purpose. When branching decay
+        # reaches the same nuclide through different paths, each arrival
+        # re-expands the nuclide so that update_lineage() populates the
+        # subtree under every branch of the lineage tree. For example,
+        # 'Bi-213' decays to 'Pb-209' through either 'Tl-209' or 'Po-213',
+        # and the 'Ac-225' run hence yields:
+        #     daughters = ['Fr-221', 'At-217',
+        #                  'Bi-213', 'Tl-209', 'Po-213',
+        #                  'Pb-209', 'Bi-209', 'Tl-205',
+        #                  'Pb-209', 'Bi-209', 'Tl-205']
+        # with one ['Pb-209', 'Bi-209', 'Tl-205'] group per branch of
+        # 'Bi-213'. The duplicate nuclides should and will be removed
+        # outside this function.
+        #
+        daughters = []
+        pool = _get_fetch_pool()
+        worklist = [parent]
+        while worklist:
+            the_parent = worklist.pop()
+            #
+            # Re-expanding a nuclide revisited through a different
+            # branching path repeats work whose outcome is already
+            # known: the nuclear data DFs are memoized and the levs
+            # bookkeeping is idempotent. The only expansion input that
+            # can evolve between visits is the flattened energy levels
+            # of the nuclide — a new path can bequeath new levels. When
+            # those are unchanged, replay the memoized daughters and
+            # regraft the lineage, which is what a revisit is for, and
+            # skip the expansion body; otherwise expand in full again.
+            #
+            memo = self._expansion_memo.get(the_parent)
+            if memo is not None:
+                self.set_levs_energy_flattening(the_parent)
+                levs_flat = tuple(
+                    self.levs[the_parent]['energy_levels_flattened'])
+                if levs_flat == memo[0]:
+                    the_daughters = memo[1]
+                    for daughter in the_daughters:
+                        self.update_lineage(self.lineage, the_parent,
+                                            daughter, is_verbose=is_verbose)
+                    daughters += the_daughters
+                    worklist.extend(reversed(the_daughters))
+                    continue
+            the_daughters = self._get_daughters_single(
+                the_parent, nucl_data_path, nucl_data_nonexist_fname_full,
+                is_verbose=is_verbose)
+            self._expansion_memo[the_parent] = (
+                tuple(self.levs[the_parent]['energy_levels_flattened']),
+                the_daughters)
+            daughters += the_daughters
+            if not the_daughters:  # e.g. a stable nuclide
+                continue
+            # Warm the nuclear data cache for all identified daughters
+            # before descending: the queries of sibling branches are
+            # independent, so fetching them together through the shared
+            # pool costs each level of the expansion only its slowest
+            # branch. The expansion itself, and with it the lineage and
+            # energy level bookkeeping, stays sequential and
+            # deterministic, finding the prefetched DFs in the cache of
+            # run_get_livechart_df().
+            # Warm the ground-state metadata first so the per-daughter
+            # query pruning below works off the cache.
+            gs_futures = []
+            for daughter in mt.get_unique(the_daughters):
+                if daughter.endswith('m'):
+                    continue
+                gs_pair = f'{daughter}_gs'
+                if gs_pair in self._get_nonexist_pairs(
+                        nucl_data_nonexist_fname_full):
+                    continue
+                gs_fname_full = '{}/{}/{}.csv'.format(
+                    nucl_data_path, daughter, gs_pair)
+                if self._is_gs_offline and not os.path.exists(gs_fname_full):
+                    continue
+                url_params = {
+                    'fields': 'ground_states',
+                    'nuclides': self.get_rn_alias(daughter, how='plain2lc'),
+                }
+                gs_futures.append(pool.submit(
+                    self.run_get_livechart_df,
+                    gs_fname_full, url_params,
+                    nucl_data_nonexist_fname_full=(
+                        nucl_data_nonexist_fname_full),
+                    decay_radiat_type_pair=gs_pair))
+            for future in gs_futures:
+                try:
+                    future.result()
+                except SystemExit:
+                    # The warm-up is an optimization; see
+                    # _get_allowed_radiat_types() for the offline
+                    # fallback this flag triggers.
+                    self._is_gs_offline = True
+            prefetch_futures = []
+            for daughter in mt.get_unique(the_daughters):
+                daughter_lc = self.get_rn_alias(daughter, how='plain2lc')
+                allowed_radiat_types = self._get_allowed_radiat_types(
+                    daughter, daughter_lc, nucl_data_path,
+                    nucl_data_nonexist_fname_full)
+                for radiat_type in allowed_radiat_types:
+                    pair = '{}_{}'.format(daughter, radiat_type)
+                    if pair in self._get_nonexist_pairs(
+                            nucl_data_nonexist_fname_full):
+                        continue
+                    decay_fname_full = '{}/{}/{}.csv'.format(
+                        nucl_data_path, daughter, pair)
+                    url_params = {
+                        'fields': 'decay_rads',
+                        'nuclides': daughter_lc,
+                        'rad_types': radiat_type,
+                    }
+                    prefetch_futures.append(pool.submit(
+                        self.run_get_livechart_df,
+                        decay_fname_full, url_params,
+                        nucl_data_nonexist_fname_full=(
+                            nucl_data_nonexist_fname_full),
+                        decay_radiat_type_pair=pair))
+            for future in prefetch_futures:
+                future.result()
+            # Push the identified daughters in reverse so that the
+            # first daughter is popped, and hence descended into, first.
+            worklist.extend(reversed(the_daughters))
         if is_verbose:
             print('Returning "daughters": [{}]'.format(', '.join(daughters)))
         return daughters
@@ -1134,9 +1359,8 @@ class Recurlib():
         # (i) A progenitor with one or more of its energy levels specified
         # together; e.g. 'Nb-92m;135.5'
         #
-        re_sep = re.compile(r'(?i)\s*;\s*')
-        if re.search(re_sep, rn):
-            spl = re.split(re_sep, rn)
+        spl = _RE_PROG_SEP.split(rn)
+        if len(spl) > 1:
             rn = spl[0]
             nrg_levs = [float(nrg_lev) for nrg_lev in spl[1:]]
         #
@@ -1150,9 +1374,9 @@ class Recurlib():
         # symbol for compatibility with decay and level data files and
         # the levs dictionary.
         #
-        re_isomer = re.compile('(?i)m$')
-        is_isomer_progenitor = bool(re.search(re_isomer, rn))
-        rn = re.sub(re_isomer, '', rn)
+        _rn = _RE_PROG_ISOMER.sub('', rn)
+        is_isomer_progenitor = _rn != rn
+        rn = _rn
         if rn not in self.levs:
             self.levs[rn] = {}
         # The "is_isomer_progenitor" key itself is required; both True and
@@ -1190,7 +1414,7 @@ class Recurlib():
         nrg_lev_start : float
             A start energy level.
         is_verbose : bool, optional
-            If True, the unwinding process of recursion will be displayed.
+            If True, the cascade traversal will be displayed.
             The default is False.
 
         Returns
@@ -1198,16 +1422,12 @@ class Recurlib():
         nrgs_lev_end_tally : list
             A tallied list of end energy levels.
         """
-        # **Identified end level energies will be tallied to the
-        # nrgs_lev_end_tally list.**
-        nrgs_lev_end_tally = []
         if is_verbose:
             func_name_centered = mt.centering(
                 'get_nrg_lev_end(df_rn_gams, nrg_lev_start)')
             msg = ('\n'
                    + func_name_centered
-                   + '\n\nUnder a new local namespace for this call\n'
-                   + '               "nrg_lev_start": {}'.format(
+                   + '\n\nTraversal root "nrg_lev_start": {}'.format(
                        nrg_lev_start))
             print(msg)
 
@@ -1215,64 +1435,58 @@ class Recurlib():
         # Find the end level energies, if any, corresponding to the given
         # start level energy (sle).
         #
-        bool_idx_sle = ((df_rn_gams['sle_llim'] <= nrg_lev_start)
-                        & (df_rn_gams['sle_ulim'] >= nrg_lev_start))
-        nrgs_lev_end = df_rn_gams.loc[bool_idx_sle,
-                                      'end_level_energy'].to_list()
-
-        #
-        # Recursive case (i)
-        # - len(nrgs_lev_end) >= 2, meaning that multiple end level energies
-        #   have been found for one start level energy.
-        #
-        if len(nrgs_lev_end) >= 2:
-            # End level energy as start level energy
-            if is_verbose:
-                print('Multiple end energy levels:     {}'.format(
-                    nrgs_lev_end))
-            for ele_as_sle in nrgs_lev_end:
-                if is_verbose:
-                    print('Recursion with "ele_as_sle":    {}'.format(
-                        ele_as_sle))
-                nrgs_lev_end_tally += self.get_nrg_lev_end(
-                    df_rn_gams,
-                    ele_as_sle,
-                    is_verbose=is_verbose)
+        # The three columns involved are materialized into NumPy arrays
+        # once per DF and memoized on its attrs mapping: every hop of the
+        # cascade traversal reuses them, skipping the per-call pandas
+        # Series construction and row indexing.
+        #
+        gams_arrays = df_rn_gams.attrs.get('_gams_arrays')
+        if gams_arrays is None:
+            gams_arrays = (
+                df_rn_gams['sle_llim'].to_numpy(dtype='float64'),
+                df_rn_gams['sle_ulim'].to_numpy(dtype='float64'),
+                df_rn_gams['end_level_energy'].to_numpy(dtype='float64'),
+            )
+            df_rn_gams.attrs['_gams_arrays'] = gams_arrays
+        sle_llims, sle_ulims, nrgs_lev_end_all = gams_arrays
+        # Per-DF memo of start level to end levels: a cascade reaches
+        # the same level through multiple paths, and set_gams() calls
+        # this function for every probable start level of the same DF.
+        ends_memo = df_rn_gams.attrs.get('_gams_ends_memo')
+        if ends_memo is None:
+            ends_memo = {}
+            df_rn_gams.attrs['_gams_ends_memo'] = ends_memo
+
+        #
+        # Iterative depth-first traversal replacing the former
+        # recursion. A node of the traversal is a start level energy;
+        # its children are the end level energies its gamma transitions
+        # lead to, and a level without a matching data row is a leaf.
+        # The recursion tallied post order — the full sub-cascade of
+        # each end level first, then the end levels themselves — and the
+        # loop below reproduces that order exactly by building the tally
+        # reversed and flipping it once at the end.
+        #
+        tally_reversed = []
+        stack = [nrg_lev_start]
+        while stack:
+            sle = stack.pop()  # sle: start level energy
+            nrgs_lev_end = ends_memo.get(sle)
+            if nrgs_lev_end is None:
+                bool_idx_sle = ((sle_llims <= sle)
+                                & (sle_ulims >= sle))
+                nrgs_lev_end = nrgs_lev_end_all[bool_idx_sle].tolist()
+                ends_memo[sle] = nrgs_lev_end
+            if is_verbose and nrgs_lev_end:
+                print('End levels of start level {}: {}'.format(
+                    sle, nrgs_lev_end))
+            tally_reversed += reversed(nrgs_lev_end)
+            stack += nrgs_lev_end
+        nrgs_lev_end_tally = tally_reversed[::-1]
 
-        #
-        # Recursive case (ii)
-        # - len(nrgs_lev_end) == 1, meaning that at least one end level energy
-        #   has been found; in other words, the start level energy in question
-        #   has been found in the corresponding gamma dataset.
-        #
-        elif len(nrgs_lev_end) == 1:
-            if True in bool_idx_sle.unique():
-                if is_verbose:
-                    print('Recursion with "nrgs_lev_end":  {}'.format(
-                        nrgs_lev_end))
-                nrgs_lev_end_tally += self.get_nrg_lev_end(
-                    df_rn_gams,
-                    nrgs_lev_end[0],
-                    is_verbose=is_verbose)
-
-        #
-        # Tally the identified end level energies.
-        #
         if is_verbose:
-            print('Tallying "nrgs_lev_end":        {}'.format(
-                nrgs_lev_end))
-        nrgs_lev_end_tally += nrgs_lev_end
-
-        #
-        # Base case
-        # - len(nrgs_lev_end) == 0, meaning that there is no end level energy;
-        #   namely, there is no data row corresponding to the start level
-        #   energy in question.
-        #
-        if is_verbose:
-            msg = ('\nThe base case met!\n'
-                   + 'Returning "nrgs_lev_end_tally": {}\n'.format(
-                       nrgs_lev_end_tally))
+            msg = ('Returning "nrgs_lev_end_tally": {}\n'.format(
+                nrgs_lev_end_tally))
             print(msg)
         return nrgs_lev_end_tally
 
@@ -1319,17 +1533,18 @@ class Recurlib():
             df_rn_gams['sle_ulim'] = (df_rn_gams['start_level_energy']
                                       + df_rn_gams['unc_sle'])
             nrg_lev_types = [k for k in self.levs[rn].keys()
-                             if re.search('(?i)^from_', k)]
-            if 'from_gamma_cascade' not in self.levs[rn]:
-                self.levs[rn]['from_gamma_cascade'] = {}
-            if 'energy_levels' not in self.levs[rn]['from_gamma_cascade']:
-                self.levs[rn]['from_gamma_cascade']['energy_levels'] = []
+                             if _RE_FROM.search(k)]
+            fgc = self.levs[rn].setdefault('from_gamma_cascade', {})
+            fgc.setdefault('energy_levels', [])
             for nrg_lev_type in nrg_lev_types:  # e.g. from_Mo-99
                 if nrg_lev_type == 'from_gamma_cascade':
                     continue
                 for nrg_lev_p in self.levs[rn][nrg_lev_type]['energy_levels']:
                     # e.g. Th-234 --bm--> Pa-234m has <nrg>+X
-                    nrg_lev_p = float(re.sub('(?i)[+]X', '', str(nrg_lev_p)))
+                    if isinstance(nrg_lev_p, str):
+                        nrg_lev_p = float(_RE_NRG_PLUS_X.sub('', nrg_lev_p))
+                    else:  # Already numeric; no regex round trip needed.
+                        nrg_lev_p = float(nrg_lev_p)
                     if is_verbose:
                         msg = (f'Radionuclide: {rn},'
                                + f' nrg_lev_type: {nrg_lev_type},'
@@ -1341,8 +1556,7 @@ class Recurlib():
                     nrgs_lev_end = self.get_nrg_lev_end(df_rn_gams, nrg_lev_p,
                                                         is_verbose=is_verbose)
                     eles = [ele for ele in nrgs_lev_end
-                            if ele not in self.levs[rn]['from_gamma_cascade'][
-                                'energy_levels']]
+                            if ele not in fgc['energy_levels']]
                     # The list eles can contain duplicate energy levels,
                     # as one energy level can be associated with multiple
                     # transition paths.
@@ -1359,8 +1573,7 @@ class Recurlib():
                     # of eles will appear in the level report file under
                     # from_gamma_cascade > energy_levels.
                     eles_uniq = mt.get_unique(eles)
-                    self.levs[rn]['from_gamma_cascade'][
-                        'energy_levels'] += eles_uniq
+                    fgc['energy_levels'] += eles_uniq
 
     def set_levs(self, rn, nucl_data_path,
                  is_verbose=False):
@@ -1421,15 +1634,14 @@ class Recurlib():
             # (139 more) | NaN                     | NaN
             # 6000.6     | NaN                     | NaN
             #
-            dms = []
             cols_dm = [f'decay_{i}' for i in list(range(1, 4))]
-            for col_dm in cols_dm:  # decay_1, decay_2, decay_3
-                # Collect decay modes appearing in the decay mode column
-                # in question.
-                bool_idx_dm = df_rn_levs[col_dm].notna()
-                dms_colwise = df_rn_levs.loc[bool_idx_dm,
-                                             col_dm].unique().tolist()
-                dms += [dm for dm in dms_colwise if dm not in dms]
+            # Collect, in a single pass, the decay modes appearing in the
+            # decay mode columns (decay_1, decay_2, decay_3). The
+            # column-major ravel preserves the column-by-column
+            # first-appearance order.
+            df_dm_cols = df_rn_levs[cols_dm]
+            dms_raveled = df_dm_cols.to_numpy(dtype=object).ravel(order='F')
+            dms = [dm for dm in pd.unique(dms_raveled) if pd.notna(dm)]
             #
             # Preprocessing for decay mode key modification
             # (i) A progenitor radionuclide whose name has been linked to
@@ -1440,36 +1652,35 @@ class Recurlib():
             # been given a 'self' key before this function has been called;
             # only the key 'from_<parent>' is available at this point.
             #
-            if 'self' not in self.levs[rn]:
-                self.levs[rn]['self'] = {}
+            self.levs[rn].setdefault('self', {})
             #
             # Decay mode key modification
             #
             for dm in dms:  # e.g. A, B-, EC+B+, IT
-                if dm not in self.levs[rn]['self']:
-                    self.levs[rn]['self'][dm] = {}
+                self.levs[rn]['self'].setdefault(dm, {})
                 if ('is_energy_level_set' in self.levs[rn]['self'][dm]
                         and self.levs[rn]['self'][dm]['is_energy_level_set']):
                     continue
-                # Deep-copy the radionuclide DF and select the indices of the
-                # copy that contain the decay mode in question.
-                df_rn_dm = df_rn_levs[df_rn_levs.eq(dm).any(axis=1)].copy()
+                # Select the rows of the radionuclide DF that contain the
+                # decay mode in question. Only the decay mode columns need
+                # examining; decay mode tokens appear nowhere else in a
+                # levels DF. The slice is read-only below, so no deep copy
+                # is taken.
+                df_rn_dm = df_rn_levs[df_dm_cols.eq(dm).any(axis=1)]
                 # Retrieve pairs of an angular momentum and parity
                 # corresponding to the decay mode in question.
                 self.levs[rn]['self'][dm]['jps'] = df_rn_dm[col_jp].to_list()
                 # Retrieve pairs of an energy level and its uncertainty
-                # corresponding to the decay mode in question.
-                self.levs[rn]['self'][dm]['energy_levels'] = []
-                nrg_lev_pairs = df_rn_dm[['energy', 'unc_e']].values.tolist()
-                for nrg_lev_pair in nrg_lev_pairs:  # A list of lists
-                    # Conditional for .nan (type: float): NaN to 0
-                    if nrg_lev_pair[1] != nrg_lev_pair[1]:
-                        nrg_lev_pair[1] = 0
-                    nrg_lev_llim = nrg_lev_pair[0] - nrg_lev_pair[1]
-                    nrg_lev_ulim = nrg_lev_pair[0] + nrg_lev_pair[1]
-                    nrg_lev = [nrg_lev_llim, nrg_lev_ulim]
-                    self.levs[rn]['self'][dm]['energy_levels'].append(
-                        nrg_lev)
+                # corresponding to the decay mode in question, and turn
+                # them into [lower limit, upper limit] pairs in whole-
+                # column arithmetic.
+                nrgs = df_rn_dm['energy'].to_numpy(dtype='float64')
+                uncs = df_rn_dm['unc_e'].to_numpy(dtype='float64')
+                # Conditional for .nan (type: float): NaN to 0
+                uncs[np.isnan(uncs)] = 0
+                self.levs[rn]['self'][dm]['energy_levels'] = (
+                    np.column_stack((nrgs - uncs,
+                                     nrgs + uncs)).tolist())
                 # Mark that the energy levels of the decay mode in question
                 # has been set.
                 self.levs[rn]['self'][dm]['is_energy_level_set'] = True
@@ -1506,20 +1717,31 @@ class Recurlib():
         # (ii) Radionuclide-wise DF slicing at get_rnlib()
         #
         nrg_lev_types = [k for k in self.levs[rn].keys()
-                         if re.search('(?i)^from_', k)]
-        if 'energy_levels_flattened' not in self.levs[rn]:
-            self.levs[rn]['energy_levels_flattened'] = []
+                         if _RE_FROM.search(k)]
+        flattened = self.levs[rn].setdefault('energy_levels_flattened',
+                                             [])  # Aliasing
+        # A companion set turns the per-element duplicate check from a
+        # list scan into a membership test; the list itself remains the
+        # stored structure, as it is dumped to the level report YAML.
+        # The set persists as a sidecar on the instance and serves the
+        # other consumers of the flattened levels with O(1) membership.
+        seen = self._levs_flat_sets.get(rn)
+        if seen is None:
+            seen = set(flattened)
+            self._levs_flat_sets[rn] = seen
         for nrg_lev_type in nrg_lev_types:  # e.g. from_Mo-99
             for nrg_lev_p in self.levs[rn][nrg_lev_type]['energy_levels']:
                 # e.g. Th-234 --bm--> Pa-234m has <nrg>+X
-                nrg_lev_p = float(re.sub('(?i)[+]X', '', str(nrg_lev_p)))
-                if nrg_lev_p not in self.levs[rn]['energy_levels_flattened']:
-                    self.levs[rn]['energy_levels_flattened'].append(nrg_lev_p)
+                if isinstance(nrg_lev_p, str):
+                    nrg_lev_p = float(_RE_NRG_PLUS_X.sub('', nrg_lev_p))
+                else:  # Already numeric; no regex round trip needed.
+                    nrg_lev_p = float(nrg_lev_p)
+                if nrg_lev_p not in seen:
+                    seen.add(nrg_lev_p)
+                    flattened.append(nrg_lev_p)
         # Sort, if requested, the list of flattened energies.
         if is_sort:
-            self.levs[rn]['energy_levels_flattened'] = sorted(
-                self.levs[rn]['energy_levels_flattened'],
-                reverse=is_sort_reverse)
+            flattened.sort(reverse=is_sort_reverse)
 
     def set_levs_feasibility(self):
         """Set the feasibilities of the decay modes of a radionuclide series.
@@ -1537,9 +1759,8 @@ class Recurlib():
             # Examples include Tl-205 and Pb-208. There are many, however,
             # stable nuclides whose portions of levels are associated with
             # decay modes. This counter example includes O-18.
-            if 'self' not in self.levs[rn]:
-                self.levs[rn]['self'] = {}
-            the_self = self.levs[rn]['self']  # Aliasing
+            rn_levs = self.levs[rn]  # Aliasing
+            the_self = rn_levs.setdefault('self', {})  # Aliasing
             if len(the_self) == 0:
                 continue
             # <<
@@ -1556,19 +1777,25 @@ class Recurlib():
             #
             # Decay mode feasibility judgement
             #
-            if 'energy_levels_isomer' not in self.levs[rn]:
-                self.levs[rn]['energy_levels_isomer'] = []
-            nrg_levs_isomer = self.levs[rn]['energy_levels_isomer']  # Aliasing
+            nrg_levs_isomer = rn_levs.setdefault(
+                'energy_levels_isomer', [])  # Aliasing
+            # Companion sets keep the duplicate checks below O(1); the
+            # lists remain the stored structures, as they are dumped to
+            # the level report YAML.
+            nrg_levs_isomer_seen = set(nrg_levs_isomer)
+            flattened = rn_levs['energy_levels_flattened']  # Aliasing
+            nrgs_lev_p = np.asarray(flattened, dtype='float64')
+            iso_prog_seen = frozenset(
+                rn_levs.get('energy_levels_isomer_progenitor', ()))
             for dm in the_self.keys():  # A, B-, EC+B+, IT, ...
                 #
                 # By default, all decay modes are considered False; only those
                 # considered feasible after screening will be assigned True.
                 #
-                if 'is_feasible' not in the_self[dm]:
-                    the_self[dm]['is_feasible'] = False
-                if 'feasible_energies' not in the_self[dm]:
-                    the_self[dm]['feasible_energies'] = []
-                fsbl_nrgs = the_self[dm]['feasible_energies']  # Aliasing
+                the_self[dm].setdefault('is_feasible', False)
+                fsbl_nrgs = the_self[dm].setdefault('feasible_energies',
+                                                    [])  # Aliasing
+                fsbl_nrgs_seen = set(fsbl_nrgs)
                 #
                 # Examine each possible energy level if it falls under the
                 # energy of the decay mode in question.
@@ -1579,7 +1806,20 @@ class Recurlib():
                 #   **This information will later be used for appending
                 #   the "m" symbol to nuclear isomers at get_rnlib().**
                 #
-                for nrg_lev_p in self.levs[rn]['energy_levels_flattened']:
+                nrg_lev_pairs = the_self[dm]['energy_levels']
+                if not nrg_lev_pairs or not nrgs_lev_p.size:
+                    continue
+                # One broadcast comparison replaces the former
+                # level-by-interval double loop: a possible energy level
+                # is a hit if it falls within any of the [llim, ulim]
+                # pairs of the decay mode in question.
+                llims, ulims = np.asarray(nrg_lev_pairs, dtype='float64').T
+                bool_idx_hit = ((llims[:, None] <= nrgs_lev_p)
+                                & (nrgs_lev_p <= ulims[:, None])).any(axis=0)
+                for nrg_lev_p, is_hit in zip(flattened, bool_idx_hit):
+                    if not is_hit:
+                        continue
+                    the_self[dm]['is_feasible'] = True
                     #
                     # Nuclear isomer types
                     #
@@ -1595,32 +1835,48 @@ class Recurlib():
                     # "energy_levels_isomer" key, thereby making decay modes
                     # corresponding to the ground state a nuclear isomer.
                     #
-                    is_isomer = bool(dm == 'IT')
-                    for nrg_lev_d_dm in the_self[dm]['energy_levels']:
-                        if nrg_lev_d_dm[0] <= nrg_lev_p <= nrg_lev_d_dm[1]:
-                            the_self[dm]['is_feasible'] = True
-                            # Nuclear isomer type (ii): See the explanation
-                            # around "is_isomer = False" above for details.
-                            if ('energy_levels_isomer_progenitor'
-                                    in self.levs[rn]
-                                    and nrg_lev_p in self.levs[rn][
-                                        'energy_levels_isomer_progenitor']):
-                                is_isomer = True
-                            the_self[dm]['is_isomer'] = is_isomer
-                            if (the_self[dm]['is_isomer']
-                                    and nrg_lev_p not in nrg_levs_isomer):
-                                nrg_levs_isomer.append(nrg_lev_p)
-                            # Memorize the energy level that has been judged
-                            # to be feasible. The purpose of this information
-                            # archiving is to let the user know for what
-                            # specific energy level(s), out of the many, the
-                            # "is_feasible" Boolean has been judged.
-                            if nrg_lev_p not in fsbl_nrgs:
-                                fsbl_nrgs.append(nrg_lev_p)
+                    is_isomer = bool(dm == 'IT'
+                                     or nrg_lev_p in iso_prog_seen)
+                    the_self[dm]['is_isomer'] = is_isomer
+                    if (is_isomer
+                            and nrg_lev_p not in nrg_levs_isomer_seen):
+                        nrg_levs_isomer_seen.add(nrg_lev_p)
+                        nrg_levs_isomer.append(nrg_lev_p)
+                    # Memorize the energy level that has been judged
+                    # to be feasible. The purpose of this information
+                    # archiving is to let the user know for what
+                    # specific energy level(s), out of the many, the
+                    # "is_feasible" Boolean has been judged.
+                    if nrg_lev_p not in fsbl_nrgs_seen:
+                        fsbl_nrgs_seen.add(nrg_lev_p)
+                        fsbl_nrgs.append(nrg_lev_p)
             # Remove the temporary key used for screening a user-designated
             # isomer progenitor.
-            if 'energy_levels_isomer_progenitor' in self.levs[rn]:
-                del self.levs[rn]['energy_levels_isomer_progenitor']
+            if 'energy_levels_isomer_progenitor' in rn_levs:
+                del rn_levs['energy_levels_isomer_progenitor']
+
+    def _reorder_levs_keys(self):
+        """Place the relation keys of levs entries at their beginnings.
+
+        Returns
+        -------
+        None.
+        """
+        # Cosmetic ordering for the level report: the parents key of a
+        # radionuclide, if any, leads its entry, followed by the
+        # daughters key, if any. Reordering once here replaces the dict
+        # rebuilds the daughter bookkeeping loop of
+        # _get_daughters_single() used to perform on every relation
+        # pair.
+        for rn, rn_levs in self.levs.items():
+            lead_keys = [k for k in ('parents', 'daughters')
+                         if k in rn_levs]
+            if not lead_keys:
+                continue
+            self.levs[rn] = {
+                **{k: rn_levs.pop(k) for k in lead_keys},
+                **rn_levs,
+            }
 
     def get_prio_idx_and_nums(self, df, sort_by, priority_num_max):
         """Construct DataFrame indices and values for priority numbers.
@@ -1644,10 +1900,12 @@ class Recurlib():
         priority_nums : list
             A list of calculated priority numbers.
         """
-        # Sort the DF in descending order and fetch the indices of top rows;
-        # the number of top rows is equal to priority_num_max.
-        df_desc = df.sort_values(by=sort_by, ascending=False)
-        priority_idx = df_desc.head(priority_num_max).index
+        # Fetch the indices of the top rows of the sorting column; the
+        # number of top rows is equal to priority_num_max. nlargest
+        # performs a partial selection on the single column instead of
+        # sorting the whole DF, and resolves ties by the original row
+        # order.
+        priority_idx = df[sort_by].nlargest(priority_num_max).index
 
         # Override the maximum priority number by the length of selected
         # top rows if the latter is smaller than the former. This is to
@@ -1682,17 +1940,25 @@ class Recurlib():
         # Preprocessing: Generate I/O directories in advance and a nonexistent
         # nuclear data registry file if not found.
         #
-        io.mk_dir(p['io']['lib']['nucl_data_path'], is_yn=False)
         nonexist_dname = os.path.dirname(
             p['io']['lib']['nucl_data_nonexist_fname_full'])
-        io.mk_dir(p['io']['out']['rpt_path'], is_yn=False)
+        dnames = [p['io']['lib']['nucl_data_path'],
+                  p['io']['out']['rpt_path'],
+                  nonexist_dname]
         if p['io']['ctrls']['is_export']:
-            io.mk_dir(p['io']['out']['export_path'], is_yn=False)
-        io.mk_dir(nonexist_dname, is_yn=False)
-        if not os.path.exists(p['io']['lib']['nucl_data_nonexist_fname_full']):
-            open(p['io']['lib']['nucl_data_nonexist_fname_full'], 'w',
-                 encoding='utf8').close()
+            dnames.insert(2, p['io']['out']['export_path'])
+        for dname in dnames:
+            io.mk_dir(dname, is_yn=False)
+        try:
+            # EAFP counterpart of an existence probe followed by a
+            # creating open; the exclusive mode fails, and is simply
+            # passed over, if the registry file already exists.
+            with open(p['io']['lib']['nucl_data_nonexist_fname_full'],
+                      'x', encoding='utf8'):
+                pass
             io.show_file_gen(p['io']['lib']['nucl_data_nonexist_fname_full'])
+        except FileExistsError:
+            pass
 
         #
         # Step 1. Construct a radionuclide subset by recursive computation,
@@ -1766,6 +2032,7 @@ class Recurlib():
                     is_savetxt=True,
                     txt_fname_full=p['io']['out']['lineage_fname_full'])
                 self.lineage = {}  # Initialize for the next progenitor.
+                self._lineage_index = {}  # Its node index likewise.
                 # Remove duplicates, if any, from the identified daughters
                 # of the recursive progenitor in question.
                 daughters_uniq = mt.get_unique(daughters)
@@ -1774,6 +2041,8 @@ class Recurlib():
                 decay_chains_flattened += daughters_uniq
         # Energy level feasibility validation (4/5): Daughter radionuclides
         self.set_levs_feasibility()
+        # Key reorganization for the report: relation keys first.
+        self._reorder_levs_keys()
         # Save the energy levels of the radionuclides to a report file.
         p['io']['out']['lev_fname_full'] = '{}/{}{}.yaml'.format(
             p['io']['out']['rpt_path'],
@@ -1871,13 +2140,25 @@ class Recurlib():
         priority_num_max = p['scout']['radionuclides']['cutoffs'][
             'priority_number_max']
         # <<
-        dfs_rnlib_to_be_concated = []
+        # Enumerate the nuclear data directory once; the per-radionuclide
+        # existence screening below can then dismiss radionuclides
+        # without a data subdirectory, stable nuclides in particular,
+        # through an in-memory set lookup instead of a stat syscall.
+        nucl_data_dnames = frozenset(
+            entry.name for entry
+            in os.scandir(p['io']['lib']['nucl_data_path'])
+            if entry.is_dir())
+        # Submit the radionuclide-wise CSV reads to the shared fetch pool
+        # up front, so file opening and parsing of the library members
+        # overlap rather than run back to back.
+        pool = _get_fetch_pool()
+        df_rnwise_futures = {}
         for rn in self.rn_subset_uniq:
             # A possible "m" symbol denoting a nuclear isomer had certainly
             # been dropped at this point, but to avoid any potential errors
             # related to the Live Chart of Nuclides notation, use a regex sub
             # as below.
-            rn_wo_possible_m = re.sub('(?i)m$', '', rn)
+            rn_wo_possible_m = _RE_PROG_ISOMER.sub('', rn)
             decay_radiat_type_pair = '{}_{}'.format(rn_wo_possible_m,
                                                     self.radiat['short'])
             decay_fname_full = '{}/{}/{}.csv'.format(
@@ -1890,24 +2171,56 @@ class Recurlib():
             # have no nuclear data files but are still included in
             # the self.rn_subset_uniq list as they form the base
             # cases of the recursion of get_daughters().
-            if not os.path.exists(decay_fname_full):
+            if (rn_wo_possible_m not in nucl_data_dnames
+                    or not os.path.exists(decay_fname_full)):
                 continue
+            df_rnwise_futures[rn] = pool.submit(pd.read_csv,
+                                                decay_fname_full,
+                                                usecols=usecols)
+        dfs_rnlib_to_be_concated = []
+        for rn, df_rnwise_future in df_rnwise_futures.items():
             # A radionuclide-wise library DF containing a single radionuclide
             # and its nuclear data
-            df_rnlib_rnwise = pd.read_csv(decay_fname_full,
-                                          usecols=usecols)
+            df_rnlib_rnwise = df_rnwise_future.result()
             # Slice the DF with respect to the user-specified energy and
             # emission probability cutoff values.
             # e.g. Bi-215_g.csv, index 0, energy: X (str)
             df_rnlib_rnwise[col_nrg] = pd.to_numeric(
                 df_rnlib_rnwise[col_nrg], errors='coerce')
-            bool_idx_cuton = ((df_rnlib_rnwise[col_nrg] >= nrg_lim[0])
-                              & (df_rnlib_rnwise[col_nrg] <= nrg_lim[1])
-                              & (df_rnlib_rnwise[col_ep] >= ep_lim[0])
-                              & (df_rnlib_rnwise[col_ep] <= ep_lim[1])
-                              & (df_rnlib_rnwise[col_hl_sec] >= hl_sec_lim[0])
-                              & (df_rnlib_rnwise[col_hl_sec] <= hl_sec_lim[1]))
+            # The cutoff comparisons run on the underlying ndarrays, and
+            # the resulting masks are fused into a single Boolean mask
+            # so that the DF is sliced only once.
+            nrgs = df_rnlib_rnwise[col_nrg].to_numpy()
+            eps = df_rnlib_rnwise[col_ep].to_numpy()
+            hls_sec = df_rnlib_rnwise[col_hl_sec].to_numpy()
+            bool_idx_cuton = ((nrgs >= nrg_lim[0])
+                              & (nrgs <= nrg_lim[1])
+                              & (eps >= ep_lim[0])
+                              & (eps <= ep_lim[1])
+                              & (hls_sec >= hl_sec_lim[0])
+                              & (hls_sec <= hl_sec_lim[1]))
+            # Energy level feasibility validation (5/5), part 1: Remove
+            # physically unviable energy levels from the DF within the
+            # same slicing pass. This early removal is safe because both
+            # the radiation and priority numbers are reassigned after
+            # the isomer differentiation sort further below.
+            if rn in self.levs:
+                if p['io']['ctrls']['is_verbose']:
+                    print(f'\nRadionuclide: [{rn}], possible'
+                          + ' energy levels:'
+                          + ' {}\n'.format(
+                              self.levs[rn]['energy_levels_flattened'])
+                          + 'Before:')
+                    print(df_rnlib_rnwise)
+                bool_idx_cuton &= df_rnlib_rnwise[col_nrg_lev].isin(
+                    self._levs_flat_sets.get(
+                        rn,
+                        self.levs[rn][
+                            'energy_levels_flattened'])).to_numpy()
             df_rnlib_rnwise = df_rnlib_rnwise[bool_idx_cuton]
+            if rn in self.levs and p['io']['ctrls']['is_verbose']:
+                print('\nAfter:')
+                print(df_rnlib_rnwise)
             # Skip the current radionuclide if the sliced DF does not have
             # nuclear data (cases where all data rows have been pruned).
             if not len(df_rnlib_rnwise.index):
@@ -1917,7 +2230,9 @@ class Recurlib():
             #   1. Radionuclide name
             #   2. Radiation number
             #   3. Priority number
-            # - Note that they are inserted to the 0th column in reverse order.
+            # - The three columns are assembled in a small DF of their own
+            #   and prepended with a single axis-1 concat; three separate
+            #   insert calls would each re-lay out the frame.
             # - The radionuclide name must be inserted before energy level
             #   validation step 5, where nuclear isomers are assigned the "m"
             #   suffix on top of their nuclide names.
@@ -1930,57 +2245,48 @@ class Recurlib():
                 _df_rnlib_rnwise_priority_num_nrg,
                 col_ep,
                 priority_num_max)
-            # Nonpriority data points are assigned the priority number 0
-            # rather than NaN.
-            df_rnlib_rnwise.insert(0, col_priority_num,
-                                   [0] * len(df_rnlib_rnwise.index))
-            df_rnlib_rnwise.loc[priority_idx,
-                                col_priority_num] = priority_nums
-            df_rnlib_rnwise.insert(0, col_radiat_num,
-                                   range(1, len(df_rnlib_rnwise.index) + 1))
-            df_rnlib_rnwise.insert(0, col_rn,
-                                   [rn] * len(df_rnlib_rnwise.index))
-            # Energy level feasibility validation (5/5)
-            # 1. Select only feasible nuclear data rows by
-            #   - slicing the DF based on the possible list of energy levels
-            #   - removing unfeasible decay modes
+            df_rnlib_rnwise_prepend = pd.DataFrame(
+                {
+                    col_rn: [rn] * len(df_rnlib_rnwise.index),
+                    col_radiat_num: range(1,
+                                          len(df_rnlib_rnwise.index) + 1),
+                    # Nonpriority data points are assigned the priority
+                    # number 0 rather than NaN.
+                    col_priority_num: 0,
+                },
+                index=df_rnlib_rnwise.index)
+            df_rnlib_rnwise_prepend.loc[priority_idx,
+                                        col_priority_num] = priority_nums
+            df_rnlib_rnwise = pd.concat([df_rnlib_rnwise_prepend,
+                                         df_rnlib_rnwise],
+                                        axis=1)
+            # Energy level feasibility validation (5/5), part 2
+            # 1. Select only feasible nuclear data rows by removing
+            #    unfeasible decay modes (unviable energy levels were
+            #    already sliced out together with the cutoffs above).
             # 2. Append the "m" symbol to nuclear isomers in the radionuclide-
             #    wise DF based on the levs dictionary.
+            rn_w_forced_m = _RE_ISOMER_TAG.sub(r'\1m', rn)
             if rn in self.levs:
                 #
-                # Remove physically unviable energy levels from the DF.
-                #
-                if p['io']['ctrls']['is_verbose']:
-                    print(f'\nRadionuclide: [{rn}], possible'
-                          + ' energy levels:'
-                          + ' {}\n'.format(
-                              self.levs[rn]['energy_levels_flattened'])
-                          + 'Before:')
-                    print(df_rnlib_rnwise.iloc[:, list(range(4)) + [-1]])
-                bool_idx_nrg_lev_incl = df_rnlib_rnwise[col_nrg_lev].isin(
-                    self.levs[rn]['energy_levels_flattened'])
-                df_rnlib_rnwise = df_rnlib_rnwise[bool_idx_nrg_lev_incl]
-                if p['io']['ctrls']['is_verbose']:
-                    print('\nAfter:')
-                    print(df_rnlib_rnwise.iloc[:, list(range(4)) + [-1]])
-                #
                 # Remove physically unviable decay modes from the DF.
+                # A single isin mask over the unfeasible decay modes
+                # replaces one column scan and one drop per decay mode.
                 #
-                for dm in self.levs[rn]['self'].keys():
-                    bool_idx_dm = df_rnlib_rnwise[col_dm] == dm
-                    if not self.levs[rn]['self'][dm]['is_feasible']:
-                        if p['io']['ctrls']['is_verbose']:
-                            print(f'\nRadionuclide: [{rn}],'
-                                  + f' unfeasible decay mode: [{dm}]\n'
-                                  + 'Before:')
-                            print(df_rnlib_rnwise)
-                        df_rnlib_rnwise.drop(
-                            df_rnlib_rnwise[bool_idx_dm].index,
-                            axis=0,
-                            inplace=True)
-                        if p['io']['ctrls']['is_verbose']:
-                            print('\nAfter:')
-                            print(df_rnlib_rnwise)
+                dms_unfeasible = [
+                    dm for dm, dm_val in self.levs[rn]['self'].items()
+                    if not dm_val['is_feasible']]
+                if dms_unfeasible:
+                    if p['io']['ctrls']['is_verbose']:
+                        print(f'\nRadionuclide: [{rn}], unfeasible'
+                              + ' decay modes: {}\n'.format(dms_unfeasible)
+                              + 'Before:')
+                        print(df_rnlib_rnwise)
+                    df_rnlib_rnwise = df_rnlib_rnwise[
+                        ~df_rnlib_rnwise[col_dm].isin(dms_unfeasible)]
+                    if p['io']['ctrls']['is_verbose']:
+                        print('\nAfter:')
+                        print(df_rnlib_rnwise)
                 #
                 # Nuclear isomer labeling (appending "m" to the mass number)
                 #
@@ -1993,11 +2299,11 @@ class Recurlib():
                     print(df_rnlib_rnwise)
                 bool_idx_nrg_lev_isomer = df_rnlib_rnwise[col_nrg_lev].isin(
                     self.levs[rn]['energy_levels_isomer'])
-                the_rns = df_rnlib_rnwise.loc[bool_idx_nrg_lev_isomer,
-                                              col_rn].replace('([0-9])$',
-                                                              r'\1m',
-                                                              regex=True)
-                df_rnlib_rnwise.loc[bool_idx_nrg_lev_isomer, col_rn] = the_rns
+                # Every value of the radionuclide column still equals rn
+                # at this point, so a scalar assignment of the labeled
+                # name replaces the former per-element regex replace.
+                df_rnlib_rnwise.loc[bool_idx_nrg_lev_isomer,
+                                    col_rn] = rn_w_forced_m
                 if p['io']['ctrls']['is_verbose']:
                     print('\nAfter:')
                     print(df_rnlib_rnwise)
@@ -2011,7 +2317,6 @@ class Recurlib():
             #   - Radiation numbers
             #   - Priority numbers
             #
-            rn_w_forced_m = re.sub('([0-9])$', r'\1m', rn)
             if df_rnlib_rnwise[col_rn].isin([rn_w_forced_m]).any():
                 if p['io']['ctrls']['is_verbose']:
                     print(f'\nRadionuclide: [{rn}], nuclear'
@@ -2041,16 +2346,11 @@ class Recurlib():
             bool_idx_isomer = df_rnlib_rnwise[col_rn] == rn_w_forced_m
             bool_idx_rn = df_rnlib_rnwise[col_rn] == rn
             # Attribute reassignment (i): Radiation numbers
-            radiat_num_isomer = range(
-                1,
-                len(df_rnlib_rnwise.loc[bool_idx_isomer].index) + 1)
-            radiat_num_rn = range(
-                1,
-                len(df_rnlib_rnwise.loc[bool_idx_rn].index) + 1)
-            df_rnlib_rnwise.loc[bool_idx_isomer,
-                                col_radiat_num] = radiat_num_isomer
-            df_rnlib_rnwise.loc[bool_idx_rn,
-                                col_radiat_num] = radiat_num_rn
+            # cumcount renumbers the rows of the isomer and of the
+            # ground state in one vectorized pass; the two groups are
+            # contiguous after the sort above.
+            df_rnlib_rnwise[col_radiat_num] = df_rnlib_rnwise.groupby(
+                col_rn, sort=False).cumcount() + 1
             # Attribute reassignment (ii): Priority numbers
             # bool_idx_priority_num_nrg is recalculated as df_rnlib_rnwise
             # has been sorted in the above.
@@ -2086,12 +2386,24 @@ class Recurlib():
             # in question to the radionuclide-wise DF.
             df_rnlib_rnwise[col_db] = p['io']['lib']['nucl_database']
             # Add the radionuclide-wise DF to a list which will in turn be
-            # combined into one DF.
+            # combined into one DF. The DFs are built with identical
+            # columns, so they are pointed at one shared column Index
+            # object, letting the final concat skip per-frame column
+            # reconciliation. The equals guard keeps a frame with a
+            # deviating column order out of the fast path rather than
+            # mislabeling it.
+            if dfs_rnlib_to_be_concated:
+                cols_shared = dfs_rnlib_to_be_concated[0].columns
+                if df_rnlib_rnwise.columns.equals(cols_shared):
+                    df_rnlib_rnwise.columns = cols_shared
             dfs_rnlib_to_be_concated.append(df_rnlib_rnwise)
 
         # Combine the radionuclide-wise radionuclide library DFs into one DF,
         # which will yield a single, comprehensive radionuclide library DF.
-        df_rnlib = pd.concat(dfs_rnlib_to_be_concated)
+        # ignore_index renumbers the rows during the concat itself, which
+        # makes a separate index-resetting pass over the combined frame
+        # unnecessary.
+        df_rnlib = pd.concat(dfs_rnlib_to_be_concated, ignore_index=True)
         # - Remove a user-specified exclusion group of radionuclides, if any,
         #   from the radionuclide library DF. This block of code has been
         #   moved from the step for radionuclide subset construction to here
@@ -2109,7 +2421,9 @@ class Recurlib():
                 and len(p['scout']['radionuclides']['exclusion'])):
             bool_idx_rn_excl = df_rnlib[col_rn].isin(
                 p['scout']['radionuclides']['exclusion'])
-            df_rnlib = df_rnlib[~bool_idx_rn_excl].copy()
+            # Boolean-mask selection already yields an independent frame;
+            # no explicit deep copy is needed on top of it.
+            df_rnlib = df_rnlib[~bool_idx_rn_excl]
         # Rename the column names using the user-specified column names.
         df_rnlib.rename(columns=self.cols['nucl_data_to_rpt'],
                         inplace=True)
@@ -2119,11 +2433,18 @@ class Recurlib():
             if re.search('(?i)radionuclide', sort_by):
                 # Force the legend order to be 'as_is'.
                 p['plot']['annots']['grouped']['legend']['order'] = 'as_is'
-                # Sort the DF using custom keys.
+                # Sort the DF using custom keys. The integer keys are
+                # materialized once and ordered with a stable argsort;
+                # names absent from the subset order (NaN keys) go last,
+                # as they did under the former key-function sort, and
+                # the stable kind keeps the within-radionuclide data
+                # order intact.
                 sort_dct = {k: i for i, k in enumerate(self.rn_subset_uniq)}
-                df_rnlib.sort_values(by=self.cols[sort_by]['nucl_data_new'],
-                                     key=lambda col: col.map(sort_dct),
-                                     inplace=True)
+                sort_keys = df_rnlib[
+                    self.cols[sort_by]['nucl_data_new']].map(
+                        sort_dct).to_numpy(dtype='float64')
+                df_rnlib = df_rnlib.take(np.argsort(sort_keys,
+                                                    kind='stable'))
             else:
                 df_rnlib.sort_values(by=self.cols[sort_by]['nucl_data_new'],
                                      inplace=True)
@@ -2160,39 +2481,7 @@ class Recurlib():
         #
         # Preprocessing
         #
-        df_context = df_rnlib.copy()  # Do not alter the original DF.
-        df_context.fillna(0, inplace=True)  # .nan -> 0
-
-        #
-        # Radionuclide library information
-        #
-        col_db = self.cols['database'][df_col_type]
-        nucl_database = df_context[col_db].to_list()[0]
-        now_is = mt.get_now(ymd_preposition='on ', hms_preposition='at ')
-        tstamp = 'Generated {}'.format(now_is)
-        # Restrict the library code length to 32 characters to ensure
-        # compatibility with some third-party spectral analysis software.
-        rnlib_code_bname = '{}-{}'.format(
-            self.prog_info['name'].lower(), rnlib_bname)
-        rnlib_code_bname = rnlib_code_bname[:28]
-        rnlib_info = {
-            'code_master': '{}-mst'.format(rnlib_code_bname),
-            'code_group': '{}-grp'.format(rnlib_code_bname),
-            'name': '{}-{} ({} v{}; {})'.format(self.prog_info['name'].lower(),
-                                                rnlib_bname,
-                                                self.prog_info['name'],
-                                                self.prog_info['vers'],
-                                                nucl_database),
-            'comment': tstamp,
-        }
-
-        #
-        # Radionuclide information
-        #
-        # Extract radionuclide information and its decay radiation
-        # separately for each radionuclide contained in the radionuclide
-        # library.
-        #
+        # Column keys consumed by the context, in the user input notation
         cols_rn_info = [
             'radionuclide',
             'half_life',
@@ -2226,27 +2515,98 @@ class Recurlib():
                 'priority_number',
             ],
         }
-        # Iterate over the list of radionuclides contained in the library DF.
+        # col: A column key in the user input
+        # col_in_df: A column name in the DF
+        # The resolutions are hoisted here; they are invariant across
+        # the per-radionuclide loop below.
+        col_db = self.cols['database'][df_col_type]
         col_rn = self.cols['radionuclide'][df_col_type]
-        rns = {rn: {'radiats': []} for rn in df_context[col_rn].unique()}
-        rns_gr_from_isomer = {rn: False for rn in rns}
+        cols_rn_info_map = {col: self.cols[col][df_col_type]
+                            for col in cols_rn_info}
+        cols_radiat_map = {
+            self.cols[col][df_col_type]: col
+            for col in cols_radiat[self.radiat['short']]}
+        # Copy only the columns the context consumes; the remaining
+        # columns of the library DF are never read here and need not be
+        # duplicated. The original DF stays untouched either way.
+        cols_context = mt.get_unique(
+            [col_rn, col_db]
+            + list(cols_rn_info_map.values())
+            + list(cols_radiat_map))
+        df_context = df_rnlib[cols_context].copy()
+        # .nan -> 0, limited to the columns the context consumes; a
+        # frame-wide fillna would also scan the object-typed columns,
+        # where the NaN handling is the costliest.
+        cols_to_fill = (list(cols_rn_info_map.values())
+                        + list(cols_radiat_map))
+        df_context[cols_to_fill] = df_context[cols_to_fill].fillna(0)
+
+        #
+        # Radionuclide library information
+        #
+        nucl_database = df_context[col_db].iat[0]
+        now_is = mt.get_now(ymd_preposition='on ', hms_preposition='at ')
+        tstamp = 'Generated {}'.format(now_is)
+        # Restrict the library code length to 32 characters to ensure
+        # compatibility with some third-party spectral analysis software.
+        rnlib_code_bname = '{}-{}'.format(
+            self.prog_info['name'].lower(), rnlib_bname)
+        rnlib_code_bname = rnlib_code_bname[:28]
+        rnlib_info = {
+            'code_master': '{}-mst'.format(rnlib_code_bname),
+            'code_group': '{}-grp'.format(rnlib_code_bname),
+            'name': '{}-{} ({} v{}; {})'.format(self.prog_info['name'].lower(),
+                                                rnlib_bname,
+                                                self.prog_info['name'],
+                                                self.prog_info['vers'],
+                                                nucl_database),
+            'comment': tstamp,
+        }
+
+        #
+        # Radionuclide information
+        #
+        # Extract radionuclide information and its decay radiation
+        # separately for each radionuclide contained in the radionuclide
+        # library.
+        #
+        # Group the decay radiation rows once and convert each group to
+        # the list of records the 'radiats' key holds; a single pass over
+        # the DF replaces the former row-by-row, column-by-column dict
+        # rebuilding inside the per-radionuclide loop.
+        # e.g. Example dicts held in a 'radiats' list:
+        # {'radiation_number': 1, 'energy': 26.0, ..., 'priority_number': 0}
+        # {'radiation_number': 2, 'energy': 36.7, ..., 'priority_number': 0}
+        df_radiats = df_context[
+            [col_rn] + list(cols_radiat_map)].rename(columns=cols_radiat_map)
+        radiats_by_rn = {
+            the_rn: df_rn_radiats.drop(columns=col_rn).to_dict(
+                orient='records')
+            for the_rn, df_rn_radiats in df_radiats.groupby(col_rn,
+                                                            sort=False)}
+        # Iterate over the list of radionuclides contained in the library DF.
+        # pd.unique on the underlying ndarray skips the Series dispatch
+        # of .unique(), and the array serves both dicts below.
+        rns_uniq = pd.unique(df_context[col_rn].to_numpy())
+        rns = {rn: {'radiats': radiats_by_rn[rn]} for rn in rns_uniq}
+        rns_gr_from_isomer = {rn: False for rn in rns_uniq}
+        # Only the first row per radionuclide is consumed for the
+        # radionuclide information, so one drop_duplicates pass replaces
+        # a full-column equality scan per radionuclide.
+        df_rn_firsts = df_context.drop_duplicates(
+            subset=col_rn).set_index(col_rn, drop=False)
         for rn in rns:
             # Associate the name and half-life data of a radionuclide
             # to context dict.
-            bool_idx_rn = df_context[col_rn] == rn
-            for col in cols_rn_info:
-                # col: A column key in the user input
-                # col_in_df: A Column name in the DF
-                col_in_df = self.cols[col][df_col_type]
+            for col, col_in_df in cols_rn_info_map.items():
                 # e.g. ['Ac-225', 'Ac-225', ..., 'Ac-225'] -> 'Ac-225'
-                rns[rn][col] = df_context.loc[bool_idx_rn,
-                                              col_in_df].to_list()[0]
+                rns[rn][col] = df_rn_firsts.at[rn, col_in_df]
             # Create an identification code of the radionuclide in question
             # and extract its element symbol and mass number.
             rn_code = self.get_rn_alias(rns[rn]['radionuclide'],
                                         how='plain2code')
             elem_symb, mass_num = rns[rn]['radionuclide'].split('-')
-            mass_num_wo_possible_m = re.sub('(?i)m$', '', mass_num)
+            mass_num_wo_possible_m = _RE_PROG_ISOMER.sub('', mass_num)
             rns[rn]['code'] = rn_code
             rns[rn]['element_symbol'] = elem_symb
             rns[rn]['mass_number'] = mass_num_wo_possible_m
@@ -2254,7 +2614,7 @@ class Recurlib():
             # e.g. parents = ['Ac-225'], daughters = ['At-217']
             # -> {'parent': 'Ac-225', 'parent_code': 'AC225'}
             # -> {'daughter': 'At-217', 'daughter_code': 'AT217'}
-            rn_wo_possible_m = re.sub('(?i)m$', '', rn)
+            rn_wo_possible_m = _RE_PROG_ISOMER.sub('', rn)
             for ps_or_ds in ['parents', 'daughters']:
                 # - Skip defining the parent attribute if the radionuclide is
                 #   the ground state achieved by the de-excitation of its
@@ -2291,7 +2651,7 @@ class Recurlib():
             #   radionuclide.
             #   e.g. <rn> --parent-- Tc-99
             #        -> Tc-99m --parent-- Tc-99
-            if re.search('(?i)m$', rn):
+            if _RE_PROG_ISOMER.search(rn):
                 for _lev in self.levs[rn_wo_possible_m]['from_gamma_cascade'][
                         'energy_levels']:
                     # - The conditional below means that over the course of
@@ -2329,20 +2689,6 @@ class Recurlib():
                             rns[d_name]['parent'] = p_name
                             rns[d_name]['parent_code'] = p_code
                             rns_gr_from_isomer[d_name] = True
-            # Radionuclide-wise indices of the library DF converted to dicts
-            rnwise_dicted = df_context.loc[bool_idx_rn].to_dict(orient='index')
-            for rn_dct in rnwise_dicted.values():
-                # An anonymous dict to be appended to the 'radiats' list
-                anonymous_dct = {}
-                for col in cols_radiat[self.radiat['short']]:
-                    # e.g. Example dicts to be added to the 'radiats' list:
-                    # {'radiation_number': 1, 'energy': 26.0, ...,
-                    #  'priority_number': 0}
-                    # {'radiation_number': 2, 'energy': 36.7, ...,
-                    #  'priority_number': 0}
-                    col_in_df = self.cols[col][df_col_type]
-                    anonymous_dct.update({col: rn_dct[col_in_df]})
-                rns[rn]['radiats'].append(anonymous_dct)
 
         #
         # Construct and return a Jinja context dict.
@@ -2390,7 +2736,7 @@ class Recurlib():
                 msg = (f'Warning: [{adataset}] not in [{argv.file}];'
                        + ' skipping.')
                 is_skip = True
-            if re.search('(?i)active_datasets', adataset):
+            if adataset.lower() == 'active_datasets':
                 msg = ('Warning: [active_datasets] is not allowed as an'
                        + ' element name under [active_datasets];'
                        + ' skipiing.')
@@ -2410,7 +2756,7 @@ class Recurlib():
             # (2) Override the key-val pairs designated at the active dataset
             # at the active dataset dict.
             #
-            inherited = copy.deepcopy(the_ini['template'])
+            inherited = _clone_tree(the_ini['template'])
             the_yml[adataset] = mt.merge(inherited, the_yml[adataset])
 
             # Aliasing
@@ -2418,6 +2764,9 @@ class Recurlib():
 
             # Initialize for the next active dataset.
             self.levs = {}
+            self._levs_pairs = set()  # Its relation shadow set likewise.
+            self._expansion_memo = {}  # And the expansion memo.
+            self._levs_flat_sets = {}  # And the flattened level sets.
 
             #
             # Construct full-path file names.
@@ -2431,9 +2780,14 @@ class Recurlib():
             }
             for io_type, fname_types in io_types.items():
                 for fname_type in fname_types:
-                    # Iterate over and expand environment variables, if any.
-                    a['io'][io_type][fname_type] = os.path.expandvars(
-                        a['io'][io_type][fname_type])
+                    # Iterate over and expand environment variables, if
+                    # any. The character probe skips the expandvars walk
+                    # for the common variable-free names; '%' covers the
+                    # %VAR% form expanded on Windows.
+                    fname = a['io'][io_type][fname_type]
+                    if '$' in fname or '%' in fname:
+                        a['io'][io_type][fname_type] = os.path.expandvars(
+                            fname)
 
             # (2) Construct the base names of output files.
             out_bnames_of_int = [
@@ -2481,17 +2835,17 @@ class Recurlib():
             if a['io']['ctrls']['is_rpt']:
                 xl_sheet_name = '{}_library'.format(self.radiat['long'])
                 # XML-only DF
-                self.df_rnlib_xml = self.df_rnlib.rename(
-                    columns=self.cols['rpt_to_xml']).copy()
                 # The strings contained in the values of rpt_to_xml dict
                 # are the ones specified in the user input file.
-                # Below the XML-only DF is reduced to these columns because
+                # The XML-only DF is reduced to these columns because
                 # they are mean to be those required in the .xml-mediated
                 # import/export in third-party spectral analysis software;
                 # not all columns of the original radionuclide library DF
-                # are used in import/export process.
-                cols_xml = self.cols['rpt_to_xml'].values()
-                self.df_rnlib_xml = self.df_rnlib_xml.loc[:, cols_xml]
+                # are used in import/export process. Subsetting before the
+                # rename keeps the discarded columns from being copied.
+                cols_xml_map = self.cols['rpt_to_xml']
+                self.df_rnlib_xml = self.df_rnlib[
+                    list(cols_xml_map)].rename(columns=cols_xml_map)
                 for fmt in a['io']['ctrls']['rpt_fmts']:
                     fmt = fmt.lower()
                     _df = self.df_rnlib if fmt != 'xml' else self.df_rnlib_xml
@@ -2552,6 +2906,10 @@ class Recurlib():
             creator.plot_radiat_spectr(fig, ax, a, self.df_rnlib, self.cols,
                                        x=_nrg_key, y=_ep_key,
                                        plot_type='rn')
+            # Release the dataset's Figure; without this, the Figures of
+            # a many-dataset run pile up in the MPL figure manager until
+            # the interpreter exits.
+            plt.close(fig)
 
 
 if __name__ == '__main__':